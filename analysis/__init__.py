@@ -15,6 +15,17 @@ It provides classes and methods for retrieving and analyzing startup data.
 from investors and startups to provide a holistic analysis. It includes classes and
 methods for conducting comprehensive evaluations and generating reports.
 
+- `cache`: This module provides the process wide caching layer. Every public
+analysis method is memoized per argument in a bounded LRU cache keyed on the
+fingerprint of the dataset, so a data refresh invalidates cached results.
+
+- `engine`: This module provides the execution engines of the overall analysis,
+pandas by default or Polars, selected with the `STARTUP_ENGINE` environment variable.
+
+- `instrumentation`: This module times the analysis and plotting methods of a
+rerun, with the rows they scanned and their cache hits and misses. It is off
+unless the `STARTUP_INSTRUMENTATION` environment variable is set.
+
 These modules can be used individually or in conjunction to perform in-depth analyses
 and gain insights into investment trends, startup success factors, and overall market performance.
 
@@ -37,6 +48,6 @@ For detailed information about the classes, methods,
 and their usage, refer to the individual module docstrings.
 """
 
-from .investor import Investor
-from .startup import Startup
+from .investor import Investor, InvestorProfile
+from .startup import Startup, StartupProfile
 from .overall import Overall
@@ -0,0 +1,47 @@
+"""
+Command line entry point of the analysis package.
+
+Usage:
+    python -m analysis engines [--engine polars]
+    python -m analysis sqlite [SQLITE_PATH]
+
+`engines` runs every public method of `analysis.Overall` with the pandas
+engine and with the given engine, and fails when any result differs, see
+`analysis.engine.compare_engines`. `sqlite` writes the SQLite file of the
+`sqlite` storage backend with the similar startups and investors
+precomputed, see `dataset.store` and `analysis.similarity`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import argparse
+import sys
+
+from analysis.engine import ENGINES, compare_engines
+from analysis.similarity import neighbour_tables
+from dataset.store import SQLITE_PATH, build_database
+
+parser = argparse.ArgumentParser(prog='python -m analysis')
+commands = parser.add_subparsers(dest='command', required=True)
+
+engines_parser = commands.add_parser('engines', help='check an engine against the pandas engine')
+engines_parser.add_argument('--engine', choices=tuple(ENGINES), default='polars')
+
+sqlite_parser = commands.add_parser('sqlite', help='build the SQLite file of the sqlite backend')
+sqlite_parser.add_argument('sqlite_path', nargs='?', default=SQLITE_PATH)
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    if args.command == 'sqlite':
+        path = build_database(args.sqlite_path, neighbours=neighbour_tables)
+        print(f'SQLite file written to {path}')
+    else:
+        results = compare_engines(args.engine)
+        for name, same in results.items():
+            print(f'{"ok" if same else "DIFFERENT"}  {name}')
+
+        differing = [name for name, same in results.items() if not same]
+        print(f'{len(results) - len(differing)}/{len(results)} methods agree with the pandas engine')
+        sys.exit(1 if differing else 0)
@@ -0,0 +1,192 @@
+"""
+Module: Analysis Cache
+
+This module provides the caching layer every public `analysis` method goes
+through. Results are memoized per method and per argument in a bounded LRU
+cache. The fingerprint of the dataset snapshot is part of every key, so a data
+refresh invalidates all cached results without any explicit clearing. So are
+the provider and the execution engine of the instance, so instances reading
+another dataset or running another engine never share results.
+
+The caches are process wide. Streamlit reruns `app.py` on every widget
+interaction but keeps imported modules, so the dataset, its indexes and the
+memoized results survive reruns and are shared by all sessions of a server.
+
+Usage:
+    class Overall:
+        @memoize()
+        def total_funding_mom(self):
+            ...
+
+Note: Cached results are shared between callers and must not be modified.
+
+Dependencies:
+- collections
+- functools
+- threading
+- analysis.instrumentation
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+
+from analysis.instrumentation import note_cache, timed
+
+DEFAULT_MAXSIZE = 128
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread safe mapping that evicts the least recently used entry when full.
+
+    Attributes:
+        maxsize (int): Maximum number of entries.
+        hits (int): Number of lookups that found an entry.
+        misses (int): Number of lookups that did not.
+
+    Methods:
+        __init__: Initializes the LRUCache class.
+        get: Returns the value of a key, or a default.
+        put: Stores the value of a key.
+        clear: Removes every entry and resets the counters.
+        info: Returns the size and the hit/miss counters.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        """
+        Initialize the LRUCache class.
+
+        Args:
+            maxsize (int): Maximum number of entries.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of a key and marks it as recently used.
+
+        Args:
+            key (hashable): The key to look up.
+            default (object): Returned when the key is missing.
+
+        Returns:
+            object: The cached value or `default`.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Stores the value of a key, evicting the least recently used entry if full.
+
+        Args:
+            key (hashable): The key to store.
+            value (object): The value to store.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Returns the size and the hit/miss counters.
+
+        Returns:
+            dict: `hits`, `misses`, `size` and `maxsize` of the cache.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
+
+
+_caches = {}
+
+
+def memoize(maxsize=DEFAULT_MAXSIZE):
+    """
+    Memoizes an analysis method on the dataset fingerprint, the configuration
+    of the instance and the arguments.
+
+    The decorated method must belong to a class with a `provider` attribute
+    (a `dataset.DatasetProvider`), and may have an `engine` attribute (see
+    `analysis.engine`). Arguments must be hashable.
+
+    Args:
+        maxsize (int): Maximum number of results kept for the method.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(method):
+        cache = LRUCache(maxsize)
+        _caches[method.__qualname__] = cache
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (
+                id(self.provider),
+                getattr(getattr(self, 'engine', None), 'name', None),
+                self.provider.get().fingerprint,
+                args,
+                tuple(sorted(kwargs.items()))
+            )
+            result = cache.get(key, _MISSING)
+            note_cache(result is not _MISSING)
+            if result is _MISSING:
+                result = method(self, *args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper = timed()(wrapper)
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def cache_info():
+    """
+    Returns the counters of every memoized method.
+
+    Returns:
+        dict: Qualified method name to the `LRUCache.info` of its cache.
+    """
+    return {name: cache.info() for name, cache in _caches.items()}
+
+
+def clear_caches():
+    """Removes every memoized result."""
+    for cache in _caches.values():
+        cache.clear()
@@ -0,0 +1,415 @@
+"""
+Module: Execution Engines
+
+This module provides the engines running the table queries of
+`analysis.Overall`: grouped sums, top groups, top rows, the leading row of
+every group and whole-column aggregates over the derived tables of the
+snapshot (monthly cube, startup years, investor vocabulary).
+
+Engines:
+- `PandasEngine` (the default) runs the queries with pandas, exactly as the
+  analysis classes always did.
+- `PolarsEngine` runs them as lazy Polars queries over Arrow copies of the
+  tables, kept on the snapshot. Polars optimizes each query as a whole
+  (filters are pushed down below the sorts, sort plus head becomes a top-k)
+  and executes it on every core. Polars is an optional dependency.
+
+Both engines take and return pandas objects, so callers do not depend on
+the engine. Sorts are stable in both, so ties keep the order of the table
+(or of the keys, for groups) and the engines rank them alike. Select the
+engine with the environment variable `STARTUP_ENGINE=polars`, or pass it to
+`Overall`. `compare_engines` checks that an engine gives the results of the
+pandas engine:
+
+    python -m analysis engines
+
+Dependencies:
+- math
+- os
+- pandas (pd)
+- polars (optional)
+- analysis.overall (Overall, for `compare_engines`)
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import math
+import os
+
+import pandas as pd
+
+ENGINE_VARIABLE = 'STARTUP_ENGINE'
+DEFAULT_ENGINE = 'pandas'
+
+# Tolerances of `equivalent`. Polars sums in parallel, in an order that
+# varies between runs, so sums differ in their last bits and a sum rounded
+# to two decimals by `Overall` may land on the other side of a half cent
+TOLERANCE = 1e-5
+ROUNDING = 0.01
+
+
+class PandasEngine:
+    """
+    Runs the table queries with pandas.
+
+    Methods:
+        table: Returns a derived table of the snapshot.
+        total: Aggregates a whole column.
+        group_sum: Sums a measure by keys.
+        top_groups: Returns the groups with the largest non-zero sums.
+        top_rows: Returns the rows with the largest values.
+        first_by_group: Returns the row with the largest value of every group.
+    """
+
+    name = 'pandas'
+
+    def table(self, snapshot, table_name):
+        """
+        Returns a derived table of the snapshot.
+
+        Args:
+            snapshot (dataset.Snapshot): The dataset snapshot.
+            table_name (str): `monthly_cube`, `startup_years` or `investor_vocabulary`.
+
+        Returns:
+            pandas.DataFrame: The table.
+        """
+        return getattr(snapshot, table_name)
+
+    def total(self, table, column, how):
+        """
+        Aggregates a whole column.
+
+        Args:
+            table (pandas.DataFrame): The table.
+            column (str): The column.
+            how (str): `sum`, `max` or `n_unique`.
+
+        Returns:
+            object: The scalar result.
+        """
+        values = table[column]
+        if how == 'n_unique':
+            return values.nunique()
+
+        return getattr(values, how)()
+
+    def group_sum(self, table, keys, measure):
+        """
+        Sums a measure by keys.
+
+        Args:
+            table (pandas.DataFrame): The table.
+            keys (list): Key columns.
+            measure (str): The measure column.
+
+        Returns:
+            pandas.DataFrame: The keys and the summed measure, sorted by keys.
+        """
+        return table.groupby(keys, observed=True)[measure].sum().reset_index()
+
+    def top_groups(self, table, key, measure, n):
+        """
+        Returns the groups with the largest non-zero sums of a measure.
+
+        Args:
+            table (pandas.DataFrame): The table.
+            key (str): Key column.
+            measure (str): The measure column.
+            n (int): Number of groups.
+
+        Returns:
+            pandas.DataFrame: The key and the summed measure, largest first.
+        """
+        sums = self.group_sum(table, key, measure)
+
+        return sums[sums[measure] != 0].sort_values(
+            by=measure,
+            ascending=False,
+            kind='stable'
+        ).head(n)
+
+    def top_rows(self, table, columns, by, n):
+        """
+        Returns the rows with the largest values of a column.
+
+        Args:
+            table (pandas.DataFrame): The table.
+            columns (list): Columns to return.
+            by (str): Column to rank by.
+            n (int): Number of rows.
+
+        Returns:
+            pandas.DataFrame: The rows, largest first.
+        """
+        return table[columns].sort_values(by=by, ascending=False, kind='stable').head(n)
+
+    def first_by_group(self, table, columns, group, by):
+        """
+        Returns the row with the largest value of a column in every group.
+
+        Args:
+            table (pandas.DataFrame): The table.
+            columns (list): Columns to return.
+            group (str): Group column.
+            by (str): Column to rank by.
+
+        Returns:
+            pandas.DataFrame: One row per group, sorted by group.
+        """
+        return table[columns].sort_values(by=by, ascending=False, kind='stable').drop_duplicates(
+            group,
+            keep='first'
+        ).sort_values(by=group)
+
+
+class PolarsEngine:
+    """
+    Runs the table queries as lazy, multithreaded Polars queries.
+
+    The tables are converted to Polars once per snapshot and kept on it, see
+    `dataset.Snapshot.derive`.
+
+    Methods:
+        __init__: Initializes the PolarsEngine class.
+        table: Returns a derived table of the snapshot as a Polars LazyFrame.
+        total: Aggregates a whole column.
+        group_sum: Sums a measure by keys.
+        top_groups: Returns the groups with the largest non-zero sums.
+        top_rows: Returns the rows with the largest values.
+        first_by_group: Returns the row with the largest value of every group.
+    """
+
+    name = 'polars'
+
+    def __init__(self):
+        """
+        Initialize the PolarsEngine class.
+
+        Raises:
+            ImportError: If Polars is not installed.
+        """
+        try:
+            import polars
+        except ImportError as error:
+            raise ImportError('The polars engine requires the polars package') from error
+
+        self.pl = polars
+
+    def table(self, snapshot, table_name):
+        """
+        Returns a derived table of the snapshot as a Polars LazyFrame.
+
+        Args:
+            snapshot (dataset.Snapshot): The dataset snapshot.
+            table_name (str): `monthly_cube`, `startup_years` or `investor_vocabulary`.
+
+        Returns:
+            polars.LazyFrame: The table.
+        """
+        return snapshot.derive(
+            'polars_' + table_name,
+            lambda frame: self.pl.from_pandas(getattr(snapshot, table_name)).lazy()
+        )
+
+    def _collect(self, query):
+        """
+        Executes a query.
+
+        Args:
+            query (polars.LazyFrame): The query.
+
+        Returns:
+            pandas.DataFrame: The result.
+        """
+        return query.collect().to_pandas()
+
+    def total(self, table, column, how):
+        """
+        Aggregates a whole column.
+
+        Args:
+            table (polars.LazyFrame): The table.
+            column (str): The column.
+            how (str): `sum`, `max` or `n_unique`.
+
+        Returns:
+            object: The scalar result.
+        """
+        expression = getattr(self.pl.col(column).drop_nulls(), how)()
+
+        return table.select(expression).collect().item()
+
+    def group_sum(self, table, keys, measure):
+        """
+        Sums a measure by keys.
+
+        Args:
+            table (polars.LazyFrame): The table.
+            keys (list): Key columns.
+            measure (str): The measure column.
+
+        Returns:
+            pandas.DataFrame: The keys and the summed measure, sorted by keys.
+        """
+        keys = [keys] if isinstance(keys, str) else list(keys)
+
+        return self._collect(
+            table.drop_nulls(keys)
+            .group_by(keys)
+            .agg(self.pl.col(measure).sum())
+            .sort(keys)
+        )
+
+    def top_groups(self, table, key, measure, n):
+        """
+        Returns the groups with the largest non-zero sums of a measure.
+
+        Args:
+            table (polars.LazyFrame): The table.
+            key (str): Key column.
+            measure (str): The measure column.
+            n (int): Number of groups.
+
+        Returns:
+            pandas.DataFrame: The key and the summed measure, largest first.
+        """
+        return self._collect(
+            table.drop_nulls(key)
+            .group_by(key)
+            .agg(self.pl.col(measure).sum())
+            .filter(self.pl.col(measure) != 0)
+            .sort(key)
+            .sort(measure, descending=True, maintain_order=True)
+            .head(n)
+        )
+
+    def top_rows(self, table, columns, by, n):
+        """
+        Returns the rows with the largest values of a column.
+
+        Args:
+            table (polars.LazyFrame): The table.
+            columns (list): Columns to return.
+            by (str): Column to rank by.
+            n (int): Number of rows.
+
+        Returns:
+            pandas.DataFrame: The rows, largest first.
+        """
+        return self._collect(
+            table.select(columns)
+            .sort(by, descending=True, nulls_last=True, maintain_order=True)
+            .head(n)
+        )
+
+    def first_by_group(self, table, columns, group, by):
+        """
+        Returns the row with the largest value of a column in every group.
+
+        Args:
+            table (polars.LazyFrame): The table.
+            columns (list): Columns to return.
+            group (str): Group column.
+            by (str): Column to rank by.
+
+        Returns:
+            pandas.DataFrame: One row per group, sorted by group.
+        """
+        return self._collect(
+            table.select(columns)
+            .sort(by, descending=True, nulls_last=True, maintain_order=True)
+            .group_by(group, maintain_order=True)
+            .first()
+            .sort(group)
+        )
+
+
+ENGINES = {'pandas': PandasEngine, 'polars': PolarsEngine}
+
+
+def get_engine(name=None):
+    """
+    Creates an execution engine.
+
+    Args:
+        name (str, optional): `pandas` or `polars`. Defaults to the
+            `STARTUP_ENGINE` environment variable, then to pandas.
+
+    Returns:
+        PandasEngine | PolarsEngine: The engine.
+
+    Raises:
+        ValueError: On an unknown engine.
+    """
+    name = (name or os.environ.get(ENGINE_VARIABLE) or DEFAULT_ENGINE).lower()
+    try:
+        return ENGINES[name]()
+    except KeyError:
+        raise ValueError(f'Unknown engine: {name}, expected one of {tuple(ENGINES)}') from None
+
+
+def equivalent(left, right):
+    """
+    Compares two results of an analysis method, ignoring index labels and
+    dtypes and tolerating the rounding differences of float sums, see `ROUNDING`.
+
+    Args:
+        left (object): A DataFrame or scalar.
+        right (object): A DataFrame or scalar.
+
+    Returns:
+        bool: True when the results hold the same values.
+    """
+    if isinstance(left, pd.DataFrame) and isinstance(right, pd.DataFrame):
+        if left.shape != right.shape or list(map(str, left.columns)) != list(map(str, right.columns)):
+            return False
+        try:
+            pd.testing.assert_frame_equal(
+                left.reset_index(drop=True).astype(object).astype(float, errors='ignore'),
+                right.reset_index(drop=True).astype(object).astype(float, errors='ignore'),
+                check_dtype=False,
+                check_column_type=False,
+                check_index_type=False,
+                check_names=False,
+                rtol=TOLERANCE,
+                atol=ROUNDING
+            )
+        except (AssertionError, TypeError):
+            return False
+        return True
+
+    if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+        return math.isclose(left, right, rel_tol=TOLERANCE, abs_tol=ROUNDING)
+
+    return left == right
+
+
+def compare_engines(engine_name='polars', provider=None):
+    """
+    Runs every public method of `analysis.Overall` with the pandas engine and
+    with another engine, and compares the results.
+
+    Args:
+        engine_name (str): The engine checked against the pandas engine.
+        provider (dataset.DatasetProvider, optional): Provider of the dataset.
+
+    Returns:
+        dict: Method name to True when both engines agree.
+    """
+    from analysis.overall import Overall
+
+    names = [
+        name for name, member in vars(Overall).items()
+        if not name.startswith('_') and hasattr(member, 'cache')
+    ]
+    results = {}
+    for engine in (get_engine(DEFAULT_ENGINE), get_engine(engine_name)):
+        overall = Overall(provider, engine=engine)
+        results[engine.name] = {name: getattr(overall, name)() for name in names}
+
+    return {
+        name: equivalent(results[DEFAULT_ENGINE][name], results[engine_name][name])
+        for name in names
+    }
@@ -0,0 +1,332 @@
+"""
+Module: Instrumentation
+
+This module measures where the time of an app rerun goes. Every memoized
+analysis method (see `analysis.cache`) and every plotting method of the
+`components` package opens a span recording its wall time, the rows it
+returned and whether it was served from a cache. Spans are collected per run,
+one run per rerun of `app.py`, and nest: a plot span contains the spans of
+the analysis methods it called.
+
+Instrumentation is off by default and costs one flag check per call while
+off. Enable it with the environment variable `STARTUP_INSTRUMENTATION=1` or
+with `enable()`. A finished run is logged as one JSON line at INFO level on
+the `analysis.instrumentation` logger, and appended to the JSON Lines file
+named by `STARTUP_INSTRUMENTATION_LOG` when it is set, so the runs of every
+worker can be aggregated with `read_runs` and `summarize`.
+
+Usage:
+    run = start_run('Overall Analysis')
+    ...  # instrumented calls
+    finish_run(run)
+    summarize(run.spans)
+
+Dependencies:
+- contextvars
+- functools
+- json
+- logging
+- os
+- time
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import os
+import time
+
+ENABLE_VARIABLE = 'STARTUP_INSTRUMENTATION'
+LOG_VARIABLE = 'STARTUP_INSTRUMENTATION_LOG'
+
+logger = logging.getLogger(__name__)
+
+_enabled = os.environ.get(ENABLE_VARIABLE, '').lower() in ('1', 'true', 'yes', 'on')
+
+# The run of the current thread, Streamlit reruns each session in its own thread
+_current_run = contextvars.ContextVar('instrumentation_run', default=None)
+
+
+class Span:
+    """
+    One instrumented call.
+
+    Attributes:
+        name (str): Module and qualified name of the method.
+        depth (int): Nesting depth, zero for calls made by the page itself.
+        seconds (float): Wall time of the call.
+        rows (int): Rows of the result of the call, zero when it is not a table.
+        cache (str): `hit`, `miss` or None when no cache was involved.
+    """
+
+    __slots__ = ('name', 'depth', 'seconds', 'rows', 'cache')
+
+    def __init__(self, name, depth):
+        """
+        Initialize the Span class.
+
+        Args:
+            name (str): Module and qualified name of the method.
+            depth (int): Nesting depth.
+        """
+        self.name = name
+        self.depth = depth
+        self.seconds = 0.0
+        self.rows = 0
+        self.cache = None
+
+    def to_dict(self):
+        """
+        Returns the span as a JSON compatible dict.
+
+        Returns:
+            dict: Every attribute of the span.
+        """
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class Run:
+    """
+    The spans recorded during one rerun.
+
+    Attributes:
+        label (str): What the run rendered, for example the page name.
+        spans (list): Finished spans, in the order they finished.
+        seconds (float): Wall time of the run, set by `finish_run`.
+
+    Methods:
+        __init__: Initializes the Run class.
+        to_dict: Returns the run as a JSON compatible dict.
+    """
+
+    def __init__(self, label):
+        """
+        Initialize the Run class.
+
+        Args:
+            label (str): What the run renders.
+        """
+        self.label = label
+        self.spans = []
+        self.seconds = 0.0
+        self._open = []
+        self._start = time.perf_counter()
+
+    def to_dict(self):
+        """
+        Returns the run as a JSON compatible dict.
+
+        Returns:
+            dict: `label`, `pid`, `time`, `seconds` and the list of `spans`.
+        """
+        return {
+            'label': self.label,
+            'pid': os.getpid(),
+            'time': time.time(),
+            'seconds': self.seconds,
+            'spans': [span.to_dict() for span in self.spans]
+        }
+
+
+def enabled():
+    """
+    Returns whether instrumentation is on.
+
+    Returns:
+        bool: True when calls are recorded.
+    """
+    return _enabled
+
+
+def enable(flag=True):
+    """
+    Turns instrumentation on or off for the whole process.
+
+    Args:
+        flag (bool): True to record calls.
+    """
+    global _enabled
+    _enabled = bool(flag)
+
+
+def start_run(label):
+    """
+    Starts collecting the spans of the current thread.
+
+    Args:
+        label (str): What the run renders, for example the page name.
+
+    Returns:
+        Run: The new run, or None when instrumentation is off.
+    """
+    if not _enabled:
+        return None
+
+    run = Run(label)
+    _current_run.set(run)
+    return run
+
+
+def finish_run(run):
+    """
+    Stops collecting spans and exports the run.
+
+    The run is logged as a JSON line and appended to the file named by
+    `STARTUP_INSTRUMENTATION_LOG`, when set.
+
+    Args:
+        run (Run): The run returned by `start_run`, may be None.
+
+    Returns:
+        Run: The finished run, or None.
+    """
+    if run is None:
+        return None
+
+    run.seconds = time.perf_counter() - run._start
+    _current_run.set(None)
+
+    line = json.dumps(run.to_dict())
+    logger.info(line)
+
+    log_path = os.environ.get(LOG_VARIABLE)
+    if log_path:
+        with open(log_path, 'a', encoding='utf-8') as file:
+            file.write(line + '\n')
+
+    return run
+
+
+def timed(name=None):
+    """
+    Records every call of the decorated function as a span of the current run.
+
+    Args:
+        name (str, optional): Name of the span. Defaults to the module and
+            qualified name of the function, for example
+            `analysis.investor.Investor.profile`.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(function):
+        span_name = name or f'{function.__module__}.{function.__qualname__}'
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+
+            run = _current_run.get()
+            if run is None:
+                return function(*args, **kwargs)
+
+            span = Span(span_name, len(run._open))
+            run._open.append(span)
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+                span.rows = _rows(result)
+                return result
+            finally:
+                span.seconds = time.perf_counter() - start
+                run._open.pop()
+                run.spans.append(span)
+
+        return wrapper
+
+    return decorator
+
+
+def _innermost():
+    """
+    Returns the innermost open span of the current run.
+
+    Returns:
+        Span: The span, or None outside of any span.
+    """
+    run = _current_run.get()
+    if run is None or not run._open:
+        return None
+
+    return run._open[-1]
+
+
+def _rows(result):
+    """
+    Returns the number of rows of a result.
+
+    Args:
+        result (object): The result of an instrumented call.
+
+    Returns:
+        int: Rows of a DataFrame, Series, array or list, zero otherwise.
+    """
+    if isinstance(result, list):
+        return len(result)
+
+    shape = getattr(result, 'shape', None)
+    if isinstance(shape, tuple) and shape:
+        return int(shape[0])
+
+    return 0
+
+
+def note_cache(hit):
+    """
+    Records whether the innermost open span was served from a cache.
+
+    Args:
+        hit (bool): True for a cache hit.
+    """
+    if _enabled:
+        span = _innermost()
+        if span is not None:
+            span.cache = 'hit' if hit else 'miss'
+
+
+def summarize(spans):
+    """
+    Aggregates spans by name, slowest first.
+
+    Args:
+        spans (list): `Span` objects or their dicts, from one or many runs.
+
+    Returns:
+        list: One dict per name with `name`, `calls`, `seconds` (total),
+            `max_seconds`, `rows`, `hits` and `misses`.
+    """
+    totals = {}
+    for span in spans:
+        if isinstance(span, Span):
+            span = span.to_dict()
+        total = totals.setdefault(span['name'], {
+            'name': span['name'], 'calls': 0, 'seconds': 0.0,
+            'max_seconds': 0.0, 'rows': 0, 'hits': 0, 'misses': 0
+        })
+        total['calls'] += 1
+        total['seconds'] += span['seconds']
+        total['max_seconds'] = max(total['max_seconds'], span['seconds'])
+        total['rows'] += span['rows']
+        total['hits'] += span['cache'] == 'hit'
+        total['misses'] += span['cache'] == 'miss'
+
+    return sorted(totals.values(), key=lambda total: total['seconds'], reverse=True)
+
+
+def read_runs(path):
+    """
+    Reads the runs exported to a JSON Lines file, for example by several workers.
+
+    Args:
+        path (str): Path of the file named by `STARTUP_INSTRUMENTATION_LOG`.
+
+    Returns:
+        list: The runs as dicts, see `Run.to_dict`.
+    """
+    with open(path, encoding='utf-8') as file:
+        return [json.loads(line) for line in file if line.strip()]
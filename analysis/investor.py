@@ -2,36 +2,171 @@
 Module: Investor Analysis
 
 This module provides functionality to analyze investor data in the startup dataset.
+The deals of an investor are looked up through the inverted investor index of the
+dataset snapshot, so investor names match exactly and a lookup does not scan the
+whole dataset. Similar investors come from the cosine similarity index of
+`analysis.similarity`, built once per snapshot.
 
 
 Dependencies:
-- itertools
-- random
+- numpy (np)
 - pandas (pd)
-- dataset (startup)
+- analysis.search
+- analysis.similarity
+- dataset (provider, investor rows)
 
-Note: The `startup` dataset is imported from the `dataset` module.
+Note: The `startup` dataset is loaded lazily through the `dataset` provider.
 
 Author: Bibek kumar panda
 Github:https://github.com/Bibek-9078
 """
 
-import itertools
-import random
+from typing import NamedTuple
+
+import numpy as np
 import pandas as pd
 
-from dataset import startup
+from analysis.cache import memoize
+from analysis.search import DEFAULT_LIMIT, SearchIndex
+from analysis.similarity import build_investor_similarity
+from dataset import provider as dataset_provider
+
+ORDER_BY_NAME = 'name'
+ORDER_BY_ACTIVITY = 'activity'
+
+
+class InvestorProfile(NamedTuple):
+    """
+    Every breakdown shown for an investor.
+
+    Attributes:
+        name (str): Name of the investor.
+        recent_investments (pandas.DataFrame): The five most recent investments.
+        biggest_investments (pandas.DataFrame): The five biggest investments by startup.
+        sectors (pandas.DataFrame): Amount invested per sector.
+        subsectors (pandas.DataFrame): Amount invested per sub-sector.
+        cities (pandas.DataFrame): Amount invested per city.
+        types (pandas.DataFrame): Amount invested per investment type.
+        yoy (pandas.DataFrame): Amount invested per year.
+        similar_investors (list): Investors with the most similar deals.
+    """
+
+    name: str
+    recent_investments: pd.DataFrame
+    biggest_investments: pd.DataFrame
+    sectors: pd.DataFrame
+    subsectors: pd.DataFrame
+    cities: pd.DataFrame
+    types: pd.DataFrame
+    yoy: pd.DataFrame
+    similar_investors: list
+
+
+def _recent_investments(investments):
+    """
+    Returns the five most recent of the given investments for display.
+
+    Args:
+        investments (pandas.DataFrame): Deals of an investor.
+
+    Returns:
+        pandas.DataFrame: DataFrame containing the recent investments.
+    """
+    return investments.head()[
+        ['date', 'name', 'vertical', 'city', 'investors', 'type', 'amount']
+    ].rename(columns={
+        'date': 'Date of Investment',
+        'name': 'Startup Name',
+        'vertical': 'Vertical',
+        'city': 'City',
+        'investors': 'Investors',
+        'type': 'Type',
+        'amount': 'Amount (In crore ₹)'
+    })
+
+
+def _amount_by(investments, columns):
+    """
+    Returns the total of the given investments per value of each of several columns.
+
+    Every column is factorized and the codes of all the columns are stacked,
+    so the totals of every breakdown come out of one grouped sum over integer
+    keys instead of one groupby per column.
+
+    Args:
+        investments (pandas.DataFrame): Deals of an investor.
+        columns (list): Columns to break the amount down by.
+
+    Returns:
+        dict: Column to a Series of the total amount per value, sorted by
+            value. Missing values are left out.
+    """
+    amounts = investments['amount'].to_numpy(dtype=np.float64)
+    codes, weights, uniques = [], [], []
+    offset = 0
+    for column in columns:
+        column_codes, column_uniques = pd.factorize(investments[column], sort=True)
+        present = column_codes >= 0
+        codes.append(column_codes[present] + offset)
+        weights.append(amounts[present])
+        uniques.append(column_uniques)
+        offset += len(column_uniques)
+
+    totals = pd.Series(np.concatenate(weights)).groupby(np.concatenate(codes)).sum()
+    totals = totals.reindex(range(offset), fill_value=0.0).to_numpy()
+
+    breakdowns = {}
+    start = 0
+    for column, column_uniques in zip(columns, uniques):
+        breakdowns[column] = pd.Series(
+            totals[start:start + len(column_uniques)],
+            index=pd.Index(column_uniques, name=column),
+            name='amount'
+        )
+        start += len(column_uniques)
+
+    return breakdowns
+
+
+def _biggest_investments(amount_by_name):
+    """
+    Returns the five startups that received the most of an investor's money.
+
+    Args:
+        amount_by_name (pandas.Series): Total amount per startup name, see `_amount_by`.
+
+    Returns:
+        pandas.DataFrame: DataFrame with `name` and `amount` columns.
+    """
+    return amount_by_name.sort_values(ascending=False).head().reset_index()
+
+
+def _invested_by(investments, column):
+    """
+    Returns the total of the given investments per value of a column.
+
+    Args:
+        investments (pandas.DataFrame): Deals of an investor.
+        column (str): Column to break the amount down by.
+
+    Returns:
+        pandas.DataFrame: DataFrame with `column` and `amount` columns.
+    """
+    return _amount_by(investments, [column])[column].reset_index()
+
 
 class Investor:
     """
     Investor class for analyzing investor data in the startup dataset.
 
     Attributes:
-        startup (pandas.DataFrame): The startup dataset.
+        provider (dataset.DatasetProvider): Provider of the shared dataset snapshot.
+        startup (pandas.DataFrame): The startup dataset, loaded on first access.
 
     Methods:
         __init__: Initializes the Investor class.
-        investor_list: Returns the list of investors.
+        investor_list: Returns the list of investors, by name or by activity.
+        search_investors: Returns the investors matching a search query.
         recent_five_investments: Returns the five most recent investments of an investor.
         biggest_investment: Returns the highest investment made by an investor.
         invested_sector: Returns the sectors invested in by an investor.
@@ -39,24 +174,91 @@ class Investor:
         invested_city: Returns the cities invested in by an investor.
         invested_type: Returns the types of investments made by an investor.
         yoy_investment: Returns the year-on-year investments made by an investor.
-        get_similar_investors: Returns a list of similar investors based on the investor's vertical.
+        get_similar_investors: Returns the investors whose deals are most similar.
+        profile: Returns every breakdown shown for an investor in one call.
     """
 
-    def __init__(self):
+    def __init__(self, provider=None):
         """
         Initialize the Investor class.
+
+        Args:
+            provider (dataset.DatasetProvider, optional): Dataset provider to use.
+                Defaults to the shared provider.
         """
-        self.startup = startup
+        self.provider = provider or dataset_provider
 
-    def investor_list(self):
+    @property
+    def startup(self):
+        """pandas.DataFrame: The startup dataset."""
+        return self.provider.get().frame
+
+    def _investments(self, investor_name):
         """
-        Returns the list of investors.
+        Returns the deals of an investor through the investor index of the snapshot.
+
+        Args:
+            investor_name (str): Name of the investor.
 
         Returns:
-            list: Sorted list of investors.
+            pandas.DataFrame: Rows of the startup dataset the investor took part in.
+        """
+        return self.provider.get().investor_rows(investor_name.strip())
+
+    @memoize()
+    def investor_list(self, order=ORDER_BY_NAME):
         """
-        return sorted(set(self.startup['investors'].str.split(',').sum()))[2:]
+        Returns the list of investors from the investor vocabulary of the snapshot.
 
+        Args:
+            order (str): `ORDER_BY_NAME` for alphabetical order or
+                `ORDER_BY_ACTIVITY` for the most deals first, ties broken by
+                total amount and then by name.
+
+        Returns:
+            list: List of investors.
+
+        Raises:
+            ValueError: If `order` is not a known order.
+        """
+        vocabulary = self.provider.get().investor_vocabulary
+
+        if order == ORDER_BY_ACTIVITY:
+            vocabulary = vocabulary.sort_values(
+                ['deals', 'amount', 'investor'],
+                ascending=[False, False, True],
+                kind='stable'
+            )
+        elif order != ORDER_BY_NAME:
+            raise ValueError(f'Unknown investor order: {order}')
+
+        return vocabulary['investor'].tolist()
+
+    @memoize(maxsize=1024)
+    def search_investors(self, query, limit=DEFAULT_LIMIT):
+        """
+        Returns the investors matching a search query, see `analysis.search`.
+
+        Args:
+            query (str): The text typed by the user. Empty for the most
+                active investors.
+            limit (int): Maximum number of investors.
+
+        Returns:
+            list: Investors starting with the query first, then close spellings.
+        """
+        snapshot = self.provider.get()
+        search_index = snapshot.derive(
+            'investor_search',
+            lambda frame: SearchIndex(
+                snapshot.investor_vocabulary['investor'],
+                snapshot.investor_vocabulary['deals']
+            )
+        )
+
+        return search_index.search(query, limit)
+
+    @memoize()
     def recent_five_investments(self, investor_name):
         """
         Returns the five most recent investments of an investor.
@@ -67,22 +269,9 @@ class Investor:
         Returns:
             pandas.DataFrame: DataFrame containing the recent investments.
         """
-        recent_investment = self.startup[
-        self.startup['investors'].str.contains(investor_name)
-        ].head()[
-            ['date', 'name', 'vertical', 'city', 'investors', 'type', 'amount']
-        ].rename(columns={
-            'date': 'Date of Investment',
-            'name': 'Startup Name',
-            'vertical': 'Vertical',
-            'city': 'City',
-            'investors': 'Investors',
-            'type': 'Type',
-            'amount': 'Amount (In crore ₹)'
-        })
-
-        return recent_investment
+        return _recent_investments(self._investments(investor_name))
 
+    @memoize()
     def biggest_investment(self, investor_name):
         """
         Returns the highest investment made by an investor.
@@ -93,14 +282,9 @@ class Investor:
         Returns:
             pandas.DataFrame: DataFrame containing the highest investment.
         """
-        investments = self.startup[self.startup['investors'].str.contains(investor_name)]
-        investments_grouped = investments.groupby('name')['amount'].sum()
-        sorted_investments = investments_grouped.sort_values(ascending=False)
-        top_investments = sorted_investments.head().reset_index()
-
-        return top_investments
-
+        return _biggest_investments(_amount_by(self._investments(investor_name), ['name'])['name'])
 
+    @memoize()
     def invested_sector(self, investor_name):
         """
         Returns the sectors invested in by an investor.
@@ -111,13 +295,9 @@ class Investor:
         Returns:
             pandas.DataFrame: DataFrame containing the invested sectors.
         """
-        investments = startup[startup['investors'].str.contains(investor_name)]
-        investments_grouped = investments.groupby('vertical')['amount'].sum()
-        investments_sum_by_vertical = investments_grouped.reset_index()
-
-        return investments_sum_by_vertical
-
+        return _invested_by(self._investments(investor_name), 'vertical')
 
+    @memoize()
     def invested_subsector(self, investor_name):
         """
         Returns the sub-sectors invested in by an investor.
@@ -128,13 +308,9 @@ class Investor:
         Returns:
             pandas.DataFrame: DataFrame containing the invested sub-sectors.
         """
-        investments = startup[startup['investors'].str.contains(investor_name)]
-        investments_grouped = investments.groupby('subvertical')['amount'].sum()
-        investments_sum_by_subvertical = investments_grouped.reset_index()
-
-        return investments_sum_by_subvertical
-
+        return _invested_by(self._investments(investor_name), 'subvertical')
 
+    @memoize()
     def invested_city(self, investor_name):
         """
         Returns the cities invested in by an investor.
@@ -145,13 +321,9 @@ class Investor:
         Returns:
             pandas.DataFrame: DataFrame containing the invested cities.
         """
-        investments = startup[startup['investors'].str.contains(investor_name)]
-        investments_grouped = investments.groupby('city')['amount'].sum()
-        investments_sum_by_city = investments_grouped.reset_index()
-
-        return investments_sum_by_city
-
+        return _invested_by(self._investments(investor_name), 'city')
 
+    @memoize()
     def invested_type(self, investor_name):
         """
         Returns the types of investments made by an investor.
@@ -162,13 +334,9 @@ class Investor:
         Returns:
             pandas.DataFrame: DataFrame containing the invested types.
         """
-        investments = startup[startup['investors'].str.contains(investor_name)]
-        investments_grouped = investments.groupby('type')['amount'].sum()
-        investments_sum_by_type = investments_grouped.reset_index()
-
-        return investments_sum_by_type
-
+        return _invested_by(self._investments(investor_name), 'type')
 
+    @memoize()
     def yoy_investment(self, investor_name):
         """
         Returns the year-on-year investments made by an investor.
@@ -179,40 +347,69 @@ class Investor:
         Returns:
             pandas.DataFrame: DataFrame containing the year-on-year investments.
         """
-        investments = startup[startup['investors'].str.contains(investor_name)]
-        investments_grouped = investments.groupby('year')['amount'].sum()
-        investments_sum_by_year = investments_grouped.reset_index()
+        return _invested_by(self._investments(investor_name), 'year')
 
-        return investments_sum_by_year
+    @memoize()
+    def get_similar_investors(self, investor_name):
+        """
+        Returns the investors whose deals are most similar to those of an investor.
 
+        Investors are compared on the sectors, sub-sectors, cities and stages
+        they invested in, see `analysis.similarity`. The result is deterministic
+        and never contains the investor itself.
 
-    def get_similar_investors(self, investor_name):
+        Args:
+            investor_name (str): Name of the investor.
+
+        Returns:
+            list: Up to four similar investors, most similar first.
         """
-        Returns a list of similar investors based on the investor's vertical.
+        return self._similar_investors(investor_name)
+
+    def _similar_investors(self, investor_name):
+        """
+        Returns the most similar investors from the similarity index of the snapshot.
 
         Args:
             investor_name (str): Name of the investor.
 
         Returns:
-            list: List of similar investors.
+            list: Up to four similar investors, most similar first.
         """
-        investor_df = startup[startup['investors'].str.contains(investor_name)]
+        snapshot = self.provider.get()
 
-        if investor_df.empty:
-            return pd.Series()
+        return snapshot.similar(
+            'investor',
+            investor_name.strip(),
+            lambda frame: build_investor_similarity(snapshot.investor_deals)
+        )
 
-        investor_vertical = investor_df['vertical'].iloc[0]
+    @memoize()
+    def profile(self, investor_name):
+        """
+        Returns every breakdown shown for an investor, computed from one selection.
 
-        vertical_df = self.startup[
-            (self.startup['vertical'] == investor_vertical) &
-            (~self.startup['investors'].str.contains('Undisclosed Investors', case=False))
-        ]
+        The deals of the investor are selected once, and the totals per
+        startup, sector, sub-sector, city, type and year are computed
+        together, see `_amount_by`.
 
-        vertical_df = vertical_df[vertical_df['investors'] != investor_name]
+        Args:
+            investor_name (str): Name of the investor.
 
-        nested_list = sorted(vertical_df['investors'].str.split(','))
-        flattened_list = list(itertools.chain.from_iterable(nested_list))
-        try:
-            return random.sample(flattened_list, 4)
-        except ValueError:
-            return flattened_list
+        Returns:
+            InvestorProfile: The profile of the investor.
+        """
+        investments = self._investments(investor_name)
+        amount_by = _amount_by(investments, ['name', 'vertical', 'subvertical', 'city', 'type', 'year'])
+
+        return InvestorProfile(
+            name=investor_name,
+            recent_investments=_recent_investments(investments),
+            biggest_investments=_biggest_investments(amount_by['name']),
+            sectors=amount_by['vertical'].reset_index(),
+            subsectors=amount_by['subvertical'].reset_index(),
+            cities=amount_by['city'].reset_index(),
+            types=amount_by['type'].reset_index(),
+            yoy=amount_by['year'].reset_index(),
+            similar_investors=self._similar_investors(investor_name)
+        )
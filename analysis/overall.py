@@ -5,28 +5,63 @@ This module provides classes and methods to analyze startup investment data.
 It contains the `Overall` class which offers various methods to calculate and
 analyze different aspects of the startup investments.
 
+The metrics are rolled up from aggregates materialized once per dataset
+snapshot (the monthly cube and the startup years table, see `dataset.tables`)
+instead of scanning every funding row on each render. The grouping, sorting
+and filtering is run by the execution engine, pandas or Polars, see
+`analysis.engine`.
+
 Dependencies:
-- pandas (pd)
-- dataset (startup)
+- analysis.engine
+- dataset (provider)
 
-Note: The `startup` dataset is imported from the `dataset` module.
+Note: The `startup` dataset is loaded lazily through the `dataset` provider.
 
 Author: Bibek kumar panda
 Github: https://github.com/Bibek-9078
 """
 
-import pandas as pd
-
-from dataset import startup
+from analysis.cache import memoize
+from analysis.engine import get_engine
+from dataset import provider as dataset_provider
 
 class Overall:
     """
     This class provides various methods to analyze the startup investment data.
     """
 
-    def __init__(self):
-        self.startup = startup
+    def __init__(self, provider=None, engine=None):
+        self.provider = provider or dataset_provider
+        self.engine = engine or get_engine()
+
+    @property
+    def startup(self):
+        """pandas.DataFrame: The startup dataset."""
+        return self.provider.get().frame
+
+    def _table(self, table_name):
+        """
+        Returns a derived table of the snapshot in the representation of the engine.
+
+        Args:
+            table_name (str): `monthly_cube`, `startup_years` or `investor_vocabulary`.
+
+        Returns:
+            object: The table, see `analysis.engine`.
+        """
+        return self.engine.table(self.provider.get(), table_name)
+
+    @property
+    def cube(self):
+        """object: Funding by year, month, vertical, city and type."""
+        return self._table('monthly_cube')
 
+    @property
+    def startup_years(self):
+        """object: Funding by year and startup."""
+        return self._table('startup_years')
+
+    @memoize()
     def total_invested_amount(self):
         """
         Calculates the total invested amount across all startups.
@@ -34,8 +69,9 @@ class Overall:
         Returns:
             float: Total invested amount.
         """
-        return round(self.startup['amount'].sum())
+        return round(self.engine.total(self.cube, 'amount', 'sum'))
 
+    @memoize()
     def max_amount_infused(self):
         """
         Finds the maximum amount infused by a single investor in a startup.
@@ -43,13 +79,10 @@ class Overall:
         Returns:
             float: Maximum amount infused.
         """
-        result = self.startup.groupby('name')['amount'].max()
-        sorted_result = result.sort_values(ascending=False)
-        max_value = sorted_result.head(1).values[0]
-
-        return max_value
+        return self.engine.total(self.startup_years, 'max_amount', 'max')
 
 
+    @memoize()
     def avg_ticket_size(self):
         """
         Calculates the average ticket size (investment amount) per startup.
@@ -57,8 +90,9 @@ class Overall:
         Returns:
             float: Average ticket size.
         """
-        return self.startup.groupby('name')['amount'].sum().mean()
+        return self.engine.group_sum(self.startup_years, ['name'], 'amount')['amount'].mean()
 
+    @memoize()
     def total_funded_startup(self):
         """
         Counts the total number of funded startups.
@@ -66,8 +100,9 @@ class Overall:
         Returns:
             int: Total number of funded startups.
         """
-        return self.startup['name'].nunique()
+        return self.engine.total(self.startup_years, 'name', 'n_unique')
 
+    @memoize()
     def total_funding_mom(self):
         """
         Calculates the total funding amount on a month-by-month basis.
@@ -75,7 +110,7 @@ class Overall:
         Returns:
             pandas.DataFrame: DataFrame containing the total funding amount for each month.
         """
-        temp_df = startup.groupby(['year', 'month'])['amount'].sum().reset_index()
+        temp_df = self.engine.group_sum(self.cube, ['year', 'month'], 'amount')
         temp_df['MM-YYYY'] = temp_df['month'].astype('str') + '-' + temp_df['year'].astype('str')
         temp_df.rename(columns={
             'amount': 'Total Funding (In Crore Rs.)'
@@ -83,6 +118,7 @@ class Overall:
 
         return temp_df
 
+    @memoize()
     def total_funded_startup_mom(self):
         """
         Calculates the total number of funded startups on a month-by-month basis.
@@ -91,15 +127,16 @@ class Overall:
             pandas.DataFrame: DataFrame containing the total number of funded startups for each
             month.
         """
-        temp_df = startup.groupby(['year', 'month'])['amount'].count().reset_index()
+        temp_df = self.engine.group_sum(self.cube, ['year', 'month'], 'count')
         temp_df['MM-YYYY'] = temp_df['month'].astype('str') + '-' + temp_df['year'].astype('str')
 
         temp_df.rename(columns={
-            'amount': 'Total Funded Startups'
+            'count': 'Total Funded Startups'
         }, inplace=True)
 
         return temp_df
 
+    @memoize()
     def most_funded_sector(self):
         """
         Finds the sectors with the highest total funding amounts.
@@ -108,16 +145,13 @@ class Overall:
             pandas.DataFrame: DataFrame containing the most funded sectors and
             their corresponding amounts.
         """
-        temp_df = startup.groupby('vertical')['amount'].sum().reset_index()
-        most_funded_sectors = temp_df[temp_df['amount'] != 0.0].sort_values(
-            by='amount',
-            ascending=False
-        ).head(10)
+        most_funded_sectors = self.engine.top_groups(self.cube, 'vertical', 'amount', 10)
 
         most_funded_sectors['amount'] = round(most_funded_sectors['amount'], 2)
 
         return most_funded_sectors
 
+    @memoize()
     def most_funded_type(self):
         """
         Finds the startup types with the highest total funding amounts.
@@ -126,14 +160,11 @@ class Overall:
             pandas.DataFrame: DataFrame containing the most funded startup types and
             their corresponding amounts.
         """
-        temp_df = startup.groupby('type')['amount'].sum().reset_index()
-        most_funded_type = temp_df[temp_df['amount'] != 0.0].sort_values(
-            by='amount',
-            ascending=False
-        ).head(10)
+        most_funded_type = self.engine.top_groups(self.cube, 'type', 'amount', 10)
 
         return most_funded_type
 
+    @memoize()
     def most_funded_cities(self):
         """
         Finds the cities with the highest total funding amounts.
@@ -142,21 +173,12 @@ class Overall:
             pandas.DataFrame: DataFrame containing the most funded cities and
             their corresponding amounts.
         """
-        temp_df = startup.groupby('city')['amount'].sum().reset_index()
-        most_funded_city = temp_df[temp_df['amount'] != 0]
-
-        # Add the amount of Bengaluru to Bangalore
-        most_funded_city.loc[most_funded_city['city'] == 'Bangalore', 'amount'] += \
-            most_funded_city.loc[most_funded_city['city'] == 'Bengaluru', 'amount'].values[0]
-
-        # Drop the Bengaluru row
-        most_funded_city = most_funded_city[most_funded_city['city'] != 'Bengaluru']
-
-        most_funded_city = most_funded_city.sort_values(by='amount', ascending=False).head(10)
+        most_funded_city = self.engine.top_groups(self.cube, 'city', 'amount', 10)
         most_funded_city['amount'] = round(most_funded_city['amount'], 2)
 
         return most_funded_city
 
+    @memoize()
     def most_funded_startups_yoy(self):
         """
         Finds the startups with the highest funding amounts on a year-over-year basis.
@@ -165,11 +187,12 @@ class Overall:
             pandas.DataFrame: DataFrame containing the most funded startups for
             each year and their corresponding amounts.
         """
-        most_funded_startup_yoy = startup.groupby(['year', 'name'])['amount'].sum() \
-            .sort_values(ascending=False).reset_index().drop_duplicates(
-            'year',
-            keep='first'
-        ).sort_values(by='year')
+        most_funded_startup_yoy = self.engine.first_by_group(
+            self.startup_years,
+            ['year', 'name', 'amount'],
+            group='year',
+            by='amount'
+        )
 
         most_funded_startup_yoy.rename(columns={
             'year': 'Year',
@@ -179,6 +202,7 @@ class Overall:
 
         return most_funded_startup_yoy
 
+    @memoize()
     def top_investors(self):
         """
         Finds the top investors based on their total investment amounts.
@@ -187,46 +211,16 @@ class Overall:
             pandas.DataFrame: DataFrame containing the top investors and
             their corresponding amounts.
         """
-        # New dataframe with separate rows for each investor
-        investor_list = []
-        for _, row in startup.iterrows():
-            investors = row['investors'].split(', ')
-            for investor in investors:
-                investor_list.append({
-                    'date': row['date'],
-                    'name': row['name'],
-                    'vertical': row['vertical'],
-                    'subvertical': row['subvertical'],
-                    'city': row['city'],
-                    'investors': investor,
-                    'type': row['type'],
-                    'amount': row['amount'],
-                    'year': row['year'],
-                    'month': row['month']
-                })
-
-        new_df = pd.DataFrame(investor_list)
-
-        top_investors = new_df.groupby('investors')['amount'].sum().reset_index()
-
-        # Add the amounts of SoftBank Group and Softbank and store the result in SoftBank Group
-        softbank_group_amount = top_investors.loc[
-            top_investors['investors'] == 'SoftBank Group', 'amount'
-        ].values[0]
-
-        softbank_amount = top_investors.loc[
-            top_investors['investors'] == 'Softbank', 'amount'
-        ].values[0]
-
-        updated_amount = softbank_group_amount + softbank_amount
-        top_investors.loc[top_investors['investors'] == 'SoftBank Group', 'amount'] = updated_amount
-
-        # Drop the Softbank row
-        top_investors = top_investors[top_investors['investors'] != 'Softbank']
-
-        top_investors = top_investors.sort_values(by='amount', ascending=False).head(10)
-        return top_investors
+        top_investors = self.engine.top_rows(
+            self._table('investor_vocabulary'),
+            ['investor', 'amount'],
+            by='amount',
+            n=10
+        )
+
+        return top_investors.rename(columns={'investor': 'investors'})
 
+    @memoize()
     def funding_amount_year_month(self):
         """
         Calculates the funding amount on a year-by-month basis.
@@ -235,7 +229,7 @@ class Overall:
             pandas.DataFrame: Pivot table containing the funding amounts for each year and month.
         """
         # Aggregate funding amount by year and month
-        df_agg = startup.groupby(['year', 'month'])['amount'].sum().reset_index()
+        df_agg = self.engine.group_sum(self.cube, ['year', 'month'], 'amount')
 
         # Create pivot table
         pivot_table = df_agg.pivot(index='year', columns='month', values='amount')
@@ -0,0 +1,256 @@
+"""
+Module: Name Search
+
+This module provides the search index behind the startup and investor pickers
+of the app. Instead of shipping every name to the browser, the sidebar sends
+what the user typed and shows a short ranked list of candidates.
+
+A query is answered in two steps:
+- prefix matches, found by bisecting the sorted case folded names,
+- typo tolerant matches, ranked by the share of the query's trigrams (groups
+  of three characters) found in a name, through an inverted trigram index.
+
+Prefix matches come first. Within each step, names with more activity (deals
+or funding rounds) rank higher. An empty query returns the most active names.
+
+Dependencies:
+- bisect
+- numpy (np)
+- pandas (pd)
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import bisect
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_LIMIT = 10
+
+# Share of the query trigrams a name must contain to be a fuzzy match
+MIN_TRIGRAM_SHARE = 0.5
+
+# Sorts after every character, closes the range of names sharing a prefix
+PREFIX_END = '\U0010ffff'
+
+
+def fold(text):
+    """
+    Normalizes text for matching: case folded, surrounding spaces removed.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: The normalized text.
+    """
+    return ' '.join(str(text).casefold().split())
+
+
+def trigrams(text):
+    """
+    Returns the distinct trigrams of normalized text, padded so that the first
+    and last characters form trigrams of their own.
+
+    Args:
+        text (str): Normalized text, see `fold`.
+
+    Returns:
+        set: The trigrams of the text.
+    """
+    padded = f'  {text} '
+
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    Prefix and trigram search over a fixed list of names.
+
+    Methods:
+        __init__: Initializes the SearchIndex class.
+        prefix: Returns the names starting with a query.
+        fuzzy: Returns the names sharing most trigrams with a query.
+        search: Returns the ranked candidates for a query.
+    """
+
+    def __init__(self, names, activity=None):
+        """
+        Initialize the SearchIndex class.
+
+        Args:
+            names (array-like): Distinct names to search.
+            activity (array-like, optional): Activity of each name, higher
+                ranks first. Defaults to zero for every name.
+        """
+        names = np.asarray(names, dtype=object)
+        activity = (
+            np.zeros(len(names)) if activity is None
+            else np.asarray(activity, dtype=np.float64)
+        )
+        folded = np.array([fold(name) for name in names], dtype=object)
+
+        # Positions in folded order, ties broken by the original name
+        order = np.lexsort((names.astype(str), folded.astype(str)))
+        self._names = names[order]
+        self._folded = folded[order].tolist()
+        self._activity = activity[order]
+
+        # Rank of every position by activity, then by folded name
+        self._rank = np.empty(len(order), dtype=np.int64)
+        self._rank[np.lexsort((np.arange(len(order)), -self._activity))] = np.arange(len(order))
+
+        self._build_postings()
+
+    def __len__(self):
+        return len(self._names)
+
+    def _build_postings(self):
+        """
+        Builds the inverted trigram index of the folded names.
+
+        The trigrams starting at each offset are sliced from every name long
+        enough at once, so the loop runs over offsets rather than names. The
+        postings are stored as one array of positions sorted by trigram, with
+        the offsets of each trigram in `_bounds`.
+        """
+        padded = '  ' + pd.Series(self._folded, dtype='string[pyarrow]') + ' '
+        lengths = padded.str.len().to_numpy()
+
+        starts = [np.flatnonzero(lengths >= offset + 3) for offset in range(lengths.max(initial=2) - 2)]
+        grams = [padded.iloc[names].str.slice(offset, offset + 3) for offset, names in enumerate(starts)]
+        codes, self._grams = pd.factorize(pd.concat([padded.iloc[:0], *grams], ignore_index=True))
+        positions = np.concatenate([np.empty(0, dtype=np.int64), *starts])
+
+        # Distinct (trigram, position) pairs, sorted by trigram then position
+        pairs = np.sort(codes.astype(np.int64) * len(padded) + positions)
+        pairs = pairs[np.diff(pairs, prepend=-1) != 0]
+        pair_codes, pair_positions = np.divmod(pairs, max(len(padded), 1))
+
+        self._positions = pair_positions.astype(np.int32)
+        self._bounds = np.searchsorted(pair_codes, np.arange(len(self._grams) + 1))
+        self._trigram_counts = np.bincount(pair_positions, minlength=len(padded)).astype(np.int32)
+
+    def _postings(self, grams):
+        """
+        Returns the positions of the names containing each known trigram.
+
+        Args:
+            grams (set): Trigrams of a normalized query.
+
+        Returns:
+            list: One array of positions per trigram found in the index.
+        """
+        codes = self._grams.get_indexer(list(grams))
+
+        return [self._positions[self._bounds[code]:self._bounds[code + 1]] for code in codes[codes >= 0]]
+
+    def _prefix_range(self, query):
+        """
+        Returns the positions of the names starting with a normalized query.
+
+        Args:
+            query (str): Normalized query, see `fold`.
+
+        Returns:
+            numpy.ndarray: Positions in folded order.
+        """
+        low = bisect.bisect_left(self._folded, query)
+        high = bisect.bisect_left(self._folded, query + PREFIX_END, low)
+
+        return np.arange(low, high)
+
+    def prefix(self, query, limit=DEFAULT_LIMIT):
+        """
+        Returns the names starting with a query, ignoring case, most active first.
+
+        Args:
+            query (str): The text typed by the user.
+            limit (int): Maximum number of names.
+
+        Returns:
+            list: The matching names.
+        """
+        positions = self._prefix_range(fold(query))
+
+        return self._names[self._by_rank(positions)[:limit]].tolist()
+
+    def fuzzy(self, query, limit=DEFAULT_LIMIT):
+        """
+        Returns the names containing most trigrams of a query, tolerating typos.
+
+        Names are ranked by the share of the query trigrams they contain, then
+        by trigram similarity of the whole name, then by activity.
+
+        Args:
+            query (str): The text typed by the user.
+            limit (int): Maximum number of names.
+
+        Returns:
+            list: The matching names.
+        """
+        return self._names[self._fuzzy_positions(fold(query), limit)].tolist()
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """
+        Returns the ranked candidates for a query: prefix matches first, then
+        fuzzy matches. An empty query returns the most active names.
+
+        Args:
+            query (str): The text typed by the user.
+            limit (int): Maximum number of names.
+
+        Returns:
+            list: The candidate names.
+        """
+        query = fold(query)
+        if not query:
+            return self._names[np.argsort(self._rank)[:limit]].tolist()
+
+        positions = self._by_rank(self._prefix_range(query))[:limit]
+        if len(positions) < limit:
+            fuzzy = self._fuzzy_positions(query, limit + len(positions))
+            fuzzy = fuzzy[~np.isin(fuzzy, positions)]
+            positions = np.concatenate([positions, fuzzy])[:limit]
+
+        return self._names[positions].tolist()
+
+    def _by_rank(self, positions):
+        """
+        Orders positions by activity, most active first.
+
+        Args:
+            positions (numpy.ndarray): Positions in folded order.
+
+        Returns:
+            numpy.ndarray: The same positions, reordered.
+        """
+        return positions[np.argsort(self._rank[positions], kind='stable')]
+
+    def _fuzzy_positions(self, query, limit):
+        """
+        Returns the positions of the best fuzzy matches of a normalized query.
+
+        Args:
+            query (str): Normalized query, see `fold`.
+            limit (int): Maximum number of positions.
+
+        Returns:
+            numpy.ndarray: Positions in folded order, best match first.
+        """
+        grams = trigrams(query)
+        postings = self._postings(grams)
+        if not postings:
+            return np.empty(0, dtype=np.int64)
+
+        shared = np.bincount(np.concatenate(postings), minlength=len(self._names))
+        candidates = np.flatnonzero(shared >= MIN_TRIGRAM_SHARE * len(grams))
+        shared = shared[candidates]
+
+        share = shared / len(grams)
+        similarity = shared / (len(grams) + self._trigram_counts[candidates] - shared)
+        order = np.lexsort((self._rank[candidates], -similarity, -share))
+
+        return candidates[order[:limit]]
@@ -0,0 +1,362 @@
+"""
+Module: Similarity Index
+
+This module provides a deterministic top-k cosine similarity index over
+sparse entity × feature weight matrices. It backs the similar investors of
+`analysis.investor` and the similar startups of `analysis.startup`, and is
+built once per dataset snapshot.
+
+An entity is described by weighted feature tokens such as "vertical=FinTech"
+or "city=Mumbai". Weights are occurrence counts scaled by the inverse
+document frequency of the token, so features shared by almost every entity
+carry little weight. Rows are L2 normalized, which turns the sparse product
+of two rows into their cosine similarity.
+
+When the number of entities is small enough, the top-k neighbour lists of
+every entity are precomputed in bounded blocks and a query is a dictionary
+hit. Otherwise a query multiplies one sparse row with the matrix. The
+neighbour lists of every entity can also be exported as tables, see
+`neighbour_tables`, which the SQLite store keeps on disk.
+
+Dependencies:
+- numpy (np)
+- pandas (pd)
+- scipy (sparse)
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+DEFAULT_K = 4
+
+# Above this many entities the neighbour lists are computed per query
+PRECOMPUTE_LIMIT = 20_000
+
+# Upper bound on the cells of one dense block of similarities
+BLOCK_CELLS = 4_000_000
+
+# Deal columns describing an investor: sector, sub-sector, city and stage
+INVESTOR_FEATURES = ['vertical', 'subvertical', 'city', 'type']
+
+# Round columns describing a startup, its subvertical is tokenized separately
+STARTUP_FEATURES = ['vertical', 'city', 'type']
+
+SUBVERTICAL_TOKEN = r'[a-z0-9]{3,}'
+SUBVERTICAL_STOPWORDS = {'and', 'for', 'the', 'with', 'from', 'your'}
+
+
+def feature_tokens(frame, entity_column, feature_columns):
+    """
+    Builds the long table of (entity, feature token) pairs.
+
+    Args:
+        frame (pandas.DataFrame): One row per observation of an entity.
+        entity_column (str): Column holding the entity key.
+        feature_columns (list): Columns whose values become feature tokens,
+            named `column=value`. Missing values are skipped.
+
+    Returns:
+        pandas.DataFrame: `entity` and `feature` columns.
+    """
+    parts = []
+    for column in feature_columns:
+        values = frame[column]
+        present = values.notna().to_numpy()
+        parts.append(pd.DataFrame({
+            'entity': np.asarray(frame[entity_column], dtype=object)[present],
+            'feature': column + '=' + np.asarray(values, dtype=object)[present].astype(str)
+        }))
+
+    return pd.concat(parts, ignore_index=True)
+
+
+class SimilarityIndex:
+    """
+    Top-k cosine similarity over a sparse entity × feature matrix.
+
+    Attributes:
+        keys (numpy.ndarray): Entity keys, in matrix row order.
+        k (int): Number of neighbours precomputed per entity.
+
+    Methods:
+        __init__: Initializes the SimilarityIndex class.
+        from_tokens: Builds the index from (entity, feature) pairs.
+        similar: Returns the most similar entities of a key.
+        neighbour_table: Returns the neighbours of every entity as a table.
+    """
+
+    def __init__(self, keys, matrix, candidates=None, k=DEFAULT_K):
+        """
+        Initialize the SimilarityIndex class.
+
+        Args:
+            keys (array-like): Entity keys, one per matrix row.
+            matrix (scipy.sparse.csr_matrix): Non-negative feature weights.
+            candidates (numpy.ndarray, optional): Boolean mask of the entities
+                that may be returned as neighbours. Defaults to all.
+            k (int): Number of neighbours precomputed per entity.
+        """
+        self.keys = np.asarray(keys, dtype=object)
+        self.k = k
+        self._positions = {key: position for position, key in enumerate(self.keys)}
+        self._matrix = _normalize_rows(sparse.csr_matrix(matrix, dtype=np.float64))
+        self._candidates = (
+            np.ones(len(self.keys), dtype=bool) if candidates is None
+            else np.asarray(candidates, dtype=bool)
+        )
+        self._neighbours = None
+
+        if len(self.keys) <= PRECOMPUTE_LIMIT:
+            self._neighbours = self._precompute()
+
+    @classmethod
+    def from_tokens(cls, tokens, candidates=None, k=DEFAULT_K):
+        """
+        Builds the index from (entity, feature) pairs.
+
+        Args:
+            tokens (pandas.DataFrame): `entity` and `feature` columns, one row
+                per occurrence, see `feature_tokens`. Rows missing either
+                are ignored.
+            candidates (callable, optional): Takes the array of entity keys and
+                returns the boolean mask of allowed neighbours.
+            k (int): Number of neighbours precomputed per entity.
+
+        Returns:
+            SimilarityIndex: The index.
+        """
+        # Factorizing gives missing values the code -1, which is not a valid row
+        tokens = tokens.dropna(subset=['entity', 'feature'])
+        entity_codes, keys = pd.factorize(tokens['entity'], sort=True)
+        feature_codes, features = pd.factorize(tokens['feature'], sort=True)
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(tokens)), (entity_codes, feature_codes)),
+            shape=(len(keys), len(features))
+        )
+
+        # Inverse document frequency of every feature token
+        document_frequency = np.bincount(counts.indices, minlength=len(features))
+        idf = np.log((1 + len(keys)) / (1 + document_frequency)) + 1
+        weights = counts @ sparse.diags(idf)
+
+        keys = np.asarray(keys, dtype=object)
+        mask = None if candidates is None else candidates(keys)
+
+        return cls(keys, weights, mask, k)
+
+    def similar(self, key, k=None):
+        """
+        Returns the most similar entities of a key, most similar first.
+
+        Ties are broken by key order, so results are stable. The entity itself
+        and entities sharing no feature with it are never returned.
+
+        Args:
+            key (hashable): The entity to find neighbours for.
+            k (int, optional): Number of neighbours. Defaults to `self.k`.
+
+        Returns:
+            list: Keys of the most similar entities, empty for an unknown key.
+        """
+        k = self.k if k is None else k
+        position = self._positions.get(key)
+        if position is None:
+            return []
+
+        if self._neighbours is not None and k <= self.k:
+            return list(self.keys[self._neighbours[position][:k]])
+
+        scores = (self._matrix[position] @ self._matrix.T).toarray().ravel()
+        return list(self.keys[self._top_k(scores, position, k)])
+
+    def neighbour_table(self):
+        """
+        Returns the precomputed neighbours of every entity as a table.
+
+        Returns:
+            pandas.DataFrame: `name`, `rank` and `neighbour` columns, one row
+                per neighbour, ranks counted from zero.
+        """
+        neighbours = self._neighbours if self._neighbours is not None else self._precompute()
+        counts = np.array([len(positions) for positions in neighbours], dtype=np.int64)
+        positions = np.concatenate(neighbours) if neighbours else np.empty(0, dtype=np.int64)
+
+        return pd.DataFrame({
+            'name': np.repeat(self.keys, counts),
+            'rank': np.arange(len(positions)) - np.repeat(np.cumsum(counts) - counts, counts),
+            'neighbour': self.keys[positions]
+        })
+
+    def _top_k(self, scores, position, k):
+        """
+        Returns the positions of the k best scores of one row.
+
+        Args:
+            scores (numpy.ndarray): Similarity of the entity to every entity.
+            position (int): Row of the entity itself.
+            k (int): Number of neighbours.
+
+        Returns:
+            numpy.ndarray: Positions of the neighbours, most similar first.
+        """
+        scores = np.where(self._candidates, scores, 0.0)
+        scores[position] = 0.0
+
+        matches = np.flatnonzero(scores > 0)
+        if len(matches) > k:
+            # Keep every match tied with the k-th best so ties break by position
+            threshold = np.partition(scores[matches], len(matches) - k)[len(matches) - k]
+            matches = matches[scores[matches] >= threshold]
+
+        order = np.lexsort((matches, -scores[matches]))
+        return matches[order][:k]
+
+    def _precompute(self):
+        """
+        Computes the neighbour lists of every entity in bounded dense blocks.
+
+        Returns:
+            list: Numpy array of neighbour positions per entity.
+        """
+        count = len(self.keys)
+        block = max(1, BLOCK_CELLS // max(count, 1))
+        transposed = self._matrix.T.tocsc()
+
+        neighbours = []
+        for start in range(0, count, block):
+            scores = (self._matrix[start:start + block] @ transposed).toarray()
+            for offset, row in enumerate(scores):
+                neighbours.append(self._top_k(row, start + offset, self.k))
+
+        return neighbours
+
+
+def _normalize_rows(matrix):
+    """
+    Scales every row of a sparse matrix to unit L2 norm.
+
+    Args:
+        matrix (scipy.sparse.csr_matrix): The matrix.
+
+    Returns:
+        scipy.sparse.csr_matrix: The normalized matrix, empty rows stay empty.
+    """
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+
+    return sparse.diags(1.0 / norms) @ matrix
+
+
+def _disclosed(keys):
+    """
+    Masks out placeholder investors such as "Undisclosed Investors".
+
+    Args:
+        keys (numpy.ndarray): Investor names.
+
+    Returns:
+        numpy.ndarray: True for the investors that may be suggested.
+    """
+    return ~pd.Series(keys).str.contains('undisclosed', case=False).to_numpy()
+
+
+def build_investor_similarity(investor_deals):
+    """
+    Builds the similarity index of investors from the sectors, sub-sectors,
+    cities and stages of their deals.
+
+    Args:
+        investor_deals (pandas.DataFrame): One row per investor on each deal,
+            see `dataset.tables.build_investor_deals`.
+
+    Returns:
+        SimilarityIndex: The investor similarity index.
+    """
+    tokens = feature_tokens(investor_deals, 'investor', INVESTOR_FEATURES)
+
+    return SimilarityIndex.from_tokens(tokens, candidates=_disclosed)
+
+
+def _subvertical_tokens(startup):
+    """
+    Splits the subvertical text of every round into lower case word tokens.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        pandas.DataFrame: `entity` and `feature` columns, one row per word.
+    """
+    subvertical = pd.Series(np.asarray(startup['subvertical'], dtype=object))
+    words = subvertical.str.lower().str.findall(SUBVERTICAL_TOKEN).explode().dropna()
+    words = words[~words.isin(SUBVERTICAL_STOPWORDS)]
+    names = np.asarray(startup['name'], dtype=object)[words.index.to_numpy()]
+
+    return pd.DataFrame({'entity': names, 'feature': 'subvertical=' + words.to_numpy().astype(str)})
+
+
+def _funding_bands(startup):
+    """
+    Assigns every startup the order of magnitude of its total funding.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        pandas.DataFrame: `entity` and `feature` columns, one row per startup.
+    """
+    funding = startup.groupby('name', observed=True)['amount'].sum()
+    amounts = funding.to_numpy(dtype=np.float64)
+
+    bands = np.full(len(amounts), 'undisclosed', dtype=object)
+    funded = amounts > 0
+    bands[funded] = np.floor(np.log10(amounts[funded])).astype(int).astype(str)
+
+    return pd.DataFrame({
+        'entity': np.asarray(funding.index, dtype=object),
+        'feature': 'funding=' + bands.astype(str)
+    })
+
+
+def build_startup_similarity(startup):
+    """
+    Builds the similarity index of startups from their vertical, subvertical
+    words, city, stage and funding band.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        SimilarityIndex: The startup similarity index.
+    """
+    tokens = pd.concat([
+        feature_tokens(startup, 'name', STARTUP_FEATURES),
+        _subvertical_tokens(startup),
+        _funding_bands(startup)
+    ], ignore_index=True)
+
+    return SimilarityIndex.from_tokens(tokens)
+
+
+def neighbour_tables(startup, investor_deals):
+    """
+    Returns the neighbours of every startup and investor, as written to the
+    SQLite file by `dataset.store.build_database`.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+        investor_deals (pandas.DataFrame): One row per investor on each deal.
+
+    Returns:
+        dict: `startup` and `investor` to a DataFrame with `name`, `rank`
+            and `neighbour` columns, see `SimilarityIndex.neighbour_table`.
+    """
+    return {
+        'startup': build_startup_similarity(startup).neighbour_table(),
+        'investor': build_investor_similarity(investor_deals).neighbour_table()
+    }
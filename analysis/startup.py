@@ -2,20 +2,77 @@
 Module: Startup Analysis
 
 This module provides classes and methods for analyzing startup data.
+Startups are looked up through the name index of the dataset snapshot, so each
+lookup is a dictionary hit plus a positional take instead of a full scan.
+Similar startups come from the similarity index of `analysis.similarity`,
+built once per snapshot.
 
 Dependencies:
 - pandas (pd)
+- analysis.search
+- analysis.similarity
+- dataset (provider, startup rows)
+
+Note: The `startup` dataset is loaded lazily through the `dataset` provider.
 
 Author: Abhishek Gupta
 Github: https://github.com/1abhi6
 """
 
+from typing import NamedTuple
+
 import pandas as pd
 
-startup = pd.read_csv('dataset/startup_cleaned.csv')
-startup['date'] = pd.to_datetime(startup['date'])
-startup['year'] = startup['date'].dt.year
-startup['month'] = startup['date'].dt.month
+from analysis.cache import memoize
+from analysis.search import DEFAULT_LIMIT, SearchIndex
+from analysis.similarity import build_startup_similarity
+from dataset import provider as dataset_provider
+from dataset.tables import split_investors
+
+
+class StartupProfile(NamedTuple):
+    """
+    Every field shown for a startup.
+
+    Attributes:
+        name (str): Name of the startup.
+        funding (float): Total funding amount (In crore Rs).
+        rounds (pandas.DataFrame): All funding rounds of the startup.
+        sector (str): Sector of the startup.
+        subsector (str): Subsector of the startup.
+        city (str): Location (city) of the startup.
+        stage (str): Stage of the startup.
+        first_investors (str): Investors of the first round.
+        stages (list): Stages of all rounds, oldest first.
+        investors (list): Distinct investors across all rounds, oldest first.
+        similar_startups (list): Names of the most similar startups.
+    """
+
+    name: str
+    funding: float
+    rounds: pd.DataFrame
+    sector: str
+    subsector: str
+    city: str
+    stage: str
+    first_investors: str
+    stages: list
+    investors: list
+    similar_startups: list
+
+
+def _build_startup_search(startup_rounds):
+    """
+    Builds the search index of startup names, ranked by number of rounds.
+
+    Args:
+        startup_rounds (pandas.Series): Number of rounds per startup name,
+            see `dataset.Snapshot.startup_rounds`.
+
+    Returns:
+        SearchIndex: The startup search index.
+    """
+    return SearchIndex(startup_rounds.index, startup_rounds.to_numpy())
 
 
 class Startup:
@@ -23,11 +80,15 @@ class Startup:
     Startup class for retrieving information and performing operations related to startups.
 
     Attributes:
-        startup (pandas.DataFrame): DataFrame containing startup data.
+        provider (dataset.DatasetProvider): Provider of the shared dataset snapshot.
+        startup (pandas.DataFrame): DataFrame containing startup data, loaded on first access.
 
     Methods:
         __init__: Initializes the Startup class with the startup data.
         list_of_startups: Returns a list of startup names.
+        search_startups: Returns the startup names matching a search query.
+        rounds: Returns all funding rounds of a given startup.
+        first_round: Returns the first funding round of a given startup.
         sector: Returns the sector of a given startup.
         subsector: Returns the subsector of a given startup.
         location: Returns the location (city) of a given startup.
@@ -35,16 +96,55 @@ class Startup:
         investors: Returns the investors of a given startup.
         investment_date: Returns the investment date of a given startup.
         funding: Returns the total funding amount of a given startup.
-        similar_startups: Returns a list of similar startups based on the vertical
-        of a given startup.
+        similar_startups: Returns the most similar startups of a given startup.
+        profile: Returns every field shown for a given startup in one call.
     """
 
-    def __init__(self):
+    def __init__(self, provider=None):
         """
-        Initialize the Startup class with the startup data.
+        Initialize the Startup class with the startup data provider.
+
+        Args:
+            provider (dataset.DatasetProvider, optional): Dataset provider to use.
+                Defaults to the shared provider.
+        """
+        self.provider = provider or dataset_provider
+
+    @property
+    def startup(self):
+        """pandas.DataFrame: DataFrame containing startup data."""
+        return self.provider.get().frame
+
+    @memoize()
+    def rounds(self, startup_name):
         """
-        self.startup = startup
+        Returns all funding rounds of a given startup through the name index.
+
+        Args:
+            startup_name (str): Name of the startup.
 
+        Returns:
+            pandas.DataFrame: The rows of the startup, empty for an unknown name.
+        """
+        return self.provider.get().startup_rows(startup_name)
+
+    @memoize()
+    def first_round(self, startup_name):
+        """
+        Returns the first funding round of a given startup through the name index.
+
+        Args:
+            startup_name (str): Name of the startup.
+
+        Returns:
+            pandas.Series: The first row of the startup.
+
+        Raises:
+            IndexError: If the startup is not in the dataset.
+        """
+        return self.provider.get().startup_rows(startup_name).iloc[0]
+
+    @memoize()
     def list_of_startups(self):
         """
         Returns a list of startup names.
@@ -52,8 +152,32 @@ class Startup:
         Returns:
             list: A list of startup names.
         """
-        return list(startup['name'].sort_values().unique())[1:]
+        return list(self.provider.get().startup_rounds.index)[1:]
+
+    @memoize(maxsize=1024)
+    def search_startups(self, query, limit=DEFAULT_LIMIT):
+        """
+        Returns the startup names matching a search query, see `analysis.search`.
+
+        Startups with more funding rounds rank higher.
 
+        Args:
+            query (str): The text typed by the user. Empty for the startups
+                with the most rounds.
+            limit (int): Maximum number of names.
+
+        Returns:
+            list: Names starting with the query first, then close spellings.
+        """
+        snapshot = self.provider.get()
+        search_index = snapshot.derive(
+            'startup_search',
+            lambda frame: _build_startup_search(snapshot.startup_rounds)
+        )
+
+        return search_index.search(query, limit)
+
+    @memoize()
     def sector(self, startup_name):
         """
         Returns the sector of a given startup.
@@ -64,8 +188,9 @@ class Startup:
         Returns:
             str: The sector of the startup.
         """
-        return self.startup[self.startup['name'] == startup_name]['vertical'].values[0]
+        return self.first_round(startup_name)['vertical']
 
+    @memoize()
     def subsector(self, startup_name):
         """
         Returns the subsector of a given startup.
@@ -76,8 +201,9 @@ class Startup:
         Returns:
             str: The subsector of the startup.
         """
-        return self.startup[self.startup['name'] == startup_name]['subvertical'].values[0]
+        return self.first_round(startup_name)['subvertical']
 
+    @memoize()
     def location(self, startup_name):
         """
         Returns the location (city) of a given startup.
@@ -88,8 +214,9 @@ class Startup:
         Returns:
             str: The location (city) of the startup.
         """
-        return self.startup[self.startup['name'] == startup_name]['city'].values[0]
+        return self.first_round(startup_name)['city']
 
+    @memoize()
     def stage(self, startup_name):
         """
         Returns the stage of a given startup.
@@ -100,8 +227,9 @@ class Startup:
         Returns:
             str: The stage of the startup.
         """
-        return self.startup[self.startup['name'] == startup_name]['type'].values[0]
+        return self.first_round(startup_name)['type']
 
+    @memoize()
     def investors(self, startup_name):
         """
         Returns the investors of a given startup.
@@ -112,8 +240,9 @@ class Startup:
         Returns:
             str: The investors of the startup.
         """
-        return self.startup[self.startup['name'] == startup_name]['investors'].values[0]
+        return self.first_round(startup_name)['investors']
 
+    @memoize()
     def investment_date(self, startup_name):
         """
         Returns the investment date of a given startup.
@@ -124,8 +253,9 @@ class Startup:
         Returns:
             str: The investment date of the startup.
         """
-        return self.startup[self.startup['name'] == startup_name]['date'].values[0]
+        return self.first_round(startup_name)['date']
 
+    @memoize()
     def funding(self, startup_name):
         """
         Returns the total funding amount of a given startup.
@@ -136,26 +266,67 @@ class Startup:
         Returns:
             float: The total funding amount of the startup.
         """
-        company = self.startup[self.startup['name'] == startup_name]
-        return company.groupby('name')['amount'].sum().values[0]
+        return self.rounds(startup_name)['amount'].sum()
 
+    @memoize()
     def similar_startups(self, startup_name):
         """
-        Returns a list of similar startups based on the vertical of a given startup.
+        Returns the most similar startups of a given startup.
+
+        Startups are compared on their vertical, subvertical words, city, stage
+        and funding band, see `analysis.similarity`.
 
         Args:
             startup_name (str): Name of the startup.
 
         Returns:
-            list: A list of similar startup names.
+            list: Up to four similar startup names, most similar first.
         """
-        vertical = startup.loc[startup['name'] == startup_name, 'vertical'].values[0]
+        return self._similar_startups(startup_name)
 
-        temp_startups = startup.loc[startup['vertical'] == vertical, 'name'].unique()
+    def _similar_startups(self, startup_name):
+        """
+        Returns the most similar startups from the similarity index of the snapshot.
+
+        Args:
+            startup_name (str): Name of the startup.
+
+        Returns:
+            list: Up to four similar startup names, most similar first.
+        """
+        return self.provider.get().similar('startup', startup_name, build_startup_similarity)
 
-        similar_startups = []
-        for company in temp_startups:
-            if company != startup_name:
-                similar_startups.append(company)
+    @memoize()
+    def profile(self, startup_name):
+        """
+        Returns every field shown for a startup, computed from one slice of the data.
+
+        Args:
+            startup_name (str): Name of the startup.
 
-        return similar_startups
+        Returns:
+            StartupProfile: The profile of the startup.
+
+        Raises:
+            IndexError: If the startup is not in the dataset.
+        """
+        rounds = self.rounds(startup_name)
+        if rounds.empty:
+            raise IndexError(f'Unknown startup: {startup_name}')
+
+        first = rounds.iloc[0]
+        history = rounds.sort_values('date', kind='stable')
+
+        return StartupProfile(
+            name=startup_name,
+            funding=rounds['amount'].sum(),
+            rounds=rounds,
+            sector=first['vertical'],
+            subsector=first['subvertical'],
+            city=first['city'],
+            stage=first['type'],
+            first_investors=first['investors'],
+            stages=list(history['type']),
+            investors=list(split_investors(history['investors']).unique()),
+            similar_startups=self._similar_startups(startup_name)
+        )
@@ -0,0 +1,7 @@
+"""
+The `api` package serves the analysis layer as a local JSON API over HTTP,
+for tools that need its computations without Streamlit. See `api.server`
+and `python -m api --help`.
+"""
+
+from api.server import ApiServer, run
@@ -0,0 +1,33 @@
+"""
+Command line entry point of the api package.
+
+Usage:
+    python -m api [--host HOST] [--port PORT] [--workers N]
+
+Serves every public method of `analysis.Overall`, `analysis.Investor` and
+`analysis.Startup` as a JSON endpoint until interrupted.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import argparse
+import logging
+
+from api.server import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_WORKERS, run
+
+parser = argparse.ArgumentParser(prog='python -m api')
+parser.add_argument('--host', default=DEFAULT_HOST)
+parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='threads running the analysis methods')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    run(
+        args.host,
+        args.port,
+        args.workers,
+        ready=lambda address: print(f'Serving the analysis API on http://{address[0]}:{address[1]}/')
+    )
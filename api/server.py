@@ -0,0 +1,479 @@
+"""
+Module: JSON API Server
+
+This module serves the public methods of `analysis.Overall`,
+`analysis.Investor` and `analysis.Startup` as JSON over HTTP, for tools
+that need the computations of the app without Streamlit. It runs on an
+asyncio server from the standard library and answers GET and HEAD requests:
+
+    GET /                                   lists every endpoint
+    GET /overall/total_funding_mom
+    GET /investor/profile?investor_name=Sequoia%20Capital
+    GET /startup/search_startups?query=ola&limit=5
+
+The query string carries the arguments of the method, by parameter name.
+
+The analysis methods are blocking pandas code, so they run in a pool of
+worker threads and the event loop only parses requests and writes
+responses. Threads share the dataset snapshot and the analysis caches of
+the process, unlike worker processes which would each load a copy.
+
+Every response carries an ETag derived from the dataset fingerprint and
+the request, so it changes with a data refresh. Encoded responses are kept
+in an LRU cache under the same key: a repeat request is answered from the
+cache, and a request with a matching `If-None-Match` gets a
+`304 Not Modified`, both without touching the DataFrame.
+
+Usage:
+    python -m api --port 8502
+
+Dependencies:
+- asyncio
+- concurrent.futures
+- hashlib
+- http
+- inspect
+- json
+- logging
+- urllib.parse
+- analysis (Investor, Overall, Startup)
+- analysis.cache (LRUCache)
+- dataset (provider)
+- report.render (plain)
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+
+from analysis import Investor, Overall, Startup
+from analysis.cache import LRUCache
+from dataset import provider as dataset_provider
+from report.render import plain
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8502
+DEFAULT_WORKERS = 4
+RESPONSE_CACHE_SIZE = 1024
+
+# Requests with more header lines are rejected
+MAX_HEADER_LINES = 100
+
+ANALYSIS_CLASSES = {'overall': Overall, 'investor': Investor, 'startup': Startup}
+
+logger = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    """
+    Error answered to the client with an HTTP status and a JSON message.
+
+    Attributes:
+        status (http.HTTPStatus): Status of the response.
+        message (str): Explanation sent to the client.
+    """
+
+    def __init__(self, status, message):
+        """
+        Initialize the ApiError class.
+
+        Args:
+            status (http.HTTPStatus): Status of the response.
+            message (str): Explanation sent to the client.
+        """
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Endpoint:
+    """
+    One public analysis method served under `/<kind>/<method>`.
+
+    Attributes:
+        path (str): Path of the endpoint.
+        method (callable): Bound analysis method.
+        parameters (list): `inspect.Parameter` of the method, without `self`.
+
+    Methods:
+        __init__: Initializes the Endpoint class.
+        arguments: Converts the query string to the arguments of the method.
+        describe: Returns the path and parameters of the endpoint.
+    """
+
+    def __init__(self, path, method):
+        """
+        Initialize the Endpoint class.
+
+        Args:
+            path (str): Path of the endpoint.
+            method (callable): Bound analysis method.
+        """
+        self.path = path
+        self.method = method
+        self.parameters = list(inspect.signature(method).parameters.values())
+
+    def arguments(self, query):
+        """
+        Converts the query string to the arguments of the method.
+
+        Parameters with an integer default are converted to int, every other
+        parameter is passed as a string.
+
+        Args:
+            query (dict): Query string parameters.
+
+        Returns:
+            tuple: Pairs of (parameter name, argument), in signature order.
+
+        Raises:
+            ApiError: On an unknown, missing or malformed parameter.
+        """
+        names = {parameter.name for parameter in self.parameters}
+        unknown = sorted(set(query) - names)
+        if unknown:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f'Unknown parameter: {", ".join(unknown)}')
+
+        arguments = []
+        for parameter in self.parameters:
+            if parameter.name not in query:
+                if parameter.default is inspect.Parameter.empty:
+                    raise ApiError(HTTPStatus.BAD_REQUEST, f'Missing parameter: {parameter.name}')
+                continue
+
+            value = query[parameter.name]
+            if isinstance(parameter.default, int):
+                try:
+                    value = int(value)
+                except ValueError:
+                    raise ApiError(
+                        HTTPStatus.BAD_REQUEST, f'Parameter {parameter.name} must be an integer'
+                    ) from None
+            arguments.append((parameter.name, value))
+
+        return tuple(arguments)
+
+    def describe(self):
+        """
+        Returns the path and parameters of the endpoint.
+
+        Returns:
+            dict: `path`, the `required` and the `optional` parameter names.
+        """
+        return {
+            'path': self.path,
+            'required': [
+                parameter.name for parameter in self.parameters
+                if parameter.default is inspect.Parameter.empty
+            ],
+            'optional': [
+                parameter.name for parameter in self.parameters
+                if parameter.default is not inspect.Parameter.empty
+            ]
+        }
+
+
+def build_endpoints(provider=None):
+    """
+    Returns an endpoint for every memoized public method of the analysis classes.
+
+    Args:
+        provider (dataset.DatasetProvider, optional): Provider of the dataset.
+            Defaults to the shared provider.
+
+    Returns:
+        dict: Path to `Endpoint`.
+    """
+    endpoints = {}
+    for kind, cls in ANALYSIS_CLASSES.items():
+        analysis = cls(provider)
+        for name, function in inspect.getmembers(cls, inspect.isfunction):
+            if name.startswith('_') or not hasattr(function, 'cache'):
+                continue
+            path = f'/{kind}/{name}'
+            endpoints[path] = Endpoint(path, getattr(analysis, name))
+
+    return endpoints
+
+
+def etag(key):
+    """
+    Returns the entity tag of a response.
+
+    Args:
+        key (tuple): Dataset fingerprint, endpoint path and arguments.
+
+    Returns:
+        str: The quoted tag.
+    """
+    return '"' + hashlib.blake2b(repr(key).encode(), digest_size=12).hexdigest() + '"'
+
+
+def encode(value):
+    """
+    Converts the result of an analysis method to JSON compatible values.
+
+    Args:
+        value (object): A profile, DataFrame, Series, list or scalar.
+
+    Returns:
+        object: Dicts for profiles and Series, records for DataFrames.
+    """
+    if hasattr(value, '_asdict'):
+        return {field: encode(item) for field, item in value._asdict().items()}
+
+    return plain(value)
+
+
+class ApiServer:
+    """
+    Asyncio HTTP server answering JSON requests to the analysis layer.
+
+    Attributes:
+        provider (dataset.DatasetProvider): Provider of the dataset.
+        endpoints (dict): Path to `Endpoint`, see `build_endpoints`.
+        responses (analysis.cache.LRUCache): Encoded responses by request
+            and dataset fingerprint.
+
+    Methods:
+        __init__: Initializes the ApiServer class.
+        fingerprint: Returns the fingerprint of the dataset files.
+        respond: Computes the status, headers and body of a request.
+        handle: Serves the requests of one client connection.
+        serve: Listens for connections until cancelled.
+    """
+
+    def __init__(self, provider=None, workers=DEFAULT_WORKERS, cache_size=RESPONSE_CACHE_SIZE):
+        """
+        Initialize the ApiServer class.
+
+        Args:
+            provider (dataset.DatasetProvider, optional): Provider of the
+                dataset. Defaults to the shared provider.
+            workers (int): Threads running the analysis methods.
+            cache_size (int): Maximum number of cached responses.
+        """
+        self.provider = provider or dataset_provider
+        self.endpoints = build_endpoints(self.provider)
+        self.responses = LRUCache(cache_size)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='api')
+
+    def fingerprint(self):
+        """
+        Returns the fingerprint of the dataset files.
+
+        Only stats the files, so it is cheap enough for the event loop.
+
+        Returns:
+            str: The fingerprint the next snapshot will carry.
+        """
+        return self.provider.fingerprint()
+
+    def _index(self):
+        """
+        Returns the body listing every endpoint.
+
+        Returns:
+            bytes: The encoded JSON body.
+        """
+        endpoints = [endpoint.describe() for endpoint in self.endpoints.values()]
+
+        return json.dumps({'endpoints': endpoints}).encode()
+
+    def _compute(self, endpoint, arguments):
+        """
+        Calls an analysis method and encodes its result, in a worker thread.
+
+        Args:
+            endpoint (Endpoint): The endpoint.
+            arguments (tuple): Pairs of (parameter name, argument).
+
+        Returns:
+            tuple: The fingerprint of the snapshot used and the JSON body.
+
+        Raises:
+            ApiError: When the entity of the request is not in the dataset.
+        """
+        fingerprint = self.provider.get().fingerprint
+        try:
+            result = endpoint.method(**dict(arguments))
+        except (IndexError, KeyError):
+            raise ApiError(HTTPStatus.NOT_FOUND, 'Not in the dataset') from None
+        except ValueError as error:
+            raise ApiError(HTTPStatus.BAD_REQUEST, str(error)) from None
+
+        return fingerprint, json.dumps(encode(result)).encode()
+
+    async def respond(self, target, headers):
+        """
+        Computes the status, headers and body of a GET request.
+
+        Args:
+            target (str): Request target, path and query string.
+            headers (dict): Request headers, with lower case names.
+
+        Returns:
+            tuple: The `http.HTTPStatus`, a dict of response headers and the body.
+        """
+        url = urlsplit(target)
+        if url.path == '/':
+            return HTTPStatus.OK, {}, self._index()
+
+        endpoint = self.endpoints.get(url.path.rstrip('/'))
+        if endpoint is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f'Unknown endpoint: {url.path}')
+
+        arguments = endpoint.arguments(dict(parse_qsl(url.query, keep_blank_values=True)))
+        fingerprint = self.fingerprint()
+        key = (fingerprint, endpoint.path, arguments)
+        cache_headers = {'ETag': etag(key), 'Cache-Control': 'no-cache'}
+
+        if cache_headers['ETag'] in (tag.strip() for tag in headers.get('if-none-match', '').split(',')):
+            return HTTPStatus.NOT_MODIFIED, cache_headers, b''
+
+        body = self.responses.get(key)
+        if body is None:
+            loop = asyncio.get_running_loop()
+            computed_fingerprint, body = await loop.run_in_executor(
+                self._executor, self._compute, endpoint, arguments
+            )
+            # A refresh during the call is cached under its own fingerprint
+            if computed_fingerprint != fingerprint:
+                key = (computed_fingerprint, endpoint.path, arguments)
+                cache_headers['ETag'] = etag(key)
+            self.responses.put(key, body)
+
+        return HTTPStatus.OK, cache_headers, body
+
+    async def _read_request(self, reader):
+        """
+        Reads the request line and headers of the next request.
+
+        Args:
+            reader (asyncio.StreamReader): The connection.
+
+        Returns:
+            tuple: The method, target, version and headers, or None at the
+                end of the connection.
+
+        Raises:
+            ApiError: On a malformed request.
+        """
+        line = await reader.readline()
+        if not line.strip():
+            return None
+
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, 'Malformed request line') from None
+
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                return method, target, version, headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        raise ApiError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, 'Too many headers')
+
+    async def handle(self, reader, writer):
+        """
+        Serves the requests of one client connection, kept alive between
+        requests unless the client asks to close it.
+
+        Args:
+            reader (asyncio.StreamReader): Reading side of the connection.
+            writer (asyncio.StreamWriter): Writing side of the connection.
+        """
+        try:
+            while True:
+                keep_alive = False
+                head = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, version, headers = request
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection == 'keep-alive' or (
+                        version == 'HTTP/1.1' and connection != 'close'
+                    )
+                    head = method == 'HEAD'
+                    if method not in ('GET', 'HEAD'):
+                        raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, 'Only GET and HEAD are supported')
+                    status, response_headers, body = await self.respond(target, headers)
+                except ApiError as error:
+                    status, response_headers = error.status, {}
+                    body = json.dumps({'error': error.message}).encode()
+                except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                except Exception:
+                    logger.exception('Request failed')
+                    status, response_headers = HTTPStatus.INTERNAL_SERVER_ERROR, {}
+                    body = json.dumps({'error': 'Internal server error'}).encode()
+
+                response_headers.update({
+                    'Content-Type': 'application/json',
+                    'Content-Length': str(len(body)),
+                    'Connection': 'keep-alive' if keep_alive else 'close'
+                })
+                lines = [f'HTTP/1.1 {status.value} {status.phrase}']
+                lines += [f'{name}: {value}' for name, value in response_headers.items()]
+                writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+                if not head and status != HTTPStatus.NOT_MODIFIED:
+                    writer.write(body)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """
+        Listens for connections until cancelled.
+
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 for any free port.
+            ready (callable, optional): Called with the listening socket address.
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+        if ready is not None:
+            ready(server.sockets[0].getsockname())
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=DEFAULT_WORKERS, provider=None, ready=None):
+    """
+    Runs the API server until interrupted.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on.
+        workers (int): Threads running the analysis methods.
+        provider (dataset.DatasetProvider, optional): Provider of the dataset.
+        ready (callable, optional): Called with the listening socket address.
+    """
+    server = ApiServer(provider, workers)
+    try:
+        asyncio.run(server.serve(host, port, ready))
+    except KeyboardInterrupt:
+        pass
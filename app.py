@@ -7,6 +7,11 @@ Dependencies:
 - streamlit (st)
 - analysis (Investor,Overall,Startup)
 - components (Investor,Overall,Startup)
+- analysis.instrumentation
+
+With the environment variable `STARTUP_INSTRUMENTATION=1` every rerun is
+timed, and a Performance panel in the sidebar breaks the time of the current
+page down by analysis and plotting method.
 
 Note: The `analysis` and `components` are imported from the `analysis` and `components` module.
 
@@ -29,6 +34,8 @@ from components import (
 
 from components import PADDING_TOP
 
+from analysis import instrumentation
+
 
 class Main:
     """
@@ -48,6 +55,7 @@ class Main:
         investor: Renders the investor analysis component.
         overall: Renders the overall analysis component.
         startup: Renders the startup analysis component.
+        performance: Renders the timings of the current page.
     """
 
     def __init__(self) -> None:
@@ -74,12 +82,47 @@ class Main:
         )
         option = st.sidebar.selectbox('Select One', ['Overall Analysis', 'Startup', 'Investor'])
 
-        if option == 'Overall Analysis':
-            self.overall()
-        elif option == 'Startup':
-            self.startup()
-        elif option == 'Investor':
-            self.investor()
+        run = instrumentation.start_run(option)
+        try:
+            if option == 'Overall Analysis':
+                self.overall()
+            elif option == 'Startup':
+                self.startup()
+            elif option == 'Investor':
+                self.investor()
+        finally:
+            instrumentation.finish_run(run)
+
+        if run is not None:
+            self.performance(run)
+
+    def performance(self, run):
+        """
+        Render the timings of the current page in the sidebar.
+
+        Args:
+            run (analysis.instrumentation.Run): The finished run of the page.
+        """
+        with st.sidebar.expander('Performance'):
+            st.metric('Page (ms)', round(run.seconds * 1000, 1))
+
+            summary = instrumentation.summarize(run.spans)
+            if summary:
+                st.dataframe(
+                    [
+                        {
+                            'method': total['name'],
+                            'calls': total['calls'],
+                            'ms': round(total['seconds'] * 1000, 2),
+                            'rows': total['rows'],
+                            'hits': total['hits'],
+                            'misses': total['misses']
+                        }
+                        for total in summary
+                    ],
+                    hide_index=True,
+                    use_container_width=True
+                )
 
     def overall(self):
         """
@@ -169,9 +212,11 @@ class Main:
         """
         Render the startup analysis component.
         """
+        # Only the best matches of the query are sent to the browser
+        query = st.sidebar.text_input('Search Startup')
         startup_name = st.sidebar.selectbox(
             'Select Startup',
-            self.startup_analysis.list_of_startups()
+            self.startup_analysis.search_startups(query)
         )
         btn = st.sidebar.button('Find Startup details')
 
@@ -188,7 +233,9 @@ class Main:
             st.write('')
         st.divider()
 
-        if btn:
+        if btn and startup_name:
+            profile = self.startup_analysis.profile(startup_name)
+
             subhead_col0, subhead_col1 = st.columns(2)
 
             with subhead_col0:
@@ -198,26 +245,26 @@ class Main:
             with subhead_col1:
                 st.metric(
                     'Investments (In Crore Rs)',
-                    self.startup_analysis.funding(startup_name),
+                    profile.funding,
                     delta='+10'
                 )
             st.divider()
 
             col0, col1 = st.columns(2)
             with col0:
-                st.metric('Sector', self.startup_analysis.sector(startup_name))
+                st.metric('Sector', profile.sector)
             with col1:
-                st.metric('Subsector', self.startup_analysis.subsector(startup_name))
+                st.metric('Subsector', profile.subsector)
 
             st.divider()
             col3, col4 = st.columns(2)
             with col3:
-                st.metric('Stage', self.startup_analysis.stage(startup_name))
+                st.metric('Stage', profile.stage)
             with col4:
-                st.metric('Investors', self.startup_analysis.investors(startup_name))
+                st.metric('Investors', profile.first_investors)
 
             st.divider()
-            self.startup_component.similar_startups(startup_name)
+            self.startup_component.similar_startups(startup_name, profile.similar_startups)
 
 
     def investor(self):
@@ -225,9 +272,11 @@ class Main:
         Render the investor analysis component.
         """
         # Get the investor name
+        # Only the best matches of the query are sent to the browser
+        query = st.sidebar.text_input('Search Investor')
         investor_name = st.sidebar.selectbox(
             'Select Investor',
-            self.investor_analysis.investor_list()
+            self.investor_analysis.search_investors(query)
         )
 
         btn = st.sidebar.button('Find Investor details')
@@ -245,36 +294,37 @@ class Main:
             st.write('')
         st.divider()
 
-        st.title(investor_name)
+        st.title(investor_name or '')
         st.divider()
 
         # Display the investor details
-        if btn:
-            self.investor_component.recent_five_investments(investor_name)
+        if btn and investor_name:
+            profile = self.investor_component.profile(investor_name)
+
+            self.investor_component.recent_five_investments(profile)
             st.divider()
 
             col1, col2 = st.columns(2)
             with col1:
-                self.investor_component.plot_biggest_investment(investor_name)
+                self.investor_component.plot_biggest_investment(profile)
             with col2:
-                self.investor_component.plot_invested_city(investor_name)
+                self.investor_component.plot_invested_city(profile)
             st.divider()
 
             col3, col4 = st.columns(2)
             with col3:
-                self.investor_component.plot_invested_sector(investor_name)
+                self.investor_component.plot_invested_sector(profile)
             with col4:
-                self.investor_component.plot_invested_subsector(investor_name)
+                self.investor_component.plot_invested_subsector(profile)
             st.divider()
 
             col5, col6 = st.columns(2)
             with col5:
-                self.investor_component.plot_invested_type(investor_name)
+                self.investor_component.plot_invested_type(profile)
             with col6:
-                self.investor_component.plot_yoy_investment(investor_name)
+                self.investor_component.plot_yoy_investment(profile)
             st.divider()
 
-            self.investor_component.similar_investors(investor_name)
-
+            self.investor_component.similar_investors(profile)
 
 Main()
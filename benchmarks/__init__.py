@@ -0,0 +1,7 @@
+"""
+The `benchmarks` package times the analysis layer on datasets of increasing
+scale and records wall time and peak memory as JSON. See `benchmarks.suite`
+and `python -m benchmarks --help`.
+"""
+
+from benchmarks.suite import compare, run, save
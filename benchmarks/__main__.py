@@ -0,0 +1,63 @@
+"""
+Command line entry point of the benchmarks package.
+
+Usage:
+    python -m benchmarks [--scales 1 10 100 1000] [--repeat N] [--output PATH]
+                         [--synthetic] [--compare BASELINE]
+
+Times every public analysis method at each scale of the dataset, prints the
+results as they come and writes them as JSON. `--synthetic` benchmarks on
+synthetic data sampled from the real distributions instead of replicas. With
+`--compare`, the new run is compared with an earlier results file, slowest
+regressions first.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import argparse
+import datetime
+import json
+import os
+
+from benchmarks.suite import DEFAULT_REPEAT, DEFAULT_SCALES, compare, run, save
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+parser = argparse.ArgumentParser(prog='python -m benchmarks')
+parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES))
+parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+parser.add_argument('--output', default=None, help='default: benchmarks/results/<timestamp>.json')
+parser.add_argument('--synthetic', action='store_true', help='use synthetic data instead of replicas')
+parser.add_argument('--compare', default=None, metavar='BASELINE', help='results file to compare with')
+
+
+def main():
+    """Runs the benchmarks, writes the results and compares them when asked."""
+    args = parser.parse_args()
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+        output = os.path.join(RESULTS_DIR, f'benchmark-{stamp}.json')
+
+    result = run(
+        args.scales,
+        args.repeat,
+        args.synthetic,
+        progress=lambda r: print(
+            f"x{r['scale']:<5} {r['case']:<45} {r['seconds'] * 1000:>10.2f} ms "
+            f"{r['peak_bytes'] / 2 ** 20:>9.1f} MiB"
+        )
+    )
+    save(result, output)
+    print(f'Results written to {output}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            print(compare(json.load(file), result).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
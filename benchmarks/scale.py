@@ -0,0 +1,161 @@
+"""
+Module: Scaled Datasets
+
+This module writes enlarged copies of the startup dataset for the benchmarks.
+A dataset at scale k holds k copies of every round. Each copy renames its
+startups and investors with a `#i` suffix, so the number of distinct
+entities, and with it the size of every index, grows with the scale like it
+would with more real data.
+
+The copies are streamed into a Parquet snapshot one at a time, so the
+dataset is never held k times in memory while it is written. The snapshot
+is then loaded through a regular `dataset.DatasetProvider`.
+
+Alternatively, `write_synthetic` samples the same number of rows from the
+distributions of the real data, see `dataset.synthetic`, which gives new
+entity names and a more realistic spread of activity than replicas.
+
+Dependencies:
+- os
+- pyarrow (pa, pq)
+- dataset
+- dataset.synthetic
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dataset import DatasetProvider
+from dataset.canonical import CANONICAL_PATH, INVESTOR_SEPARATOR
+from dataset.ingest import SNAPSHOT_SCHEMA
+from dataset.snapshot import CSV_PATH, SNAPSHOT_PATH, load
+from dataset.synthetic import FundingModel, generate
+from dataset.tables import split_investors
+
+
+def _suffixed(values, suffix):
+    """
+    Appends a suffix to every category of a categorical column.
+
+    Args:
+        values (pandas.Series): Categorical column.
+        suffix (str): The suffix.
+
+    Returns:
+        pandas.Series: Categorical column with renamed categories.
+    """
+    return values.cat.rename_categories(values.cat.categories + suffix)
+
+
+def _suffixed_investors(values, suffix):
+    """
+    Appends a suffix to every investor name of the investor strings.
+
+    Args:
+        values (pandas.Series): Categorical column of investor strings.
+        suffix (str): The suffix.
+
+    Returns:
+        pandas.Series: Categorical column with renamed investors.
+    """
+    categories = values.cat.categories
+    names = split_investors(categories) + suffix
+    joined = names.groupby(level=0).agg(INVESTOR_SEPARATOR.join)
+    renamed = joined.reindex(range(len(categories))).fillna('')
+
+    # The loaded investor strings are already joined canonically, so the
+    # renamed strings stay distinct
+    return values.cat.rename_categories(renamed.to_numpy())
+
+
+def copy_of(startup, copy):
+    """
+    Returns one renamed copy of the dataset.
+
+    Args:
+        startup (pandas.DataFrame): The compact startup dataset.
+        copy (int): Number of the copy, the first copy keeps its names.
+
+    Returns:
+        pandas.DataFrame: The copy.
+    """
+    if copy == 0:
+        return startup
+
+    suffix = f' #{copy}'
+    startup = startup.copy(deep=False)
+    startup['name'] = _suffixed(startup['name'], suffix)
+    startup['investors'] = _suffixed_investors(startup['investors'], suffix)
+
+    return startup
+
+
+def write_scaled(scale, directory, csv_path=CSV_PATH, snapshot_path=SNAPSHOT_PATH):
+    """
+    Writes the snapshot of the dataset enlarged `scale` times.
+
+    Args:
+        scale (int): Number of copies of the dataset.
+        directory (str): Directory to write the snapshot to.
+        csv_path (str): Path of the cleaned CSV file to enlarge.
+        snapshot_path (str): Path of its Parquet snapshot.
+
+    Returns:
+        str: Path of the written snapshot.
+    """
+    startup = load(csv_path, snapshot_path)
+    startup = startup.astype({'amount': 'float64', 'year': 'int32', 'month': 'int32'})
+
+    path = os.path.join(directory, f'startup_x{scale}.parquet')
+    with pq.ParquetWriter(path, SNAPSHOT_SCHEMA) as writer:
+        for copy in range(scale):
+            writer.write_table(pa.Table.from_pandas(
+                copy_of(startup, copy), schema=SNAPSHOT_SCHEMA, preserve_index=False
+            ))
+
+    return path
+
+
+def write_synthetic(scale, directory, seed=0, csv_path=CSV_PATH, snapshot_path=SNAPSHOT_PATH):
+    """
+    Writes a synthetic snapshot `scale` times the size of the dataset.
+
+    Args:
+        scale (int): Size of the synthetic dataset, in multiples of the real one.
+        directory (str): Directory to write the snapshot to.
+        seed (int): Seed of the random generator, fixed so runs compare.
+        csv_path (str): Path of the cleaned CSV file to learn from.
+        snapshot_path (str): Path of its Parquet snapshot.
+
+    Returns:
+        str: Path of the written snapshot.
+    """
+    startup = load(csv_path, snapshot_path)
+
+    path = os.path.join(directory, f'synthetic_x{scale}.parquet')
+    generate(path, rows=scale * len(startup), seed=seed, model=FundingModel.fit(startup))
+
+    return path
+
+
+def scaled_provider(path):
+    """
+    Returns a dataset provider reading a scaled snapshot.
+
+    Args:
+        path (str): Path of a snapshot written by `write_scaled` or `write_synthetic`.
+
+    Returns:
+        dataset.DatasetProvider: Provider of the scaled dataset. It has no
+            CSV file, so the snapshot is always used.
+    """
+    return DatasetProvider(
+        csv_path=path + '.missing.csv',
+        snapshot_path=path,
+        canonical_path=CANONICAL_PATH
+    )
@@ -0,0 +1,296 @@
+"""
+Module: Analysis Benchmarks
+
+This module times every public method of `analysis.Overall`,
+`analysis.Investor` and `analysis.Startup` on datasets of increasing scale
+(see `benchmarks.scale`) and records the results as JSON, so that two runs
+can be compared and regressions caught before they ship.
+
+Every method is measured:
+- cold: with the memoized results cleared, the median of `repeat` runs,
+- warm: once more right after, served from the analysis cache,
+- for peak memory: one more cold run under `tracemalloc`, kept apart from
+  the timed runs because tracing slows allocations down.
+
+Loading the dataset and building its derived tables and indexes are timed
+as cases of their own, so method timings only measure the query itself.
+
+Dependencies:
+- datetime
+- inspect
+- json
+- platform
+- statistics
+- tempfile
+- time
+- tracemalloc
+- pandas (pd)
+- analysis
+- benchmarks.scale
+- dataset
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import datetime
+import inspect
+import json
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from analysis import Investor, Overall, Startup
+from analysis.cache import clear_caches
+from analysis.search import SearchIndex
+from benchmarks.scale import scaled_provider, write_scaled, write_synthetic
+from dataset import Snapshot
+from dataset.snapshot import load
+
+DEFAULT_SCALES = (1, 10, 100, 1000)
+DEFAULT_REPEAT = 3
+
+ANALYSIS_CLASSES = (Overall, Investor, Startup)
+
+# Derived structures of the snapshot, timed as cases of their own
+SNAPSHOT_STRUCTURES = (
+    'investor_deals', 'investor_index', 'investor_vocabulary',
+    'name_index', 'monthly_cube', 'startup_years', 'startup_rounds'
+)
+
+SEARCH_QUERY = 'seq'
+
+
+def public_methods(cls):
+    """
+    Returns the memoized public methods of an analysis class.
+
+    Args:
+        cls (type): An analysis class.
+
+    Returns:
+        list: Pairs of (method name, function), sorted by name.
+    """
+    return [
+        (name, function)
+        for name, function in inspect.getmembers(cls, inspect.isfunction)
+        if not name.startswith('_') and hasattr(function, 'cache')
+    ]
+
+
+def sample_arguments(provider):
+    """
+    Picks the arguments the methods are timed with: the most active
+    investor and the startup with the most rounds.
+
+    Args:
+        provider (dataset.DatasetProvider): Provider of the dataset.
+
+    Returns:
+        dict: Parameter name to argument.
+    """
+    snapshot = provider.get()
+    vocabulary = snapshot.investor_vocabulary
+    investor = vocabulary['investor'].iloc[vocabulary['deals'].to_numpy().argmax()]
+    startup = max(snapshot.name_index.items(), key=lambda item: len(item[1]))[0]
+
+    return {'investor_name': investor, 'startup_name': startup, 'query': SEARCH_QUERY}
+
+
+def _arguments(function, samples):
+    """
+    Returns the positional arguments of a method, without `self`.
+
+    Args:
+        function (callable): The method.
+        samples (dict): Parameter name to argument, see `sample_arguments`.
+
+    Returns:
+        tuple: The arguments of the required parameters.
+    """
+    parameters = list(inspect.signature(function).parameters.values())[1:]
+
+    return tuple(
+        samples[parameter.name] for parameter in parameters
+        if parameter.default is inspect.Parameter.empty
+    )
+
+
+def measure(call, repeat=DEFAULT_REPEAT, cold=clear_caches):
+    """
+    Times a call cold and warm and measures its peak memory.
+
+    Args:
+        call (callable): The call to measure, without arguments.
+        repeat (int): Number of timed cold runs.
+        cold (callable): Resets the state between cold runs.
+
+    Returns:
+        dict: `seconds` (median cold), `min_seconds`, `warm_seconds` and
+            `peak_bytes` of the call.
+    """
+    times = []
+    for _ in range(repeat):
+        cold()
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    call()
+    warm = time.perf_counter() - start
+
+    cold()
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'seconds': statistics.median(times),
+        'min_seconds': min(times),
+        'warm_seconds': warm,
+        'peak_bytes': peak
+    }
+
+
+def benchmark_scale(provider, scale, repeat=DEFAULT_REPEAT, progress=None):
+    """
+    Benchmarks loading the dataset and every public analysis method at one scale.
+
+    Args:
+        provider (dataset.DatasetProvider): Provider of the scaled dataset.
+        scale (int): The scale, recorded with the results.
+        repeat (int): Number of timed cold runs per method.
+        progress (callable, optional): Called with every result.
+
+    Returns:
+        list: One result dict per case.
+    """
+    results = []
+
+    def record(case, rows, measurement):
+        result = {'case': case, 'scale': scale, 'rows': rows, **measurement}
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    snapshot = provider.get()
+    rows = len(snapshot.frame)
+
+    record('dataset.load', rows, measure(lambda: load(
+        provider.csv_path, provider.snapshot_path, provider.canonical_path
+    ), repeat, cold=lambda: None))
+
+    # Each structure is timed on a fresh snapshot, including the structures
+    # it is built from
+    for structure in SNAPSHOT_STRUCTURES:
+        record(f'snapshot.{structure}', rows, measure(
+            lambda: getattr(Snapshot(snapshot.frame, snapshot.fingerprint), structure),
+            repeat,
+            cold=lambda: None
+        ))
+
+    # The search indexes are built from the structures timed above
+    search_names = {
+        'startup_search': (snapshot.startup_rounds.index, snapshot.startup_rounds.to_numpy()),
+        'investor_search': (snapshot.investor_vocabulary['investor'], snapshot.investor_vocabulary['deals'])
+    }
+    for structure, (names, activity) in search_names.items():
+        record(f'snapshot.{structure}', rows, measure(
+            lambda: SearchIndex(names, activity), repeat, cold=lambda: None
+        ))
+
+    samples = sample_arguments(provider)
+    for cls in ANALYSIS_CLASSES:
+        analysis = cls(provider)
+        for name, function in public_methods(cls):
+            arguments = _arguments(function, samples)
+            method = getattr(analysis, name)
+
+            # The first call also builds the indexes the method relies on
+            clear_caches()
+            start = time.perf_counter()
+            method(*arguments)
+            first = time.perf_counter() - start
+
+            measurement = measure(lambda: method(*arguments), repeat)
+            record(f'{cls.__name__}.{name}', rows, {'first_seconds': first, **measurement})
+
+    return results
+
+
+def run(scales=DEFAULT_SCALES, repeat=DEFAULT_REPEAT, synthetic=False, progress=None):
+    """
+    Runs the benchmarks at every scale.
+
+    The scaled snapshots are written to a temporary directory, removed at the end.
+
+    Args:
+        scales (tuple): Scales of the dataset, see `benchmarks.scale`.
+        repeat (int): Number of timed cold runs per method.
+        synthetic (bool): Use synthetic data instead of renamed replicas.
+        progress (callable, optional): Called with every result.
+
+    Returns:
+        dict: Environment of the run and the list of `results`.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in scales:
+            write = write_synthetic if synthetic else write_scaled
+            provider = scaled_provider(write(scale, directory))
+            results += benchmark_scale(provider, scale, repeat, progress)
+            clear_caches()
+
+    return {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'data': 'synthetic' if synthetic else 'replicas',
+        'results': results
+    }
+
+
+def save(run_result, path):
+    """
+    Writes the results of a run as JSON.
+
+    Args:
+        run_result (dict): The results, see `run`.
+        path (str): Path of the JSON file.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(run_result, file, indent=2)
+
+
+def compare(baseline, current):
+    """
+    Compares the cold timings of two runs, case by case and scale by scale.
+
+    Args:
+        baseline (dict): Results of the reference run, see `run`.
+        current (dict): Results of the new run.
+
+    Returns:
+        pandas.DataFrame: `case`, `scale`, baseline and current `seconds` and
+            `peak_bytes`, and the `ratio` of the timings, slowest regressions first.
+    """
+    keys = ['case', 'scale']
+    columns = keys + ['seconds', 'peak_bytes']
+    merged = pd.DataFrame(baseline['results'])[columns].merge(
+        pd.DataFrame(current['results'])[columns],
+        on=keys,
+        suffixes=('_baseline', '_current')
+    )
+    merged['ratio'] = merged['seconds_current'] / merged['seconds_baseline']
+
+    return merged.sort_values('ratio', ascending=False, ignore_index=True)
@@ -0,0 +1,100 @@
+"""
+Module: Figure Cache
+
+This module provides a memoized store of Plotly figures for the components.
+Figures are kept as built `plotly.graph_objects.Figure` objects under a key
+made of the chart id, the chart parameters and the dataset fingerprint, so
+repeat views of the same chart skip building and validating the Plotly
+figure, and a data refresh invalidates every cached figure. Streamlit takes
+an already validated figure as is, it is only serialized for display. Cached
+figures are shared between sessions and must not be modified.
+
+Usage:
+    FIGURE_CACHE.render(
+        ('overall.most_funded_sector', (), fingerprint),
+        lambda: go.Figure(...)
+    )
+
+Dependencies:
+- streamlit (st)
+- analysis.cache (LRUCache)
+- analysis.instrumentation
+
+Author: Abhishek Gupta
+Github: https://github.com/1abhi6
+"""
+
+import streamlit as st
+
+from analysis.cache import LRUCache
+from analysis.instrumentation import note_cache, timed
+
+DEFAULT_MAXSIZE = 256
+
+
+class FigureCache:
+    """
+    Size capped LRU store of built Plotly figures with hit/miss counters.
+
+    Methods:
+        __init__: Initializes the FigureCache class.
+        get_or_build: Returns the figure of a key, building it on a miss.
+        render: Displays the figure of a key in the Streamlit app.
+        info: Returns the size and the hit/miss counters.
+        clear: Removes every cached figure.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        """
+        Initialize the FigureCache class.
+
+        Args:
+            maxsize (int): Maximum number of cached figures.
+        """
+        self._figures = LRUCache(maxsize)
+
+    @timed()
+    def get_or_build(self, key, build):
+        """
+        Returns the figure of a key, building it on a miss.
+
+        Args:
+            key (tuple): Chart id, chart parameters and dataset fingerprint.
+            build (callable): Returns the `plotly.graph_objects.Figure` on a miss.
+
+        Returns:
+            plotly.graph_objects.Figure: The shared figure, it must not be modified.
+        """
+        figure = self._figures.get(key)
+        note_cache(figure is not None)
+        if figure is None:
+            figure = build()
+            self._figures.put(key, figure)
+
+        return figure
+
+    def render(self, key, build):
+        """
+        Displays the figure of a key in the Streamlit app.
+
+        Args:
+            key (tuple): Chart id, chart parameters and dataset fingerprint.
+            build (callable): Returns the `plotly.graph_objects.Figure` on a miss.
+        """
+        st.plotly_chart(self.get_or_build(key, build), use_container_width=True)
+
+    def info(self):
+        """
+        Returns the size and the hit/miss counters.
+
+        Returns:
+            dict: `hits`, `misses`, `size` and `maxsize` of the cache.
+        """
+        return self._figures.info()
+
+    def clear(self):
+        """Removes every cached figure."""
+        self._figures.clear()
+
+
+FIGURE_CACHE = FigureCache()
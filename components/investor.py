@@ -6,11 +6,13 @@ It provides interactive visualizations and insights about an investor's investme
 and related information.
 
 The application utilizes the `streamlit` and `plotly` libraries for creating
-the user interface and visualizations.
+the user interface and visualizations. Figures are memoized per investor in
+the figure cache of the `components.figure_cache` module.
 
 Usage:
     1. Instantiate the `Investor` class.
-    2. Call the desired methods to display specific analysis results.
+    2. Compute the investor's profile with `Investor.profile`.
+    3. Pass the profile to the desired methods to display specific analysis results.
 
 Author: Abhishek Gupta
 Github: https://github.com/1abhi6
@@ -21,6 +23,8 @@ import streamlit as st
 import plotly.express as px
 
 from analysis import Investor as InvestorAnalysis
+from analysis.instrumentation import timed
+from components.figure_cache import FIGURE_CACHE
 
 
 class Investor:
@@ -30,137 +34,179 @@ class Investor:
         """Initialize the Investor class."""
         self.investor_analysis = InvestorAnalysis()
 
-    def recent_five_investments(self, investor_name):
-        """Display the five most recent investments of the investor.
+    @timed()
+    def profile(self, investor_name):
+        """Compute everything the investor page shows in one call.
 
         Args:
             investor_name (str): The name of the investor.
 
+        Returns:
+            analysis.InvestorProfile: The profile rendered by the other methods.
+        """
+        return self.investor_analysis.profile(investor_name)
+
+    def figure_key(self, chart_id, profile):
+        """Return the figure cache key of an investor chart for the current dataset.
+
+        Args:
+            chart_id (str): Identifier of the chart.
+            profile (analysis.InvestorProfile): The profile of the investor.
+
+        Returns:
+            tuple: Chart id, chart parameters and dataset fingerprint.
+        """
+        return (
+            'investor.' + chart_id,
+            (profile.name,),
+            self.investor_analysis.provider.get().fingerprint
+        )
+
+    @timed()
+    def recent_five_investments(self, profile):
+        """Display the five most recent investments of the investor.
+
+        Args:
+            profile (analysis.InvestorProfile): The profile of the investor.
+
         Returns:
             None
         """
         st.subheader(
             'Most Recent Investments',
-            help=f"{investor_name}'s five most recent investments."
+            help=f"{profile.name}'s five most recent investments."
         )
-        st.dataframe(self.investor_analysis.recent_five_investments(investor_name))
+        st.dataframe(profile.recent_investments)
 
-    def plot_biggest_investment(self, investor_name):
+    @timed()
+    def plot_biggest_investment(self, profile):
         """Plot a bar chart of the investor's biggest investments in terms of amount.
 
         Args:
-            investor_name (str): The name of the investor.
+            profile (analysis.InvestorProfile): The profile of the investor.
 
         Returns:
             None
         """
         st.subheader(
             'Biggest Investments',
-            help=f"{investor_name}'s biggest investments in terms of amount."
+            help=f"{profile.name}'s biggest investments in terms of amount."
+        )
+        FIGURE_CACHE.render(
+            self.figure_key('biggest_investments', profile),
+            lambda: px.bar(profile.biggest_investments, x='name', y='amount')
         )
-        biggest_investment_df = self.investor_analysis.biggest_investment(investor_name)
-        fig = px.bar(biggest_investment_df, x='name', y='amount')
-        st.plotly_chart(fig, use_container_width=True)
 
-    def plot_invested_sector(self, investor_name):
+    @timed()
+    def plot_invested_sector(self, profile):
         """Plot a pie chart of the investor's most invested sector.
 
         Args:
-            investor_name (str): The name of the investor.
+            profile (analysis.InvestorProfile): The profile of the investor.
 
         Returns:
             None
         """
         st.subheader(
             'Sector Invested in',
-            help=f"{investor_name}'s most invested sector."
+            help=f"{profile.name}'s most invested sector."
+        )
+        FIGURE_CACHE.render(
+            self.figure_key('sectors', profile),
+            lambda: px.pie(profile.sectors, values='amount', names='vertical')
         )
-        sector_df = self.investor_analysis.invested_sector(investor_name)
-        fig = px.pie(sector_df, values='amount', names='vertical')
-        st.plotly_chart(fig, use_container_width=True)
 
-    def plot_invested_subsector(self, investor_name):
+    @timed()
+    def plot_invested_subsector(self, profile):
         """Plot a pie chart of the investor's most invested subsector.
 
         Args:
-            investor_name (str): The name of the investor.
+            profile (analysis.InvestorProfile): The profile of the investor.
 
         Returns:
             None
         """
         st.subheader(
             'Subsector Invested in',
-            help=f"{investor_name}'s most invested subsector."
+            help=f"{profile.name}'s most invested subsector."
+        )
+        FIGURE_CACHE.render(
+            self.figure_key('subsectors', profile),
+            lambda: px.pie(profile.subsectors, values='amount', names='subvertical')
         )
-        subsector_df = self.investor_analysis.invested_subsector(investor_name)
-        fig = px.pie(subsector_df, values='amount', names='subvertical')
-        st.plotly_chart(fig, use_container_width=True)
 
-    def plot_invested_city(self, investor_name):
+    @timed()
+    def plot_invested_city(self, profile):
         """Plot a pie chart of the investor's most invested city.
 
         Args:
-            investor_name (str): The name of the investor.
+            profile (analysis.InvestorProfile): The profile of the investor.
 
         Returns:
             None
         """
         st.subheader(
             'City Invested in',
-            help=f"{investor_name}'s most invested city."
+            help=f"{profile.name}'s most invested city."
+        )
+        FIGURE_CACHE.render(
+            self.figure_key('cities', profile),
+            lambda: px.pie(profile.cities, values='amount', names='city')
         )
-        city_df = self.investor_analysis.invested_city(investor_name)
-        fig = px.pie(city_df, values='amount', names='city')
-        st.plotly_chart(fig, use_container_width=True)
 
-    def plot_invested_type(self, investor_name):
+    @timed()
+    def plot_invested_type(self, profile):
         """Plot a pie chart of the investor's investment types.
 
         Args:
-            investor_name (str): The name of the investor.
+            profile (analysis.InvestorProfile): The profile of the investor.
 
         Returns:
             None
         """
         st.subheader(
             'Investment Type',
-            help=f"{investor_name}'s stage of investments."
+            help=f"{profile.name}'s stage of investments."
+        )
+        FIGURE_CACHE.render(
+            self.figure_key('types', profile),
+            lambda: px.pie(profile.types, values='amount', names='type')
         )
-        investment_type_df = self.investor_analysis.invested_type(investor_name)
-        fig = px.pie(investment_type_df, values='amount', names='type')
-        st.plotly_chart(fig, use_container_width=True)
 
-    def plot_yoy_investment(self, investor_name):
+    @timed()
+    def plot_yoy_investment(self, profile):
         """Plot a line chart of the investor's year-on-year investments.
 
         Args:
-            investor_name (str): The name of the investor.
+            profile (analysis.InvestorProfile): The profile of the investor.
 
         Returns:
             None
         """
         st.subheader(
             'YOY investment',
-            help=f"{investor_name}'s year-on-year investments."
+            help=f"{profile.name}'s year-on-year investments."
+        )
+        FIGURE_CACHE.render(
+            self.figure_key('yoy', profile),
+            lambda: px.line(profile.yoy, x="year", y="amount")
         )
-        yoy_investment_df = self.investor_analysis.yoy_investment(investor_name)
-        fig = px.line(yoy_investment_df, x="year", y="amount")
-        st.plotly_chart(fig, use_container_width=True)
 
-    def similar_investors(self,investor_name):
-        """Displays the name of four random investors.
+    @timed()
+    def similar_investors(self, profile):
+        """Displays the names of the four most similar investors.
 
         Args:
-            investor_name (str): The name of the investor.
+            profile (analysis.InvestorProfile): The profile of the investor.
 
         Returns:
             None
         """
-        similar_investors = self.investor_analysis.get_similar_investors(investor_name)
+        similar_investors = profile.similar_investors
 
         st.subheader(
             'Similar Investors',
-            help=f"These investors have invested in the same sectors as {investor_name}."
+            help=f"These investors have invested in the same sectors as {profile.name}."
         )
         st.write('')
         col0, col1, col2, col3 = st.columns(4)
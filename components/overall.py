@@ -11,7 +11,8 @@ Classes:
 - Overall: Class for handling overall analysis and plotting of startup data.
 
 The module also imports the `Overall` class from the `analysis` module,
-which contains the actual data analysis functions.
+which contains the actual data analysis functions. Figures are memoized in
+the figure cache of the `components.figure_cache` module.
 
 Author: Abhishek Gupta
 Github: https://github.com/1abhi6
@@ -23,6 +24,8 @@ import plotly.graph_objects as go
 import pandas as pd
 
 from analysis import Overall as OverallAnalysis
+from analysis.instrumentation import timed
+from components.figure_cache import FIGURE_CACHE
 
 
 class PlotHorizontalBarChart:
@@ -34,7 +37,8 @@ class PlotHorizontalBarChart:
             y_axis: pd.Series,
             layout_title,
             layout_x_axis: str,
-            layout_yaxis: str) -> None:
+            layout_yaxis: str,
+            cache_key: tuple) -> None:
         """
         Initialize the PlotHorizontalBarChart class.
 
@@ -44,26 +48,36 @@ class PlotHorizontalBarChart:
             layout_title: The title of the chart.
             layout_x_axis: The label for the x-axis.
             layout_yaxis: The label for the y-axis.
+            cache_key (tuple): Key of the chart in the figure cache.
         """
-        fig = go.Figure(data=go.Bar(
-            x=x_axis,
-            y=y_axis,
-            orientation='h'
-        ))
+        def build():
+            fig = go.Figure(data=go.Bar(
+                x=x_axis,
+                y=y_axis,
+                orientation='h'
+            ))
 
-        fig.update_layout(
-            title=layout_title,
-            xaxis=dict(title=layout_x_axis),
-            yaxis=dict(title=layout_yaxis)
-        )
+            fig.update_layout(
+                title=layout_title,
+                xaxis=dict(title=layout_x_axis),
+                yaxis=dict(title=layout_yaxis)
+            )
+
+            return fig
 
-        st.plotly_chart(fig, use_container_width=True)
+        FIGURE_CACHE.render(cache_key, build)
 
 
 class PlotLineChart:
     """Class to plot a line chart."""
 
-    def __init__(self, temp_df: str, x_axis: str, y_axis: str, layout_title: str) -> None:
+    def __init__(
+            self,
+            temp_df: str,
+            x_axis: str,
+            y_axis: str,
+            layout_title: str,
+            cache_key: tuple) -> None:
         """
         Initialize the PlotLineChart class.
 
@@ -72,16 +86,18 @@ class PlotLineChart:
             x_axis (str): The column name for the x-axis.
             y_axis (str): The column name for the y-axis.
             layout_title (str): The title of the chart.
+            cache_key (tuple): Key of the chart in the figure cache.
         """
-        fig = px.line(
-            temp_df,
-            x=x_axis,
-            y=y_axis,
-            title=layout_title
+        FIGURE_CACHE.render(
+            cache_key,
+            lambda: px.line(
+                temp_df,
+                x=x_axis,
+                y=y_axis,
+                title=layout_title
+            )
         )
 
-        st.plotly_chart(fig, use_container_width=True)
-
 
 class SubHeader:
     """Class to display a subheader with a tooltip."""
@@ -104,6 +120,18 @@ class Overall:
         """Initialize the Overall class."""
         self.overall_analysis = OverallAnalysis()
 
+    def figure_key(self, chart_id):
+        """Return the figure cache key of a chart for the current dataset.
+
+        Args:
+            chart_id (str): Identifier of the chart.
+
+        Returns:
+            tuple: Chart id, chart parameters and dataset fingerprint.
+        """
+        return ('overall.' + chart_id, (), self.overall_analysis.provider.get().fingerprint)
+
+    @timed()
     def plot_total_funding_mom(self):
         """Plot the total amount of funding in Indian startups month over month."""
         temp_df = self.overall_analysis.total_funding_mom()
@@ -117,9 +145,11 @@ class Overall:
             temp_df=temp_df,
             x_axis='MM-YYYY',
             y_axis='Total Funding (In Crore Rs.)',
-            layout_title='Total funding in Startups in MM-YYYY'
+            layout_title='Total funding in Startups in MM-YYYY',
+            cache_key=self.figure_key('total_funding_mom')
         )
 
+    @timed()
     def plot_total_funded_startup_mom(self):
         """Plot the total number of funded Indian startups month over month."""
         temp_df = self.overall_analysis.total_funded_startup_mom()
@@ -133,9 +163,11 @@ class Overall:
             temp_df=temp_df,
             x_axis='MM-YYYY',
             y_axis='Total Funded Startups',
-            layout_title='Total Funded Startups in MM-YYYY'
+            layout_title='Total Funded Startups in MM-YYYY',
+            cache_key=self.figure_key('total_funded_startup_mom')
         )
 
+    @timed()
     def plot_most_funded_sector(self):
         """Plot the top 10 most funded sectors between 2015 to 2020."""
         most_funded_sectors = self.overall_analysis.most_funded_sector()
@@ -150,9 +182,11 @@ class Overall:
             y_axis=most_funded_sectors['vertical'],
             layout_title='Top 10 Most Funded Sectors',
             layout_x_axis='Funding Amount (In Crore Rs)',
-            layout_yaxis='Sector'
+            layout_yaxis='Sector',
+            cache_key=self.figure_key('most_funded_sector')
         )
 
+    @timed()
     def plot_most_funded_type(self):
         """Plot the top 10 most funded types of rounds in startup funding."""
         most_funded_type = self.overall_analysis.most_funded_type()
@@ -167,9 +201,11 @@ class Overall:
             y_axis=most_funded_type['type'],
             layout_title='Top 10 Most Funded Types of Rounds',
             layout_x_axis='Funding Amount (In Crore Rs)',
-            layout_yaxis='Type of Investment'
+            layout_yaxis='Type of Investment',
+            cache_key=self.figure_key('most_funded_type')
         )
 
+    @timed()
     def plot_most_funded_cities(self):
         """Plot the top 10 most funded cities in startup funding."""
         most_funded_city = self.overall_analysis.most_funded_cities()
@@ -184,9 +220,11 @@ class Overall:
             y_axis=most_funded_city['city'],
             layout_title='Most Funded Cities',
             layout_x_axis='Funding Amount (In Crore Rs)',
-            layout_yaxis='City'
+            layout_yaxis='City',
+            cache_key=self.figure_key('most_funded_cities')
         )
 
+    @timed()
     def plot_most_funded_startups_yoy(self):
         """Plot the top 10 most funded startups year over year."""
         most_funded_startup_yoy = self.overall_analysis.most_funded_startups_yoy()
@@ -196,15 +234,17 @@ class Overall:
             tooltip='Top 10 most funded startups in startup funding YoY'
         )
 
-        fig = px.bar(
-            most_funded_startup_yoy,
-            x='StartUp Name',
-            y='Amount (In Crore Rs)',
-            color='Year'
+        FIGURE_CACHE.render(
+            self.figure_key('most_funded_startups_yoy'),
+            lambda: px.bar(
+                most_funded_startup_yoy,
+                x='StartUp Name',
+                y='Amount (In Crore Rs)',
+                color='Year'
+            )
         )
 
-        st.plotly_chart(fig, use_container_width=True)
-
+    @timed()
     def plot_top_investors(self):
         """Plot the top investors based on their investment values."""
         top_investors = self.overall_analysis.top_investors()
@@ -219,9 +259,11 @@ class Overall:
             y_axis=top_investors['investors'],
             layout_title='Top Most Investors',
             layout_x_axis='Funding Amount (In Crore Rs)',
-            layout_yaxis='Investor'
+            layout_yaxis='Investor',
+            cache_key=self.figure_key('top_investors')
         )
 
+    @timed()
     def plot_funding_amount_year_month(self):
         """Plot the funding amount by year and month."""
         pivot_table = self.overall_analysis.funding_amount_year_month()
@@ -231,19 +273,21 @@ class Overall:
             tooltip='Heatmap to show the funding amount by year and month.'
         )
 
-        # Plotting the heatmap
-        heatmap = go.Heatmap(
-            x=pivot_table.columns,
-            y=pivot_table.index,
-            z=pivot_table.values,
-            colorscale='Viridis'
-        )
+        def build():
+            # Plotting the heatmap
+            heatmap = go.Heatmap(
+                x=pivot_table.columns,
+                y=pivot_table.index,
+                z=pivot_table.values,
+                colorscale='Viridis'
+            )
 
-        layout = go.Layout(
-            title='Funding Amount by Year and Month',
-            xaxis={'title': 'Month'},
-            yaxis={'title': 'Year'}
-        )
+            layout = go.Layout(
+                title='Funding Amount by Year and Month',
+                xaxis={'title': 'Month'},
+                yaxis={'title': 'Year'}
+            )
+
+            return go.Figure(data=[heatmap], layout=layout)
 
-        fig = go.Figure(data=[heatmap], layout=layout)
-        st.plotly_chart(fig, use_container_width=True)
+        FIGURE_CACHE.render(self.figure_key('funding_amount_year_month'), build)
@@ -23,6 +23,7 @@ Github: https://github.com/1abhi6
 
 import streamlit as st
 from analysis import Startup as StartupAnalysis
+from analysis.instrumentation import timed
 
 class Startup:
     """
@@ -35,22 +36,26 @@ class Startup:
         """
         self.startup_analysis = StartupAnalysis()
 
-    def similar_startups(self, startup_name):
+    @timed()
+    def similar_startups(self, startup_name, similar_startups=None):
         """
         Displays similar startups in the Streamlit application for a given startup name.
 
         Args:
             startup_name (str): The name of the startup.
+            similar_startups (list, optional): Already computed similar startups,
+                for example from `StartupProfile`. Looked up when omitted.
 
         Returns:
             None
         """
-        similar_startups = self.startup_analysis.similar_startups(startup_name)
+        if similar_startups is None:
+            similar_startups = self.startup_analysis.similar_startups(startup_name)
 
         # Display the header for similar startups section
         st.subheader(
             'Similar Startups',
-            help=f"These startups belong to the same sector as {startup_name}."
+            help=f"These startups are the closest to {startup_name} by sector, city, stage and funding."
         )
         st.write('')
 
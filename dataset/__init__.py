@@ -1 +1,16 @@
-from dataset.dataset import startup
\ No newline at end of file
+"""
+The `dataset` package provides the shared, lazily loaded startup dataset.
+
+Use `get_snapshot()` (or `provider.get()`) to access the read-only snapshot.
+The `startup` attribute is kept for backwards compatibility and loads the
+dataset on first access.
+"""
+
+from dataset.dataset import DatasetProvider, Snapshot, get_snapshot, provider
+
+
+def __getattr__(name):
+    # Keep `from dataset import startup` working without loading at import time
+    if name == 'startup':
+        return provider.get().frame
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
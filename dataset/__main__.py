@@ -0,0 +1,93 @@
+"""
+Command line entry point of the dataset package.
+
+Usage:
+    python -m dataset [snapshot]
+    python -m dataset ingest [RAW_PATH] [CSV_PATH]
+    python -m dataset stream [RAW_PATH] [SNAPSHOT_PATH] [--chunksize N]
+    python -m dataset synthetic OUTPUT_PATH [--rows N] [--chunksize N] [--seed N]
+
+`snapshot` (the default) builds the Parquet snapshot of the cleaned startup
+dataset. `ingest` cleans the raw funding export into a cleaned CSV, and
+`stream` cleans it chunk by chunk straight into a Parquet snapshot, for
+exports too large to load at once. Both write next to the dataset of the
+app by default, see `dataset.ingest`. `synthetic` writes a synthetic
+dataset learned from the real one, as a Parquet snapshot when OUTPUT_PATH
+ends with `.parquet` and as a cleaned CSV otherwise. The SQLite file of the
+`sqlite` storage backend is written by `python -m analysis sqlite`, which
+adds the similar entities, see `dataset.store`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import argparse
+
+from dataset.ingest import (
+    DEFAULT_CHUNKSIZE, INGESTED_CSV_PATH, INGESTED_SNAPSHOT_PATH, RAW_PATH, ingest, ingest_stream
+)
+from dataset.snapshot import CSV_PATH, SNAPSHOT_PATH, build_snapshot
+from dataset import synthetic
+
+parser = argparse.ArgumentParser(prog='python -m dataset')
+commands = parser.add_subparsers(dest='command')
+
+snapshot_parser = commands.add_parser('snapshot', help='build the Parquet snapshot')
+snapshot_parser.add_argument('csv_path', nargs='?', default=CSV_PATH)
+snapshot_parser.add_argument('snapshot_path', nargs='?', default=SNAPSHOT_PATH)
+
+ingest_parser = commands.add_parser('ingest', help='clean the raw funding export')
+ingest_parser.add_argument('raw_path', nargs='?', default=RAW_PATH)
+ingest_parser.add_argument('csv_path', nargs='?', default=INGESTED_CSV_PATH)
+
+stream_parser = commands.add_parser('stream', help='stream the raw funding export into a snapshot')
+stream_parser.add_argument('raw_path', nargs='?', default=RAW_PATH)
+stream_parser.add_argument('snapshot_path', nargs='?', default=INGESTED_SNAPSHOT_PATH)
+stream_parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+
+synthetic_parser = commands.add_parser('synthetic', help='write a synthetic dataset')
+synthetic_parser.add_argument('output_path')
+synthetic_parser.add_argument('--rows', type=int, default=synthetic.DEFAULT_ROWS)
+synthetic_parser.add_argument('--chunksize', type=int, default=synthetic.DEFAULT_CHUNKSIZE)
+synthetic_parser.add_argument('--seed', type=int, default=None)
+
+
+def main():
+    """Runs the selected dataset command, building the snapshot by default."""
+    args = parser.parse_args()
+
+    if args.command == 'ingest':
+        rows = ingest(args.raw_path, args.csv_path)
+        print(f'{rows} cleaned rows written to {args.csv_path}')
+    elif args.command == 'stream':
+        result = ingest_stream(
+            args.raw_path,
+            args.snapshot_path,
+            args.chunksize,
+            progress=lambda read, written, seconds: print(
+                f'{read} rows read, {written} written, {read / seconds:,.0f} rows/s'
+            )
+        )
+        print(
+            f'{result.rows_written} cleaned rows written to {args.snapshot_path} '
+            f'in {result.seconds:.2f}s ({result.throughput:,.0f} rows/s)'
+        )
+    elif args.command == 'synthetic':
+        seconds = synthetic.generate(
+            args.output_path,
+            args.rows,
+            args.chunksize,
+            args.seed,
+            progress=lambda written, seconds: print(
+                f'{written} rows written, {written / seconds:,.0f} rows/s'
+            )
+        )
+        print(f'{args.rows} synthetic rows written to {args.output_path} in {seconds:.2f}s')
+    else:
+        csv_path = getattr(args, 'csv_path', CSV_PATH)
+        snapshot_path = getattr(args, 'snapshot_path', SNAPSHOT_PATH)
+        print(f'Snapshot written to {build_snapshot(csv_path, snapshot_path)}')
+
+
+if __name__ == '__main__':
+    main()
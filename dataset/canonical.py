@@ -0,0 +1,175 @@
+"""
+Module: Entity Canonicalization
+
+This module merges the spelling variants of cities, investors, verticals and
+round types into one canonical name each, for example "Bengaluru" into
+"Bangalore" or "Softbank" into "SoftBank Group". It runs once at load time,
+so every downstream groupby and index sees clean keys at no per-query cost.
+
+The mapping table is `canonical_names.csv` with the columns:
+- kind: one of `city`, `investor`, `vertical` or `round`,
+- alias: the spelling found in the data,
+- canonical: the name it is replaced with.
+
+Analysts extend the table by adding rows, no code change is needed. The
+table is part of the dataset fingerprint, so cached results are invalidated
+when it changes.
+
+Since the string columns are categoricals, the replacement is applied to
+their dictionaries (the distinct values) and the codes are remapped, instead
+of rewriting every row. Investor strings are separated canonically once,
+when the snapshot is built (see `normalize_investors`), so at load time only
+the strings that contain an investor alias are rewritten.
+
+Dependencies:
+- os
+- re
+- numpy (np)
+- pandas (pd)
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+CANONICAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'canonical_names.csv')
+
+# Mapping table kind to the dataset column it applies to
+KIND_COLUMNS = {
+    'city': 'city',
+    'vertical': 'vertical',
+    'round': 'type'
+}
+INVESTOR_KIND = 'investor'
+INVESTOR_SEPARATOR = ', '
+
+
+def read_mappings(canonical_path=CANONICAL_PATH):
+    """
+    Reads the mapping table.
+
+    Args:
+        canonical_path (str): Path of the mapping table.
+
+    Returns:
+        dict: Kind to a dict of alias to canonical name. Empty when the
+            table does not exist.
+    """
+    if not os.path.exists(canonical_path):
+        return {}
+
+    table = pd.read_csv(canonical_path, dtype=str).dropna()
+    for column in table.columns:
+        table[column] = table[column].str.strip()
+
+    return {
+        kind: dict(zip(rows['alias'], rows['canonical']))
+        for kind, rows in table.groupby('kind')
+    }
+
+
+def _recode(values, categories):
+    """
+    Replaces the categories of a categorical by new, possibly repeated, values.
+
+    Args:
+        values (pandas.Series): Categorical column.
+        categories (pandas.Index): The new value of each current category.
+
+    Returns:
+        pandas.Series: Categorical column with sorted, unique categories.
+    """
+    new_categories = pd.Index(categories.dropna().unique()).sort_values()
+    # Look up through a separate index, the hash table built for the lookup
+    # would otherwise stay on the categories and grow every recoded column
+    lookup = pd.Index(new_categories.array).get_indexer(categories)
+
+    codes = values.cat.codes.to_numpy()
+    codes = np.where(codes >= 0, lookup[codes], -1)
+
+    return pd.Series(
+        pd.Categorical.from_codes(codes, new_categories),
+        index=values.index,
+        name=values.name
+    )
+
+
+def normalize_investors(investors):
+    """
+    Separates the names of comma separated investor strings by ", ", without
+    surrounding spaces or empty names.
+
+    Args:
+        investors (pandas.Series): Comma separated investor strings.
+
+    Returns:
+        pandas.Series: The normalized strings, missing when no name is left.
+    """
+    investors = investors.str.replace(r'\s*,[\s,]*', INVESTOR_SEPARATOR, regex=True)
+    investors = investors.str.strip().str.strip(',').str.strip()
+
+    return investors.mask(investors == '')
+
+
+def canonical_investors(investors, mapping):
+    """
+    Replaces the investor aliases found in normalized investor strings.
+
+    Only the strings containing an alias are rewritten. They are found with
+    one vectorized regular expression over all the aliases.
+
+    Args:
+        investors (pandas.Index): Investor strings, see `normalize_investors`.
+        mapping (dict): Investor alias to canonical name.
+
+    Returns:
+        pandas.Index: The canonical investor strings.
+    """
+    aliases = '|'.join(map(re.escape, sorted(mapping, key=len, reverse=True)))
+    separator = re.escape(INVESTOR_SEPARATOR)
+
+    investors = pd.Series(investors)
+    found = investors.str.contains(f'(?:^|{separator})(?:{aliases})(?:{separator}|$)', na=False)
+    investors[found] = investors[found].str.replace(
+        re.compile(f'(?:^|(?<={separator}))(?:{aliases})(?={separator}|$)'),
+        lambda match: mapping[match.group(0)],
+        regex=True
+    )
+
+    return pd.Index(investors)
+
+
+def canonicalize(startup, mappings):
+    """
+    Replaces the aliases of every categorical column by their canonical names.
+
+    Args:
+        startup (pandas.DataFrame): The compact startup dataset, see
+            `dataset.snapshot.compact`.
+        mappings (dict): Kind to a dict of alias to canonical name,
+            see `read_mappings`.
+
+    Returns:
+        pandas.DataFrame: The dataset with canonical names.
+    """
+    startup = startup.copy(deep=False)
+
+    for kind, column in KIND_COLUMNS.items():
+        mapping = mappings.get(kind)
+        if mapping:
+            categories = startup[column].cat.categories.to_series().replace(mapping)
+            startup[column] = _recode(startup[column], pd.Index(categories))
+
+    mapping = mappings.get(INVESTOR_KIND)
+    if mapping:
+        startup['investors'] = _recode(
+            startup['investors'],
+            canonical_investors(startup['investors'].cat.categories, mapping)
+        )
+
+    return startup
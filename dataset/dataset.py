@@ -1,19 +1,319 @@
 """
 Module: Startup Data Processing
 
-This module reads a cleaned startup dataset from a CSV file and performs
-data processing operations on it.
+This module provides the single shared handle on the cleaned startup dataset.
+Nothing is read at import time: the dataset is loaded on first access through
+the module level `provider`, and every consumer receives the same read-only
+`Snapshot`, so a process holds exactly one copy of the data.
+
+Every snapshot carries a fingerprint of the dataset files it was loaded from.
+The provider checks the fingerprint on access and reloads the data once the
+files change, so caches keyed on the fingerprint never serve stale results.
+
+The typed Parquet snapshot built by `dataset.snapshot` is used whenever it is
+fresher than the CSV, otherwise the CSV is parsed and the date columns are
+derived.
+
+The storage backend is chosen with the environment variable
+`STARTUP_BACKEND`: `pandas` (the default) holds the dataset in memory,
+`sqlite` answers the same snapshot interface from a SQLite file, see
+`dataset.store`.
 
 Dependencies:
-- pandas (pd)
+- os
+- threading
+- dataset.canonical
+- dataset.indexes
+- dataset.snapshot
+- dataset.store (only for the sqlite backend)
+- dataset.tables
 
 Author: Bibek kumar panda
 Github: https://github.com/Bibek-9078
 """
 
-import pandas as pd
+import os
+import threading
+
+from dataset.canonical import CANONICAL_PATH
+from dataset.snapshot import (
+    CSV_PATH, SNAPSHOT_PATH, frame_fingerprint, load, source_fingerprint
+)
+from dataset.indexes import EMPTY_POSITIONS, build_investor_index, build_name_index
+from dataset.tables import (
+    build_investor_deals, build_investor_vocabulary, build_monthly_cube, build_startup_years
+)
+
+BACKEND_VARIABLE = 'STARTUP_BACKEND'
+SQLITE_PATH_VARIABLE = 'STARTUP_SQLITE_PATH'
+BACKENDS = ('pandas', 'sqlite')
+
+
+class Snapshot:
+    """
+    Read-only view of a loaded startup dataset.
+
+    Structures derived from the dataset (indexes, aggregates) are built once
+    through `derive` and kept on the snapshot, so they live exactly as long as
+    the data they were computed from.
+
+    Attributes:
+        frame (pandas.DataFrame): The startup dataset. It must not be modified.
+        fingerprint (str): Identifies the version of the dataset.
+        investor_deals (pandas.DataFrame): One row per investor on each deal.
+        investor_index (dict): Investor name to the row positions of their deals.
+        investor_vocabulary (pandas.DataFrame): Deal count and total amount per investor.
+        name_index (dict): Startup name to the row positions of its funding rounds.
+        monthly_cube (pandas.DataFrame): Funding by year, month, vertical, city and type.
+        startup_years (pandas.DataFrame): Funding by year and startup.
+        startup_rounds (pandas.Series): Number of rounds per startup name.
+
+    Methods:
+        startup_rows: Returns the rounds of a startup.
+        investor_rows: Returns the deals of an investor.
+        similar: Returns the most similar entities of a startup or investor.
+        derive: Returns a structure derived from the dataset, building it on first use.
+    """
+
+    __slots__ = ('_frame', '_fingerprint', '_derived', '_lock')
+
+    def __init__(self, frame, fingerprint=None):
+        """
+        Initialize the Snapshot class.
+
+        Args:
+            frame (pandas.DataFrame): The loaded startup dataset.
+            fingerprint (str, optional): Version of the dataset. Computed from
+                the content of the frame when omitted.
+        """
+        if fingerprint is None:
+            fingerprint = frame_fingerprint(frame)
+
+        object.__setattr__(self, '_frame', frame)
+        object.__setattr__(self, '_fingerprint', fingerprint)
+        object.__setattr__(self, '_derived', {})
+        object.__setattr__(self, '_lock', threading.RLock())
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Snapshot is read-only')
+
+    @property
+    def frame(self):
+        """pandas.DataFrame: The startup dataset."""
+        return self._frame
+
+    @property
+    def fingerprint(self):
+        """str: Identifies the version of the dataset."""
+        return self._fingerprint
+
+    @property
+    def investor_deals(self):
+        """pandas.DataFrame: One row per investor on each deal, see `dataset.tables`."""
+        return self.derive('investor_deals', build_investor_deals)
+
+    @property
+    def investor_index(self):
+        """dict: Investor name to the row positions of their deals, see `dataset.indexes`."""
+        return self.derive(
+            'investor_index',
+            lambda frame: build_investor_index(self.investor_deals)
+        )
+
+    @property
+    def investor_vocabulary(self):
+        """pandas.DataFrame: Every investor with their deal count and total amount, see `dataset.tables`."""
+        return self.derive(
+            'investor_vocabulary',
+            lambda frame: build_investor_vocabulary(self.investor_deals)
+        )
+
+    @property
+    def name_index(self):
+        """dict: Startup name to the row positions of its rounds, see `dataset.indexes`."""
+        return self.derive('name_index', build_name_index)
+
+    @property
+    def monthly_cube(self):
+        """pandas.DataFrame: Funding by year, month, vertical, city and type, see `dataset.tables`."""
+        return self.derive('monthly_cube', build_monthly_cube)
+
+    @property
+    def startup_years(self):
+        """pandas.DataFrame: Funding by year and startup, see `dataset.tables`."""
+        return self.derive('startup_years', build_startup_years)
+
+    @property
+    def startup_rounds(self):
+        """pandas.Series: Number of rounds per startup name, sorted by name."""
+        return self.derive(
+            'startup_rounds',
+            lambda frame: frame.groupby('name', observed=True).size()
+        )
+
+    def startup_rows(self, startup_name):
+        """
+        Returns the rounds of a startup through the name index.
+
+        Args:
+            startup_name (str): Name of the startup.
+
+        Returns:
+            pandas.DataFrame: Its rounds, empty for an unknown name.
+        """
+        return self._frame.take(self.name_index.get(startup_name, EMPTY_POSITIONS))
+
+    def investor_rows(self, investor_name):
+        """
+        Returns the deals of an investor through the investor index.
+
+        Args:
+            investor_name (str): Canonical name of the investor.
+
+        Returns:
+            pandas.DataFrame: The rounds the investor took part in, empty for
+                an unknown name.
+        """
+        return self._frame.take(self.investor_index.get(investor_name, EMPTY_POSITIONS))
+
+    def similar(self, kind, key, builder):
+        """
+        Returns the most similar entities of a startup or investor.
+
+        The similarity index is built on first use and kept on the snapshot,
+        see `derive`.
+
+        Args:
+            kind (str): `startup` or `investor`.
+            key (str): Name of the startup or investor.
+            builder (callable): Function taking the frame and returning the
+                `analysis.similarity.SimilarityIndex` of the kind.
+
+        Returns:
+            list: The most similar entities, most similar first.
+        """
+        return self.derive(kind + '_similarity', builder).similar(key)
+
+    def derive(self, key, builder):
+        """
+        Returns a structure derived from the dataset, building it on first use.
+
+        Args:
+            key (str): Name under which the structure is cached.
+            builder (callable): Function taking the frame and returning the structure.
+
+        Returns:
+            object: The cached structure.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = builder(self._frame)
+            return self._derived[key]
+
+
+class DatasetProvider:
+    """
+    Lazily loads the startup dataset and hands out the shared snapshot.
+
+    Methods:
+        __init__: Initializes the DatasetProvider class.
+        fingerprint: Returns the fingerprint of the dataset files.
+        get: Returns the snapshot, loading the dataset on first call or
+        after the dataset files changed.
+    """
+
+    def __init__(
+            self,
+            csv_path=CSV_PATH,
+            snapshot_path=SNAPSHOT_PATH,
+            canonical_path=CANONICAL_PATH):
+        """
+        Initialize the DatasetProvider class.
+
+        Args:
+            csv_path (str): Path of the cleaned CSV file.
+            snapshot_path (str): Path of the Parquet snapshot.
+            canonical_path (str): Path of the canonical names table.
+        """
+        self.csv_path = csv_path
+        self.snapshot_path = snapshot_path
+        self.canonical_path = canonical_path
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def fingerprint(self):
+        """
+        Returns the fingerprint of the dataset files, without loading them.
+
+        Returns:
+            str: The fingerprint the current snapshot carries.
+        """
+        return source_fingerprint(self.csv_path, self.snapshot_path, self.canonical_path)
+
+    def get(self):
+        """
+        Returns the snapshot, loading the dataset on first call or after the
+        dataset files changed.
+
+        Returns:
+            Snapshot: The shared read-only snapshot.
+        """
+        fingerprint = self.fingerprint()
+        snapshot = self._snapshot
+
+        if snapshot is None or snapshot.fingerprint != fingerprint:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None or snapshot.fingerprint != fingerprint:
+                    snapshot = Snapshot(
+                        load(self.csv_path, self.snapshot_path, self.canonical_path),
+                        fingerprint
+                    )
+                    self._snapshot = snapshot
+
+        return snapshot
+
+
+def create_provider(backend=None):
+    """
+    Creates the provider of a storage backend.
+
+    Args:
+        backend (str, optional): `pandas` or `sqlite`. Defaults to the
+            `STARTUP_BACKEND` environment variable, then to pandas.
+
+    Returns:
+        DatasetProvider: The in-memory provider for the `pandas` backend, or
+            a `dataset.store.SqliteProvider` reading `STARTUP_SQLITE_PATH`
+            for the `sqlite` backend.
+
+    Raises:
+        ValueError: On an unknown backend.
+    """
+    backend = (backend or os.environ.get(BACKEND_VARIABLE) or 'pandas').lower()
+    if backend not in BACKENDS:
+        raise ValueError(f'Unknown backend: {backend}, expected one of {BACKENDS}')
+
+    if backend == 'sqlite':
+        from dataset.store import SQLITE_PATH, SqliteProvider
+        return SqliteProvider(os.environ.get(SQLITE_PATH_VARIABLE, SQLITE_PATH))
+
+    return DatasetProvider()
+
+
+provider = create_provider()
+
+
+def get_snapshot():
+    """
+    Returns the shared snapshot of the startup dataset.
 
-startup = pd.read_csv('dataset/startup_cleaned.csv')
-startup['date'] = pd.to_datetime(startup['date'])
-startup['year'] = startup['date'].dt.year
-startup['month'] = startup['date'].dt.month
+    Returns:
+        Snapshot: The shared read-only snapshot.
+    """
+    return provider.get()
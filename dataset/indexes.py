@@ -0,0 +1,52 @@
+"""
+Module: Dataset Indexes
+
+This module builds lookup indexes over the startup dataset. They are built
+once per loaded snapshot and cached on it, see `Snapshot.derive`. Every index
+maps a key to a sorted numpy array of row positions in the startup dataset,
+so a lookup is a dictionary hit followed by a positional take.
+
+Indexes:
+- investor index: canonical investor name to the rows of their deals.
+- name index: startup name to the rows of its funding rounds.
+
+Dependencies:
+- numpy (np)
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import numpy as np
+
+EMPTY_POSITIONS = np.empty(0, dtype=np.int64)
+
+
+def build_investor_index(investor_deals):
+    """
+    Builds the inverted index from investor name to deal row positions.
+
+    Args:
+        investor_deals (pandas.DataFrame): The investor deals table,
+            see `dataset.tables.build_investor_deals`.
+
+    Returns:
+        dict: Investor name to sorted numpy array of row positions.
+    """
+    deals = investor_deals['deal'].to_numpy()
+    groups = investor_deals.groupby('investor', sort=False).indices
+
+    return {investor: np.unique(deals[rows]) for investor, rows in groups.items()}
+
+
+def build_name_index(startup):
+    """
+    Builds the index from startup name to funding round row positions.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        dict: Startup name to sorted numpy array of row positions.
+    """
+    return startup.groupby('name', sort=False, observed=True).indices
@@ -0,0 +1,293 @@
+"""
+Module: Raw Data Ingestion
+
+This module converts the raw Kaggle export `startup_funding.csv` into a
+cleaned dataset with the schema of `startup_cleaned.csv`, the dataset used by
+the app. It replaces the manual cleaning steps of the notebook with
+vectorized pandas operations:
+
+- the messy raw column names are renamed to the cleaned schema,
+- amounts written with Indian digit grouping ("20,00,00,000") are parsed and
+  converted from USD to crore rupees,
+- dates are repaired and parsed with the explicit `dd/mm/yyyy` format,
+- rows missing any required field are dropped.
+
+Raw exports too large for memory are streamed instead: `ingest_stream` reads
+fixed-size chunks, cleans each one and appends it to the Parquet snapshot,
+keeping the monthly and per-investor aggregates up to date as it goes.
+
+The output differs from the shipped `startup_cleaned.csv`, whose dates were
+cleaned by hand (this module keeps a few more rows and fixes some swapped
+days and months). It is therefore written next to it, to
+`startup_ingested.csv` and `startup_ingested.parquet` by default, and never
+replaces the dataset of the app unless that path is given explicitly.
+
+Usage:
+    python -m dataset ingest [RAW_PATH] [CSV_PATH]
+    python -m dataset stream [RAW_PATH] [SNAPSHOT_PATH] [--chunksize N]
+
+Dependencies:
+- os
+- time
+- pandas (pd)
+- pyarrow (pa, pq)
+- dataset.canonical
+- dataset.snapshot
+- dataset.tables
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import os
+import time
+from typing import NamedTuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dataset.canonical import normalize_investors
+from dataset.snapshot import DATASET_DIR, DATE_FORMAT, STRING_COLUMNS, add_date_parts
+from dataset.tables import split_investors
+
+RAW_PATH = os.path.join(DATASET_DIR, 'startup_funding.csv')
+INGESTED_CSV_PATH = os.path.join(DATASET_DIR, 'startup_ingested.csv')
+INGESTED_SNAPSHOT_PATH = os.path.join(DATASET_DIR, 'startup_ingested.parquet')
+
+RAW_COLUMNS = {
+    'Date dd/mm/yyyy': 'date',
+    'Startup Name': 'name',
+    'Industry Vertical': 'vertical',
+    'SubVertical': 'subvertical',
+    'City  Location': 'city',
+    'Investors Name': 'investors',
+    'InvestmentnType': 'type',
+    'Amount in USD': 'amount'
+}
+
+CLEANED_COLUMNS = ['date', 'name', 'vertical', 'subvertical', 'city', 'investors', 'type', 'amount']
+REQUIRED_COLUMNS = ['date', 'name', 'vertical', 'city', 'investors', 'type', 'amount']
+
+RAW_DATE_FORMAT = '%d/%m/%Y'
+USD_TO_INR = 82.84
+INR_PER_CRORE = 10_000_000
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# Arrow schema of the Parquet snapshot, string columns stay dictionary encoded
+SNAPSHOT_SCHEMA = pa.schema(
+    [('date', pa.timestamp('ns'))]
+    + [(column, pa.dictionary(pa.int32(), pa.string())) for column in STRING_COLUMNS]
+    + [('amount', pa.float64()), ('year', pa.int32()), ('month', pa.int32())]
+)
+
+# Escaped non-breaking space left in some raw cells by the scraper
+RAW_JUNK = r'\\+xc2\\+xa0'
+UNDISCLOSED_AMOUNTS = r'(?i)^(?:undisclosed|unknown|n/a)$'
+
+
+def read_raw(raw_path=RAW_PATH, **kwargs):
+    """
+    Reads the raw funding export with every column as text.
+
+    Args:
+        raw_path (str): Path of the raw CSV file.
+        **kwargs: Passed on to `pandas.read_csv`, for example `chunksize`.
+
+    Returns:
+        pandas.DataFrame: The raw rows, or an iterator of them with `chunksize`.
+    """
+    return pd.read_csv(
+        raw_path,
+        encoding='utf-8-sig',
+        usecols=list(RAW_COLUMNS),
+        dtype=str,
+        **kwargs
+    )
+
+
+def parse_amount(amount):
+    """
+    Parses raw USD amounts and converts them to crore rupees.
+
+    Missing and undisclosed amounts count as zero, like in the cleaned
+    dataset. Amounts that still cannot be parsed become NaN.
+
+    Args:
+        amount (pandas.Series): Raw amount strings such as "20,00,00,000".
+
+    Returns:
+        pandas.Series: Amounts in crore rupees.
+    """
+    amount = amount.str.replace(RAW_JUNK, '', regex=True).str.strip()
+    amount = amount.str.replace(r'[,+]', '', regex=True)
+    amount = amount.mask(amount.str.contains(UNDISCLOSED_AMOUNTS, na=False), '0').fillna('0')
+
+    return pd.to_numeric(amount, errors='coerce') * USD_TO_INR / INR_PER_CRORE
+
+
+def parse_date(date):
+    """
+    Repairs the known typos of raw dates and parses them as `dd/mm/yyyy`.
+
+    Args:
+        date (pandas.Series): Raw date strings.
+
+    Returns:
+        pandas.Series: Parsed dates, NaT where the date cannot be parsed.
+    """
+    date = date.str.replace(RAW_JUNK, '', regex=True).str.strip()
+    date = date.str.replace(r'[./]+', '/', regex=True)
+    date = date.str.replace(r'^(\d{1,2}/\d{2})(\d{4})$', r'\1/\2', regex=True)
+    date = date.str.replace(r'/0(\d{2})$', r'/20\1', regex=True)
+
+    return pd.to_datetime(date, format=RAW_DATE_FORMAT, errors='coerce')
+
+
+def clean(raw):
+    """
+    Converts raw funding rows to the cleaned schema.
+
+    Args:
+        raw (pandas.DataFrame): Raw rows, see `read_raw`.
+
+    Returns:
+        pandas.DataFrame: Rows with the `CLEANED_COLUMNS` schema.
+    """
+    startup = raw.rename(columns=RAW_COLUMNS)
+    startup['date'] = parse_date(startup['date'])
+    startup['amount'] = parse_amount(startup['amount'])
+    startup['investors'] = normalize_investors(startup['investors'])
+    startup = startup.dropna(subset=REQUIRED_COLUMNS)
+
+    return startup[CLEANED_COLUMNS].reset_index(drop=True)
+
+
+def ingest(raw_path=RAW_PATH, csv_path=INGESTED_CSV_PATH):
+    """
+    Cleans the raw funding export and writes the cleaned CSV.
+
+    Args:
+        raw_path (str): Path of the raw CSV file.
+        csv_path (str): Path of the cleaned CSV file to write.
+
+    Returns:
+        int: Number of cleaned rows written.
+    """
+    startup = clean(read_raw(raw_path))
+    startup.to_csv(csv_path, index=False, date_format=DATE_FORMAT)
+
+    return len(startup)
+
+
+class StreamResult(NamedTuple):
+    """
+    Outcome of a streaming ingestion.
+
+    Attributes:
+        rows_read (int): Raw rows read.
+        rows_written (int): Cleaned rows appended to the snapshot.
+        seconds (float): Wall time of the ingestion.
+        monthly (pandas.DataFrame): Funding `amount` and round `count` per year and month.
+        investors (pandas.DataFrame): Deal count and total `amount` per investor.
+    """
+
+    rows_read: int
+    rows_written: int
+    seconds: float
+    monthly: pd.DataFrame
+    investors: pd.DataFrame
+
+    @property
+    def throughput(self):
+        """float: Raw rows processed per second."""
+        return self.rows_read / self.seconds if self.seconds else 0.0
+
+
+def _accumulate(total, part):
+    """
+    Adds a partial aggregate to a running one, aligning on the index.
+
+    Args:
+        total (pandas.DataFrame): The running aggregate, or None.
+        part (pandas.DataFrame): The aggregate of one chunk.
+
+    Returns:
+        pandas.DataFrame: The updated running aggregate.
+    """
+    if total is None:
+        return part
+
+    return total.add(part, fill_value=0)
+
+
+def ingest_stream(
+        raw_path=RAW_PATH,
+        snapshot_path=INGESTED_SNAPSHOT_PATH,
+        chunksize=DEFAULT_CHUNKSIZE,
+        progress=None):
+    """
+    Cleans a raw funding export chunk by chunk straight into a Parquet snapshot.
+
+    Only one chunk of raw rows is held in memory at a time, so peak memory is
+    bounded by `chunksize` and not by the size of the file. The running
+    monthly and per-investor aggregates are updated as chunks are written.
+
+    Args:
+        raw_path (str): Path of the raw CSV file.
+        snapshot_path (str): Path of the Parquet snapshot to write.
+        chunksize (int): Number of raw rows per chunk.
+        progress (callable, optional): Called after every chunk with the rows
+            read, the rows written and the elapsed seconds.
+
+    Returns:
+        StreamResult: Row counts, timing and the running aggregates.
+    """
+    start = time.perf_counter()
+    rows_read = rows_written = 0
+    monthly = investors = None
+
+    # Write next to the target and rename, so readers never see a partial file
+    temp_path = snapshot_path + '.tmp'
+    with pq.ParquetWriter(temp_path, SNAPSHOT_SCHEMA) as writer:
+        for raw in read_raw(raw_path, chunksize=chunksize):
+            startup = add_date_parts(clean(raw))
+            writer.write_table(
+                pa.Table.from_pandas(startup, schema=SNAPSHOT_SCHEMA, preserve_index=False)
+            )
+
+            monthly = _accumulate(
+                monthly,
+                startup.groupby(['year', 'month'])['amount'].agg(['sum', 'count'])
+            )
+            deals = split_investors(startup['investors'])
+            amounts = startup['amount'].to_numpy()[deals.index.to_numpy()]
+            investors = _accumulate(
+                investors,
+                pd.DataFrame({'investor': deals.to_numpy(), 'amount': amounts})
+                .groupby('investor')['amount'].agg(['size', 'sum'])
+            )
+
+            rows_read += len(raw)
+            rows_written += len(startup)
+            if progress is not None:
+                progress(rows_read, rows_written, time.perf_counter() - start)
+
+    os.replace(temp_path, snapshot_path)
+
+    if monthly is None:
+        monthly = pd.DataFrame({'sum': [], 'count': []})
+        investors = pd.DataFrame({'size': [], 'sum': []})
+
+    # Aligned additions turn the counts into floats
+    monthly = monthly.astype({'count': 'int64'}).rename(columns={'sum': 'amount'})
+    investors = investors.astype({'size': 'int64'}).rename(columns={'size': 'deals', 'sum': 'amount'})
+
+    return StreamResult(
+        rows_read=rows_read,
+        rows_written=rows_written,
+        seconds=time.perf_counter() - start,
+        monthly=monthly.reset_index(),
+        investors=investors.reset_index()
+    )
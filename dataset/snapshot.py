@@ -0,0 +1,315 @@
+"""
+Module: Dataset Snapshot
+
+This module builds and reads a typed columnar snapshot of the cleaned startup
+dataset. The snapshot is a Parquet file holding the already parsed `date`
+column, the precomputed `year` and `month` columns and dictionary-encoded
+string columns, so loading it skips CSV parsing and date inference entirely.
+
+Whichever source is read, the loader returns the compact in-memory
+representation: categorical string columns and the smallest safe numeric
+types (see `compact`), with entity names canonicalized (see `dataset.canonical`).
+Investor strings are normalized when the CSV is read, so the snapshot
+stores them already normalized.
+
+Build the snapshot after every change to the cleaned CSV:
+
+    python -m dataset
+
+Dependencies:
+- logging
+- numpy (np)
+- pandas (pd)
+- pyarrow (Parquet engine used by pandas)
+- dataset.canonical
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import hashlib
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from dataset.canonical import CANONICAL_PATH, canonicalize, normalize_investors, read_mappings
+
+DATASET_DIR = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(DATASET_DIR, 'startup_cleaned.csv')
+SNAPSHOT_PATH = os.path.join(DATASET_DIR, 'startup_cleaned.parquet')
+
+DATE_FORMAT = '%Y-%m-%d'
+STRING_COLUMNS = ['name', 'vertical', 'subvertical', 'city', 'investors', 'type']
+INTEGER_COLUMNS = ['year', 'month']
+FLOAT_COLUMNS = ['amount']
+
+logger = logging.getLogger(__name__)
+
+
+def read_csv(csv_path=CSV_PATH):
+    """
+    Reads the cleaned CSV, normalizes the investor strings and derives the
+    date columns.
+
+    Args:
+        csv_path (str): Path of the cleaned CSV file.
+
+    Returns:
+        pandas.DataFrame: The startup dataset with `year` and `month` columns.
+    """
+    startup = pd.read_csv(csv_path)
+    startup['date'] = pd.to_datetime(startup['date'], format=DATE_FORMAT)
+    startup['investors'] = normalize_investors(startup['investors'])
+
+    return add_date_parts(startup)
+
+
+def add_date_parts(startup):
+    """
+    Derives the `year` and `month` columns from the parsed `date` column.
+
+    Args:
+        startup (pandas.DataFrame): Rows with a datetime `date` column.
+
+    Returns:
+        pandas.DataFrame: The same frame with `year` and `month` columns.
+    """
+    startup['year'] = startup['date'].dt.year
+    startup['month'] = startup['date'].dt.month
+
+    return startup
+
+
+def is_fresh(csv_path=CSV_PATH, snapshot_path=SNAPSHOT_PATH):
+    """
+    Checks whether the snapshot exists and is newer than the CSV.
+
+    Args:
+        csv_path (str): Path of the cleaned CSV file.
+        snapshot_path (str): Path of the Parquet snapshot.
+
+    Returns:
+        bool: True if the snapshot can be used instead of the CSV.
+    """
+    if not os.path.exists(snapshot_path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+
+    return os.path.getmtime(snapshot_path) >= os.path.getmtime(csv_path)
+
+
+def source_fingerprint(
+        csv_path=CSV_PATH,
+        snapshot_path=SNAPSHOT_PATH,
+        canonical_path=CANONICAL_PATH):
+    """
+    Fingerprints the dataset files from their path, size and modification time.
+
+    Any rewrite of the CSV, the snapshot or the canonical names table changes
+    the fingerprint, so caches keyed on it are invalidated by a data refresh.
+
+    Args:
+        csv_path (str): Path of the cleaned CSV file.
+        snapshot_path (str): Path of the Parquet snapshot.
+        canonical_path (str): Path of the canonical names table.
+
+    Returns:
+        str: Hex digest identifying the current version of the dataset files.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for path in (csv_path, snapshot_path, canonical_path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        digest.update(f'{path}:{stat.st_size}:{stat.st_mtime_ns};'.encode())
+
+    return digest.hexdigest()
+
+
+def frame_fingerprint(startup):
+    """
+    Fingerprints a dataset from its content.
+
+    Used for frames that were not loaded from the dataset files.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        str: Hex digest of the content of the frame.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(pd.util.hash_pandas_object(startup, index=False).to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
+def build_snapshot(csv_path=CSV_PATH, snapshot_path=SNAPSHOT_PATH):
+    """
+    Writes the Parquet snapshot of the cleaned CSV.
+
+    The string columns are stored as categoricals, which Parquet keeps
+    dictionary-encoded on disk.
+
+    Args:
+        csv_path (str): Path of the cleaned CSV file.
+        snapshot_path (str): Path of the Parquet snapshot to write.
+
+    Returns:
+        str: Path of the written snapshot.
+    """
+    startup = read_csv(csv_path)
+    for column in STRING_COLUMNS:
+        startup[column] = startup[column].astype('category')
+
+    # Write next to the target and rename, so readers never see a partial file
+    temp_path = snapshot_path + '.tmp'
+    startup.to_parquet(temp_path, index=False)
+    os.replace(temp_path, snapshot_path)
+
+    return snapshot_path
+
+
+def read_snapshot(snapshot_path=SNAPSHOT_PATH):
+    """
+    Reads the Parquet snapshot.
+
+    Args:
+        snapshot_path (str): Path of the Parquet snapshot.
+
+    Returns:
+        pandas.DataFrame: The startup dataset, string columns as categoricals.
+    """
+    return pd.read_parquet(snapshot_path)
+
+
+def _smallest_integer(values):
+    """
+    Returns the smallest integer dtype holding every value.
+
+    Args:
+        values (pandas.Series): Integer values without missing entries.
+
+    Returns:
+        numpy.dtype: The smallest signed integer dtype that fits.
+    """
+    if values.empty:
+        return np.dtype(np.int8)
+
+    low, high = values.min(), values.max()
+    for dtype in (np.int8, np.int16, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+
+    return values.dtype
+
+
+def _smallest_float(values):
+    """
+    Returns float32 when every value survives the round trip, float64 otherwise.
+
+    Args:
+        values (pandas.Series): Float values.
+
+    Returns:
+        numpy.dtype: The smallest float dtype that is lossless for the values.
+    """
+    array = values.to_numpy(dtype=np.float64)
+    if np.array_equal(array.astype(np.float32).astype(np.float64), array, equal_nan=True):
+        return np.dtype(np.float32)
+
+    return np.dtype(np.float64)
+
+
+def compact(startup):
+    """
+    Converts the dataset to its compact in-memory representation.
+
+    The string columns become categoricals with sorted categories, `year`
+    and `month` use the smallest integer type that holds them and `amount`
+    is only narrowed when no value loses precision.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        pandas.DataFrame: The compact dataset.
+    """
+    startup = startup.copy(deep=False)
+
+    for column in STRING_COLUMNS:
+        values = startup[column]
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype('category')
+        # Dictionaries merged from several Parquet row groups are not sorted
+        startup[column] = values.cat.set_categories(values.cat.categories.sort_values())
+
+    for column in INTEGER_COLUMNS:
+        startup[column] = startup[column].astype(_smallest_integer(startup[column]))
+    for column in FLOAT_COLUMNS:
+        startup[column] = startup[column].astype(_smallest_float(startup[column]))
+
+    return startup
+
+
+def memory_report(before, after):
+    """
+    Compares the memory used by each column of two versions of the dataset.
+
+    Args:
+        before (pandas.DataFrame): The dataset as loaded.
+        after (pandas.DataFrame): The compact dataset.
+
+    Returns:
+        pandas.DataFrame: `before`, `after` bytes and `dtype` per column.
+    """
+    return pd.DataFrame({
+        'before': before.memory_usage(index=False, deep=True),
+        'after': after.memory_usage(index=False, deep=True),
+        'dtype': after.dtypes.astype(str)
+    })
+
+
+def load(csv_path=CSV_PATH, snapshot_path=SNAPSHOT_PATH, canonical_path=CANONICAL_PATH):
+    """
+    Loads the startup dataset, preferring the snapshot when it is fresh.
+
+    The dataset is returned in its compact representation, see `compact`,
+    with the names of the canonical names table applied, see
+    `dataset.canonical`. The memory used per column with the strings held
+    as Python objects and in the compact representation is logged at INFO
+    level.
+
+    Args:
+        csv_path (str): Path of the cleaned CSV file.
+        snapshot_path (str): Path of the Parquet snapshot.
+        canonical_path (str): Path of the canonical names table.
+
+    Returns:
+        pandas.DataFrame: The startup dataset.
+    """
+    if is_fresh(csv_path, snapshot_path):
+        startup = read_snapshot(snapshot_path)
+    else:
+        startup = read_csv(csv_path)
+
+    compacted = canonicalize(compact(startup), read_mappings(canonical_path))
+
+    # Deep memory usage scans every string, only pay for it when it is logged
+    if logger.isEnabledFor(logging.INFO):
+        # The snapshot is already categorical, compare with plain strings
+        report = memory_report(
+            startup.astype({column: object for column in STRING_COLUMNS}),
+            compacted
+        )
+        logger.info(
+            'Loaded %d rows, memory per column (bytes):\n%s\ntotal %d -> %d',
+            len(compacted), report, report['before'].sum(), report['after'].sum()
+        )
+
+    return compacted
@@ -0,0 +1,481 @@
+"""
+Module: SQLite Store
+
+This module provides the SQLite storage backend of the startup dataset. The
+dataset is written once to a SQLite file, and the snapshot of the backend
+answers the queries of the analysis layer inside the engine instead of
+holding the dataset in memory:
+
+- the rounds of one startup and the deals of one investor are indexed lookups,
+- the monthly cube, the startup years, the investor vocabulary and the round
+  counts per startup are aggregated by SQL,
+- the similar startups and investors are indexed lookups too, when their
+  neighbours were precomputed by the caller of `build_database` (see
+  `analysis.similarity.neighbour_tables`).
+
+Only these results are held in memory, so the dataset can be much larger
+than RAM, and every worker process reads the same file. The full rounds
+table is only read when `SqliteSnapshot.frame` is accessed, or to build the
+similarity indexes of a file written without neighbours.
+
+Tables:
+- rounds: one row per funding round, `id` is the row position of the round
+  in the startup dataset. Indexed on name, date and vertical.
+- investor_deals: one row per investor on each round, indexed on investor.
+- similar_startups, similar_investors: the most similar entities of every
+  startup and investor, keyed on name and rank. Empty when the file was
+  written without neighbours.
+
+Select the backend with the environment variables `STARTUP_BACKEND=sqlite`
+and optionally `STARTUP_SQLITE_PATH`, see `dataset.dataset.create_provider`.
+Build the file after every change to the dataset:
+
+    python -m analysis sqlite
+
+Dependencies:
+- os
+- sqlite3
+- threading
+- pandas (pd)
+- dataset.canonical
+- dataset.dataset (Snapshot)
+- dataset.snapshot
+- dataset.tables
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from dataset.canonical import CANONICAL_PATH
+from dataset.dataset import Snapshot
+from dataset.snapshot import CSV_PATH, DATASET_DIR, SNAPSHOT_PATH, compact, load
+from dataset.tables import (
+    CUBE_KEYS, INVESTOR_DEAL_COLUMNS, INVESTOR_VOCABULARY_COLUMNS, build_investor_deals
+)
+
+SQLITE_PATH = os.path.join(DATASET_DIR, 'startup_cleaned.sqlite')
+
+ROUND_COLUMNS = [
+    'date', 'name', 'vertical', 'subvertical', 'city', 'investors', 'type',
+    'amount', 'year', 'month'
+]
+
+SCHEMA = """
+CREATE TABLE rounds (
+    id INTEGER PRIMARY KEY,
+    date TEXT,
+    name TEXT,
+    vertical TEXT,
+    subvertical TEXT,
+    city TEXT,
+    investors TEXT,
+    type TEXT,
+    amount REAL,
+    year INTEGER,
+    month INTEGER
+);
+CREATE TABLE investor_deals (
+    deal INTEGER NOT NULL REFERENCES rounds (id),
+    investor TEXT NOT NULL
+);
+CREATE TABLE similar_startups (
+    name TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    neighbour TEXT NOT NULL,
+    PRIMARY KEY (name, rank)
+) WITHOUT ROWID;
+CREATE TABLE similar_investors (
+    name TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    neighbour TEXT NOT NULL,
+    PRIMARY KEY (name, rank)
+) WITHOUT ROWID;
+CREATE INDEX rounds_name ON rounds (name);
+CREATE INDEX rounds_date ON rounds (date);
+CREATE INDEX rounds_vertical ON rounds (vertical);
+CREATE INDEX investor_deals_investor ON investor_deals (investor, deal);
+"""
+
+# Table of the precomputed neighbours of each kind of `Snapshot.similar`
+SIMILARITY_TABLES = {
+    'startup': 'similar_startups',
+    'investor': 'similar_investors'
+}
+
+_SELECT_ROUNDS = 'SELECT id, ' + ', '.join(ROUND_COLUMNS) + ' FROM rounds'
+
+
+def build_database(
+        sqlite_path=SQLITE_PATH,
+        csv_path=CSV_PATH,
+        snapshot_path=SNAPSHOT_PATH,
+        canonical_path=CANONICAL_PATH,
+        neighbours=None):
+    """
+    Writes the SQLite file of the loaded startup dataset.
+
+    Args:
+        sqlite_path (str): Path of the SQLite file to write.
+        csv_path (str): Path of the cleaned CSV file.
+        snapshot_path (str): Path of its Parquet snapshot.
+        canonical_path (str): Path of the canonical names table.
+        neighbours (callable, optional): Takes the startup dataset and its
+            investor deals table, and returns kind (see `SIMILARITY_TABLES`)
+            to a DataFrame with `name`, `rank` and `neighbour` columns.
+            Without it the similarity tables are left empty.
+
+    Returns:
+        str: Path of the written file.
+    """
+    startup = load(csv_path, snapshot_path, canonical_path)
+    rounds = startup[ROUND_COLUMNS].astype({'amount': 'float64', 'year': 'int64', 'month': 'int64'})
+    rounds['date'] = rounds['date'].dt.strftime('%Y-%m-%d')
+    investor_deals = build_investor_deals(startup)
+    deals = investor_deals[['deal', 'investor']]
+    similar = {} if neighbours is None else neighbours(startup, investor_deals)
+
+    # Write next to the target and rename, so readers never see a partial file
+    temp_path = sqlite_path + '.tmp'
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.executescript(SCHEMA)
+        connection.executemany(
+            'INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            zip(range(len(rounds)), *(_column(rounds[column]) for column in ROUND_COLUMNS))
+        )
+        connection.executemany(
+            'INSERT INTO investor_deals VALUES (?, ?)',
+            zip(deals['deal'].tolist(), deals['investor'].tolist())
+        )
+        for kind, neighbours in similar.items():
+            connection.executemany(
+                f'INSERT INTO {SIMILARITY_TABLES[kind]} VALUES (?, ?, ?)',
+                neighbours.itertuples(index=False, name=None)
+            )
+        connection.commit()
+        connection.execute('ANALYZE')
+    finally:
+        connection.close()
+
+    os.replace(temp_path, sqlite_path)
+
+    return sqlite_path
+
+
+def _column(values):
+    """
+    Returns the values of a column as Python objects, None for missing values.
+
+    Args:
+        values (pandas.Series): A column of the startup dataset.
+
+    Returns:
+        list: The values.
+    """
+    values = values.astype(object)
+
+    return values.where(values.notna(), None).tolist()
+
+
+def _typed(rounds):
+    """
+    Converts rounds read from SQLite to the representation of the loaded dataset.
+
+    Args:
+        rounds (pandas.DataFrame): `id` and `ROUND_COLUMNS` columns.
+
+    Returns:
+        pandas.DataFrame: The rounds indexed by row position, with a datetime
+            `date`, categorical strings and compact numeric types.
+    """
+    rounds = rounds.set_index('id').rename_axis(None)
+    rounds['date'] = pd.to_datetime(rounds['date'], format='%Y-%m-%d')
+
+    return compact(rounds)
+
+
+class SqliteSnapshot(Snapshot):
+    """
+    Snapshot of the startup dataset answered by a SQLite file.
+
+    The per entity lookups query the file on every call, the aggregates are
+    queried once and kept on the snapshot, see `Snapshot.derive`. The full
+    dataset is only read when `frame` is accessed.
+
+    Attributes:
+        path (str): Path of the SQLite file.
+    """
+
+    __slots__ = ('_path', '_local')
+
+    def __init__(self, path, fingerprint):
+        """
+        Initialize the SqliteSnapshot class.
+
+        Args:
+            path (str): Path of the SQLite file.
+            fingerprint (str): Version of the file.
+        """
+        super().__init__(None, fingerprint)
+        object.__setattr__(self, '_path', path)
+        object.__setattr__(self, '_local', threading.local())
+
+    @property
+    def path(self):
+        """str: Path of the SQLite file."""
+        return self._path
+
+    def _query(self, sql, params=()):
+        """
+        Runs a read-only query on the connection of the current thread.
+
+        Args:
+            sql (str): The query.
+            params (tuple): Its parameters.
+
+        Returns:
+            pandas.DataFrame: The result.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(f'file:{self._path}?mode=ro', uri=True)
+            self._local.connection = connection
+
+        return pd.read_sql_query(sql, connection, params=params)
+
+    @property
+    def frame(self):
+        """pandas.DataFrame: The startup dataset, read in full on first access."""
+        if self._frame is None:
+            with self._lock:
+                if self._frame is None:
+                    object.__setattr__(self, '_frame', _typed(self._query(_SELECT_ROUNDS + ' ORDER BY id')))
+
+        return self._frame
+
+    def startup_rows(self, startup_name):
+        """
+        Returns the rounds of a startup through the name index of the file.
+
+        Args:
+            startup_name (str): Name of the startup.
+
+        Returns:
+            pandas.DataFrame: Its rounds, empty for an unknown name.
+        """
+        return _typed(self._query(_SELECT_ROUNDS + ' WHERE name = ? ORDER BY id', (startup_name,)))
+
+    def investor_rows(self, investor_name):
+        """
+        Returns the deals of an investor through the investor index of the file.
+
+        Args:
+            investor_name (str): Canonical name of the investor.
+
+        Returns:
+            pandas.DataFrame: The rounds the investor took part in, empty for
+                an unknown name.
+        """
+        return _typed(self._query(
+            _SELECT_ROUNDS
+            + ' WHERE id IN (SELECT deal FROM investor_deals WHERE investor = ?) ORDER BY id',
+            (investor_name,)
+        ))
+
+    def similar(self, kind, key, builder):
+        """
+        Returns the most similar entities of a startup or investor from the
+        neighbours precomputed in the file.
+
+        Files written without neighbours fall back to the similarity index
+        of `Snapshot.similar`, which reads the full dataset.
+
+        Args:
+            kind (str): `startup` or `investor`.
+            key (str): Name of the startup or investor.
+            builder (callable): Function taking the frame and returning the
+                similarity index of the kind, used by the fallback only.
+
+        Returns:
+            list: The most similar entities, most similar first.
+        """
+        table = SIMILARITY_TABLES[kind]
+        stored = self.derive(table, lambda frame: bool(
+            self._query(f'SELECT EXISTS (SELECT 1 FROM {table}) AS stored')['stored'].iloc[0]
+        ))
+        if not stored:
+            return super().similar(kind, key, builder)
+
+        neighbours = self._query(
+            f'SELECT neighbour FROM {table} WHERE name = ? ORDER BY rank',
+            (key,)
+        )
+
+        return neighbours['neighbour'].tolist()
+
+    @property
+    def investor_deals(self):
+        """pandas.DataFrame: One row per investor on each deal, joined by SQL."""
+        return self.derive('investor_deals', lambda frame: self._investor_deals())
+
+    def _investor_deals(self):
+        """
+        Queries the investor deals table.
+
+        Returns:
+            pandas.DataFrame: Table with the `INVESTOR_DEAL_COLUMNS` schema.
+        """
+        columns = ', '.join(
+            'd.' + column if column in ('deal', 'investor') else 'r.' + column
+            for column in INVESTOR_DEAL_COLUMNS
+        )
+        deals = self._query(
+            f'SELECT {columns} FROM investor_deals d JOIN rounds r ON r.id = d.deal ORDER BY d.rowid'
+        )
+        deals['date'] = pd.to_datetime(deals['date'], format='%Y-%m-%d')
+
+        return deals
+
+    @property
+    def investor_vocabulary(self):
+        """pandas.DataFrame: Deal count and total amount per investor, aggregated by SQL."""
+        return self.derive('investor_vocabulary', lambda frame: self._query(
+            'SELECT d.investor AS investor, COUNT(DISTINCT d.deal) AS deals, TOTAL(r.amount) AS amount '
+            'FROM investor_deals d JOIN rounds r ON r.id = d.deal '
+            'GROUP BY d.investor ORDER BY d.investor'
+        )[INVESTOR_VOCABULARY_COLUMNS])
+
+    @property
+    def monthly_cube(self):
+        """pandas.DataFrame: Funding by year, month, vertical, city and type, aggregated by SQL."""
+        keys = ', '.join(CUBE_KEYS)
+
+        return self.derive('monthly_cube', lambda frame: self._query(
+            f'SELECT {keys}, TOTAL(amount) AS amount, COUNT(amount) AS count, '
+            f'COUNT(*) AS rounds, COUNT(DISTINCT name) AS startups '
+            f'FROM rounds GROUP BY {keys} ORDER BY {keys}'
+        ))
+
+    @property
+    def startup_years(self):
+        """pandas.DataFrame: Funding by year and startup, aggregated by SQL."""
+        return self.derive('startup_years', lambda frame: self._query(
+            'SELECT year, name, TOTAL(amount) AS amount, MAX(amount) AS max_amount '
+            'FROM rounds WHERE name IS NOT NULL GROUP BY year, name ORDER BY year, name'
+        ))
+
+    @property
+    def startup_rounds(self):
+        """pandas.Series: Number of rounds per startup name, counted by SQL."""
+        return self.derive('startup_rounds', lambda frame: self._query(
+            'SELECT name, COUNT(*) AS rounds FROM rounds '
+            'WHERE name IS NOT NULL GROUP BY name ORDER BY name'
+        ).set_index('name')['rounds'])
+
+    def derive(self, key, builder):
+        """
+        Returns a structure derived from the dataset, building it on first use.
+
+        Builders that use their frame argument read the full dataset, see `frame`.
+
+        Args:
+            key (str): Name under which the structure is cached.
+            builder (callable): Function taking the frame and returning the structure.
+
+        Returns:
+            object: The cached structure.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = builder(_LazyFrame(self))
+            return self._derived[key]
+
+
+class _LazyFrame:
+    """
+    Stand-in for the frame passed to the builders of `SqliteSnapshot.derive`,
+    reading the full dataset only when a builder actually uses it.
+    """
+
+    __slots__ = ('_snapshot',)
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def __getattr__(self, name):
+        return getattr(self._snapshot.frame, name)
+
+    def __getitem__(self, key):
+        return self._snapshot.frame[key]
+
+    def __len__(self):
+        return len(self._snapshot.frame)
+
+
+class SqliteProvider:
+    """
+    Hands out the snapshot of a SQLite file, like `dataset.DatasetProvider`.
+
+    Methods:
+        __init__: Initializes the SqliteProvider class.
+        fingerprint: Returns the fingerprint of the SQLite file.
+        get: Returns the snapshot, replaced after the file changed.
+    """
+
+    def __init__(self, sqlite_path=SQLITE_PATH):
+        """
+        Initialize the SqliteProvider class.
+
+        Args:
+            sqlite_path (str): Path of the SQLite file, see `build_database`.
+        """
+        self.sqlite_path = sqlite_path
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def fingerprint(self):
+        """
+        Fingerprints the SQLite file from its path, size and modification time.
+
+        Returns:
+            str: Identifies the current version of the file.
+
+        Raises:
+            FileNotFoundError: If the file was not built.
+        """
+        stat = os.stat(self.sqlite_path)
+
+        return f'sqlite:{stat.st_size}:{stat.st_mtime_ns}'
+
+    def get(self):
+        """
+        Returns the snapshot, replaced after the file changed.
+
+        Returns:
+            SqliteSnapshot: The shared read-only snapshot.
+        """
+        fingerprint = self.fingerprint()
+        snapshot = self._snapshot
+
+        if snapshot is None or snapshot.fingerprint != fingerprint:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None or snapshot.fingerprint != fingerprint:
+                    snapshot = SqliteSnapshot(self.sqlite_path, fingerprint)
+                    self._snapshot = snapshot
+
+        return snapshot
@@ -0,0 +1,431 @@
+"""
+Module: Synthetic Funding Data
+
+This module generates synthetic funding rounds in the schema of the cleaned
+dataset, for load tests at sizes far beyond the real data. The generator
+first learns from the real dataset:
+
+- the number of rounds per startup,
+- the joint distribution of vertical and subvertical of a startup, and its city,
+- the round type, conditioned on the position of the round (first, second,
+  later) in the history of the startup,
+- the amount, conditioned on the round type: the share of undisclosed (zero)
+  amounts and the heavy-tailed positive amounts, resampled on a log scale
+  with a small Gaussian jitter,
+- the density of rounds per month,
+- the number of investors per deal and the activity of investors (deals per
+  investor), so that a few investors take part in many deals like in the
+  real data.
+
+Rows are then sampled with vectorized NumPy operations, chunk by chunk, and
+streamed to a Parquet snapshot or a CSV file, so millions of rows are
+written without holding them in memory. Startup and investor names are
+synthetic (`Startup 0000001`, `Investor 0000001`).
+
+Usage:
+    python -m dataset synthetic OUTPUT_PATH [--rows N] [--chunksize N] [--seed N]
+
+Dependencies:
+- time
+- numpy (np)
+- pandas (pd)
+- pyarrow (pa, pq)
+- dataset.snapshot
+- dataset.tables
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dataset.snapshot import DATE_FORMAT, add_date_parts, load
+from dataset.tables import split_investors
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_CHUNKSIZE = 250_000
+
+# Round positions the round type is conditioned on: first, second, later
+ROUND_POSITIONS = 3
+
+# Types with fewer observed amounts use the amounts of every type
+MIN_TYPE_AMOUNTS = 10
+
+SYNTHETIC_COLUMNS = ['date', 'name', 'vertical', 'subvertical', 'city', 'investors', 'type', 'amount']
+
+
+def _distribution(values):
+    """
+    Returns the empirical distribution of a column.
+
+    Args:
+        values (pandas.Series): The observed values, missing values included.
+
+    Returns:
+        tuple: numpy array of distinct values and numpy array of probabilities.
+    """
+    counts = pd.Series(np.asarray(values)).value_counts(dropna=False, sort=False)
+
+    return counts.index.to_numpy(), counts.to_numpy() / counts.sum()
+
+
+def _bandwidth(samples):
+    """
+    Returns the Silverman bandwidth of a Gaussian kernel for the samples.
+
+    Args:
+        samples (numpy.ndarray): One dimensional samples.
+
+    Returns:
+        float: The kernel bandwidth, zero for fewer than two samples.
+    """
+    if len(samples) < 2:
+        return 0.0
+
+    return 1.06 * samples.std() * len(samples) ** -0.2
+
+
+class FundingModel:
+    """
+    Distributions of the funding dataset, learned once and sampled in chunks.
+
+    Methods:
+        __init__: Initializes the FundingModel class.
+        fit: Learns the distributions of a startup dataset.
+        sample: Samples synthetic rounds.
+    """
+
+    def __init__(
+            self,
+            rounds_per_startup,
+            profiles,
+            cities,
+            types,
+            amounts,
+            months,
+            investors_per_deal,
+            investor_activity,
+            investors_per_pair):
+        """
+        Initialize the FundingModel class. Use `fit` to learn it from data.
+
+        Args:
+            rounds_per_startup (tuple): Distinct round counts and probabilities.
+            profiles (tuple): numpy array of (vertical, subvertical) pairs and probabilities.
+            cities (tuple): Distinct cities and probabilities.
+            types (list): Per round position, distinct types and probabilities.
+            amounts (dict): Type to (zero share, log amounts, bandwidth), `None`
+                for the amounts of every type.
+            months (tuple): numpy datetime64 month starts and probabilities.
+            investors_per_deal (tuple): Distinct investor counts and probabilities.
+            investor_activity (numpy.ndarray): Observed deals per investor.
+            investors_per_pair (float): Distinct investors per (deal, investor) pair.
+        """
+        self.rounds_per_startup = rounds_per_startup
+        self.profiles = profiles
+        self.cities = cities
+        self.types = types
+        self.amounts = amounts
+        self.months = months
+        self.investors_per_deal = investors_per_deal
+        self.investor_activity = investor_activity
+        self.investors_per_pair = investors_per_pair
+
+    @classmethod
+    def fit(cls, startup):
+        """
+        Learns the distributions of a startup dataset.
+
+        Args:
+            startup (pandas.DataFrame): The startup dataset.
+
+        Returns:
+            FundingModel: The learned model.
+        """
+        startup = startup.sort_values(['name', 'date'], kind='stable')
+        position = np.minimum(
+            startup.groupby('name', observed=True).cumcount().to_numpy(),
+            ROUND_POSITIONS - 1
+        )
+        first = startup.drop_duplicates('name')
+
+        profile_counts = first.groupby(
+            ['vertical', 'subvertical'], dropna=False, observed=True
+        ).size()
+        profiles = (
+            np.array(profile_counts.index.tolist(), dtype=object),
+            profile_counts.to_numpy() / profile_counts.sum()
+        )
+
+        types = [_distribution(startup['type'].to_numpy()[position == i]) for i in range(ROUND_POSITIONS)]
+
+        amounts = {}
+        for round_type, rounds in [(None, startup)] + list(startup.groupby('type', observed=True)):
+            amount = rounds['amount'].to_numpy(dtype=np.float64)
+            amount = amount[~np.isnan(amount)]
+            if len(amount) >= MIN_TYPE_AMOUNTS or round_type is None:
+                logs = np.log(amount[amount > 0])
+                amounts[round_type] = ((amount == 0).mean(), logs, _bandwidth(logs))
+
+        month_counts = startup['date'].dt.to_period('M').value_counts(sort=False)
+        months = (
+            month_counts.index.to_timestamp().to_numpy(dtype='datetime64[D]'),
+            month_counts.to_numpy() / month_counts.sum()
+        )
+
+        pairs = split_investors(startup['investors'])
+        per_deal = np.bincount(pairs.index.to_numpy(), minlength=len(startup))
+        activity = pairs.value_counts().to_numpy()
+
+        return cls(
+            rounds_per_startup=_distribution(startup.groupby('name', observed=True).size()),
+            profiles=profiles,
+            cities=_distribution(first['city']),
+            types=types,
+            amounts=amounts,
+            months=months,
+            investors_per_deal=_distribution(per_deal),
+            investor_activity=activity,
+            investors_per_pair=len(activity) / max(len(pairs), 1)
+        )
+
+    def investor_pool(self, rows, rng):
+        """
+        Draws the activity of the investors of a synthetic dataset.
+
+        The pool grows with the number of rows like in the real data, and the
+        weights are resampled from the observed deals per investor. The same
+        pool is shared by every chunk, so investors come back across chunks.
+
+        Args:
+            rows (int): Number of rows of the whole dataset.
+            rng (numpy.random.Generator): Random generator.
+
+        Returns:
+            numpy.ndarray: Cumulative selection probability of each investor.
+        """
+        values, probabilities = self.investors_per_deal
+        size = max(1, int(round(rows * (values * probabilities).sum() * self.investors_per_pair)))
+        weights = rng.choice(self.investor_activity, size=size).astype(np.float64)
+
+        return np.cumsum(weights / weights.sum())
+
+    def _amounts(self, types, rng):
+        """
+        Samples an amount for every round, conditioned on its type.
+
+        Args:
+            types (numpy.ndarray): Type of every round.
+            rng (numpy.random.Generator): Random generator.
+
+        Returns:
+            numpy.ndarray: Amounts in crore rupees.
+        """
+        amount = np.zeros(len(types))
+        known = pd.Series(types).isin([key for key in self.amounts if key is not None]).to_numpy()
+        codes, keys = pd.factorize(np.where(known, types, None))
+
+        for code in np.unique(codes):
+            zero_share, logs, bandwidth = self.amounts[keys[code] if code >= 0 else None]
+            rows = np.flatnonzero(codes == code)
+            disclosed = rows[rng.random(len(rows)) >= zero_share]
+            if len(disclosed) and len(logs):
+                sampled = rng.choice(logs, size=len(disclosed)) + rng.normal(0, bandwidth, len(disclosed))
+                # The jitter smooths the observed amounts but never extends their range
+                amount[disclosed] = np.exp(np.clip(sampled, logs.min(), logs.max()))
+
+        return np.round(amount, 4)
+
+    def _investors(self, rows, rng, pool):
+        """
+        Samples the comma separated investors of every deal.
+
+        Args:
+            rows (int): Number of deals.
+            rng (numpy.random.Generator): Random generator.
+            pool (numpy.ndarray): Cumulative investor probabilities, see `investor_pool`.
+
+        Returns:
+            numpy.ndarray: Investor strings, missing for deals without investors
+                like in the loaded dataset.
+        """
+        values, probabilities = self.investors_per_deal
+        per_deal = rng.choice(values, size=rows, p=probabilities).astype(np.int64)
+
+        investors = np.full(rows, None, dtype=object)
+        for count in np.unique(per_deal[per_deal > 0]):
+            deals = np.flatnonzero(per_deal == count)
+            chosen = np.searchsorted(pool, rng.random((len(deals), count)), side='right')
+            names = _numbered('Investor ', np.minimum(chosen, len(pool) - 1))
+            joined = names[:, 0]
+            for column in range(1, count):
+                joined = np.char.add(np.char.add(joined, ', '), names[:, column])
+            investors[deals] = joined
+
+        return investors
+
+    def sample(self, rows, rng, pool, first_startup=0):
+        """
+        Samples synthetic rounds.
+
+        Args:
+            rows (int): Number of rounds.
+            rng (numpy.random.Generator): Random generator.
+            pool (numpy.ndarray): Cumulative investor probabilities, see `investor_pool`.
+            first_startup (int): Number of the first startup, so that chunks
+                do not reuse names.
+
+        Returns:
+            tuple: The rounds as a DataFrame with the `SYNTHETIC_COLUMNS` and
+                the number of startups.
+        """
+        # Startups and their number of rounds, the last one is cut to fit
+        values, probabilities = self.rounds_per_startup
+        mean_rounds = (values * probabilities).sum()
+        counts = rng.choice(values, size=int(rows / mean_rounds) + 16, p=probabilities).astype(np.int64)
+        while counts.sum() < rows:
+            counts = np.concatenate([counts, rng.choice(values, size=len(counts), p=probabilities)])
+        startups = int(np.searchsorted(np.cumsum(counts), rows) + 1)
+        counts = counts[:startups]
+        counts[-1] -= counts.sum() - rows
+        starts = np.cumsum(counts) - counts
+        startup = np.repeat(np.arange(startups), counts)
+
+        # Attributes of each startup, shared by its rounds
+        pairs, probabilities = self.profiles
+        profile = rng.choice(len(pairs), size=startups, p=probabilities)[startup]
+        cities, probabilities = self.cities
+        city = rng.choice(len(cities), size=startups, p=probabilities)[startup]
+
+        # Dates, ordered within each startup
+        months, probabilities = self.months
+        month = months[rng.choice(len(months), size=rows, p=probabilities)]
+        days = (month.astype('datetime64[M]') + 1).astype('datetime64[D]') - month
+        date = month + (rng.random(rows) * days.astype(np.int64)).astype('timedelta64[D]')
+        date = date[np.lexsort((date, startup))]
+        position = np.arange(rows) - np.repeat(starts, counts)
+
+        # Round types by position in the history of the startup
+        round_type = np.empty(rows, dtype=object)
+        for i, (types, probabilities) in enumerate(self.types):
+            rounds = np.flatnonzero(np.minimum(position, ROUND_POSITIONS - 1) == i)
+            round_type[rounds] = types[rng.choice(len(types), size=len(rounds), p=probabilities)]
+
+        frame = pd.DataFrame({
+            'date': pd.to_datetime(date),
+            'name': pd.Categorical.from_codes(
+                startup, _numbered('Startup ', first_startup + np.arange(startups))
+            ),
+            'vertical': _categorical(pairs[:, 0], profile),
+            'subvertical': _categorical(pairs[:, 1], profile),
+            'city': _categorical(cities, city),
+            'investors': self._investors(rows, rng, pool),
+            'type': pd.Categorical(round_type),
+            'amount': self._amounts(round_type, rng)
+        })
+
+        return frame[SYNTHETIC_COLUMNS], startups
+
+
+def _categorical(values, positions):
+    """
+    Builds a categorical column from positions into a small array of values,
+    without materializing one string per row.
+
+    Args:
+        values (numpy.ndarray): The distinct values sampled from, may hold NaN.
+        positions (numpy.ndarray): Position in `values` of every row.
+
+    Returns:
+        pandas.Categorical: The column.
+    """
+    codes, categories = pd.factorize(values)
+
+    return pd.Categorical.from_codes(codes[positions], categories)
+
+
+def _numbered(prefix, numbers):
+    """
+    Formats synthetic names such as `Startup 0000001` from zero based numbers.
+
+    Args:
+        prefix (str): Prefix of the names.
+        numbers (numpy.ndarray): Zero based numbers, any shape.
+
+    Returns:
+        numpy.ndarray: The names, same shape as `numbers`.
+    """
+    return np.char.add(prefix, np.char.zfill((numbers + 1).astype(str), 7))
+
+
+def generate(
+        output_path,
+        rows=DEFAULT_ROWS,
+        chunksize=DEFAULT_CHUNKSIZE,
+        seed=None,
+        model=None,
+        progress=None):
+    """
+    Streams synthetic rounds to a Parquet snapshot or a cleaned CSV file.
+
+    The format follows the extension of `output_path`: `.parquet` writes a
+    snapshot in the schema of `dataset.ingest.SNAPSHOT_SCHEMA`, anything
+    else a CSV file in the schema of the cleaned dataset.
+
+    Args:
+        output_path (str): Path of the file to write.
+        rows (int): Number of rounds to write.
+        chunksize (int): Number of rounds sampled and written at a time.
+        seed (int, optional): Seed of the random generator, for reproducible data.
+        model (FundingModel, optional): The distributions to sample. Defaults
+            to the model learned from the real dataset.
+        progress (callable, optional): Called after every chunk with the rows
+            written and the elapsed seconds.
+
+    Returns:
+        float: Wall time of the generation in seconds.
+    """
+    # Imported here, the snapshot schema pulls in the ingestion module
+    from dataset.ingest import SNAPSHOT_SCHEMA
+
+    start = time.perf_counter()
+    model = model or FundingModel.fit(load())
+    rng = np.random.default_rng(seed)
+    parquet = output_path.endswith('.parquet')
+
+    pool = model.investor_pool(rows, rng)
+
+    writer = pq.ParquetWriter(output_path, SNAPSHOT_SCHEMA) if parquet else None
+    written = startups = 0
+    try:
+        while written < rows:
+            frame, chunk_startups = model.sample(
+                min(chunksize, rows - written), rng, pool, startups
+            )
+            if parquet:
+                writer.write_table(pa.Table.from_pandas(
+                    add_date_parts(frame), schema=SNAPSHOT_SCHEMA, preserve_index=False
+                ))
+            else:
+                frame.to_csv(
+                    output_path,
+                    mode='a' if written else 'w',
+                    header=not written,
+                    index=False,
+                    date_format=DATE_FORMAT
+                )
+
+            written += len(frame)
+            startups += chunk_startups
+            if progress is not None:
+                progress(written, time.perf_counter() - start)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return time.perf_counter() - start
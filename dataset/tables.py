@@ -0,0 +1,142 @@
+"""
+Module: Derived Tables
+
+This module builds normalized tables derived from the startup dataset. They
+are built once per loaded snapshot and cached on it, see `Snapshot.derive`.
+
+Tables:
+- investor deals: one row per (deal, investor) pair, produced with a
+  vectorized split and explode of the comma separated `investors` column.
+- monthly cube: funding pre-aggregated by year, month, vertical, city and type.
+- startup years: funding pre-aggregated by year and startup.
+- investor vocabulary: every investor with their deal count and total amount.
+
+Dependencies:
+- numpy (np)
+- pandas (pd)
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import numpy as np
+import pandas as pd
+
+INVESTOR_SEPARATOR = ','
+
+# Schema of the investor deals table, `deal` is the row position of the
+# deal in the startup dataset
+INVESTOR_DEAL_COLUMNS = [
+    'deal', 'investor', 'date', 'name', 'vertical', 'subvertical',
+    'city', 'type', 'amount', 'year', 'month'
+]
+
+# Schema of the investor vocabulary, `deals` counts distinct deals
+INVESTOR_VOCABULARY_COLUMNS = ['investor', 'deals', 'amount']
+
+CUBE_KEYS = ['year', 'month', 'vertical', 'city', 'type']
+
+# Measures of the monthly cube: `amount` is the summed funding, `count` the
+# number of rounds with a known amount, `rounds` all rounds and `startups`
+# the distinct startups funded in the cell
+CUBE_MEASURES = ['amount', 'count', 'rounds', 'startups']
+
+
+def split_investors(investors):
+    """
+    Splits comma separated investor strings into one stripped name per row.
+
+    Args:
+        investors (pandas.Series): Comma separated investor strings.
+
+    Returns:
+        pandas.Series: Investor names indexed by the row position they came from.
+            Empty names are dropped.
+    """
+    names = pd.Series(np.asarray(investors, dtype=object)).str.split(INVESTOR_SEPARATOR)
+    names = names.explode().str.strip()
+
+    return names[names.notna() & (names != '')]
+
+
+def build_investor_deals(startup):
+    """
+    Builds the long format table with one row per investor on each deal.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        pandas.DataFrame: Table with the `INVESTOR_DEAL_COLUMNS` schema.
+    """
+    investors = split_investors(startup['investors'])
+    positions = investors.index.to_numpy(dtype=np.int64)
+
+    deals = startup.take(positions).reset_index(drop=True)
+    deals['deal'] = positions
+    deals['investor'] = investors.to_numpy()
+
+    return deals[INVESTOR_DEAL_COLUMNS]
+
+
+def build_investor_vocabulary(investor_deals):
+    """
+    Builds the vocabulary of investors with their activity.
+
+    Args:
+        investor_deals (pandas.DataFrame): The investor deals table,
+            see `build_investor_deals`.
+
+    Returns:
+        pandas.DataFrame: Table with the `INVESTOR_VOCABULARY_COLUMNS` schema,
+            sorted by investor name.
+    """
+    vocabulary = investor_deals.groupby('investor').agg(
+        deals=('deal', 'nunique'),
+        amount=('amount', 'sum')
+    )
+
+    return vocabulary.reset_index()[INVESTOR_VOCABULARY_COLUMNS]
+
+
+def build_monthly_cube(startup):
+    """
+    Builds the funding cube keyed by year, month, vertical, city and type.
+
+    Rolling the cube up over any subset of its keys gives the same sums and
+    counts as grouping the startup dataset by that subset. Distinct startup
+    counts do not roll up and are only exact per cell.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        pandas.DataFrame: Table with the `CUBE_KEYS` and `CUBE_MEASURES` columns.
+    """
+    cube = startup.groupby(CUBE_KEYS, dropna=False, observed=True).agg(
+        amount=('amount', 'sum'),
+        count=('amount', 'count'),
+        rounds=('amount', 'size'),
+        startups=('name', 'nunique')
+    )
+
+    return cube.reset_index()
+
+
+def build_startup_years(startup):
+    """
+    Builds the funding table keyed by year and startup.
+
+    Args:
+        startup (pandas.DataFrame): The startup dataset.
+
+    Returns:
+        pandas.DataFrame: Table with `year`, `name`, `amount` (sum) and
+            `max_amount` (largest single round) columns.
+    """
+    startup_years = startup.groupby(['year', 'name'], observed=True).agg(
+        amount=('amount', 'sum'),
+        max_amount=('amount', 'max')
+    )
+
+    return startup_years.reset_index()
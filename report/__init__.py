@@ -0,0 +1,7 @@
+"""
+The `report` package generates the investor and startup reports in batch,
+without the app. See `report.batch` for the output layout and
+`python -m report --help` for the command line.
+"""
+
+from report.batch import ReportResult, generate_reports
@@ -0,0 +1,47 @@
+"""
+Command line entry point of the report package.
+
+Usage:
+    python -m report [OUTPUT_DIR] [--kind investor|startup] [--workers N]
+                     [--batch-size N] [--limit N] [--backend pandas|sqlite]
+
+Writes a JSON and an HTML report for every investor and every startup, and
+an index page linking them, using a pool of worker processes.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import argparse
+
+from dataset.dataset import BACKENDS
+from report.batch import DEFAULT_BATCH_SIZE, KINDS, OUTPUT_DIR, generate_reports
+
+parser = argparse.ArgumentParser(prog='python -m report')
+parser.add_argument('output_dir', nargs='?', default=OUTPUT_DIR)
+parser.add_argument('--kind', action='append', choices=KINDS, help='repeat for several kinds, default all')
+parser.add_argument('--workers', type=int, default=None, help='default: number of CPUs')
+parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+parser.add_argument('--limit', type=int, default=None, help='maximum entities per kind')
+parser.add_argument('--backend', choices=BACKENDS, default=None, help='default: STARTUP_BACKEND, then pandas')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    result = generate_reports(
+        args.output_dir,
+        kinds=tuple(args.kind or KINDS),
+        workers=args.workers,
+        batch_size=args.batch_size,
+        limit=args.limit,
+        backend=args.backend,
+        progress=lambda done, total, seconds: print(
+            f'{done}/{total} reports, {done / seconds:,.0f} reports/s'
+        )
+    )
+    for kind, name in result.failed:
+        print(f'Failed: {kind} {name}')
+    print(
+        f'{result.written} reports written to {result.index_path} '
+        f'in {result.seconds:.2f}s ({result.throughput:,.0f} reports/s)'
+    )
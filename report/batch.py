@@ -0,0 +1,267 @@
+"""
+Module: Batch Report Generation
+
+This module writes the report of every investor and every startup without
+going through the app. The entity names are split into batches which are
+fanned out to a pool of worker processes. Each worker opens the dataset of
+the selected storage backend once (see `dataset.dataset.create_provider`),
+computes the profiles of its batches with `analysis.Investor` and
+`analysis.Startup` and writes a JSON and an HTML file per entity. The
+parent process then writes the index page, linking every report under the
+overall metrics of `analysis.Overall`.
+
+Output layout:
+    OUTPUT_DIR/index.html
+    OUTPUT_DIR/index.json
+    OUTPUT_DIR/investor/<slug>.html, <slug>.json
+    OUTPUT_DIR/startup/<slug>.html, <slug>.json
+
+Usage:
+    python -m report [OUTPUT_DIR] [--workers N] [--batch-size N] [--backend pandas|sqlite]
+
+Dependencies:
+- concurrent.futures
+- json
+- os
+- time
+- analysis (Investor, Overall, Startup)
+- dataset.dataset (create_provider)
+- report.render
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+from analysis import Investor, Overall, Startup
+from dataset.dataset import create_provider
+from report.render import index_page, plain, profile_document, profile_page, slug
+
+OUTPUT_DIR = 'reports'
+DEFAULT_BATCH_SIZE = 64
+KINDS = ('investor', 'startup')
+
+# Analysis objects of a worker process, created once by `_init_worker`
+_worker = {}
+
+
+class ReportResult(NamedTuple):
+    """
+    Outcome of a batch report run.
+
+    Attributes:
+        written (int): Entity reports written.
+        failed (list): Pairs of (kind, name) whose report could not be computed.
+        seconds (float): Wall time of the run.
+        index_path (str): Path of the index page.
+    """
+
+    written: int
+    failed: list
+    seconds: float
+    index_path: str
+
+    @property
+    def throughput(self):
+        """float: Entity reports written per second."""
+        return self.written / self.seconds if self.seconds else 0.0
+
+
+def _analysis(provider):
+    """
+    Returns the analysis object computing the profile of each kind of entity.
+
+    Args:
+        provider (dataset.DatasetProvider): Provider of the dataset snapshot.
+
+    Returns:
+        dict: Kind to an `analysis.Investor` or `analysis.Startup`.
+    """
+    return {'investor': Investor(provider), 'startup': Startup(provider)}
+
+
+def _init_worker(backend):
+    """
+    Opens the dataset once in a worker process.
+
+    Args:
+        backend (str, optional): Storage backend, see `dataset.dataset.create_provider`.
+    """
+    provider = create_provider(backend)
+    provider.get()
+    _worker.update(_analysis(provider))
+
+
+def _write(path, content):
+    """
+    Writes a text file as UTF-8.
+
+    Args:
+        path (str): Path of the file.
+        content (str): The text to write.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content)
+
+
+def write_batch(kind, names, output_dir):
+    """
+    Computes and writes the reports of a batch of entities of one kind.
+
+    Runs in a worker process, see `_init_worker`.
+
+    Args:
+        kind (str): `investor` or `startup`.
+        names (list): Names of the entities.
+        output_dir (str): Root directory of the reports.
+
+    Returns:
+        tuple: List of (name, relative path) pairs of the written HTML
+            reports and list of the names that failed.
+    """
+    analysis = _worker[kind]
+    written, failed = [], []
+
+    for name in names:
+        try:
+            profile = analysis.profile(name)
+        except (IndexError, KeyError, ValueError):
+            failed.append(name)
+            continue
+
+        document = profile_document(kind, profile)
+        path = os.path.join(kind, slug(name))
+        _write(os.path.join(output_dir, path + '.json'), json.dumps(document, ensure_ascii=False))
+        _write(os.path.join(output_dir, path + '.html'), profile_page(document))
+        written.append((name, path.replace(os.sep, '/') + '.html'))
+
+    return written, failed
+
+
+def entity_names(snapshot):
+    """
+    Returns the names of every entity of each kind.
+
+    Args:
+        snapshot (dataset.Snapshot): The dataset snapshot.
+
+    Returns:
+        dict: Kind to the sorted list of names.
+    """
+    return {
+        'investor': snapshot.investor_vocabulary['investor'].tolist(),
+        'startup': snapshot.startup_rounds.index.tolist()
+    }
+
+
+def _batches(names, batch_size):
+    """
+    Splits a list of names into consecutive batches.
+
+    Args:
+        names (list): The names.
+        batch_size (int): Maximum number of names per batch.
+
+    Returns:
+        list: The batches.
+    """
+    return [names[start:start + batch_size] for start in range(0, len(names), batch_size)]
+
+
+def overall_summary(provider):
+    """
+    Returns the overall metrics shown on the index page.
+
+    Args:
+        provider (dataset.DatasetProvider): Provider of the dataset snapshot.
+
+    Returns:
+        dict: Metric label to value.
+    """
+    overall = Overall(provider)
+
+    return {
+        'Total invested amount (In crore ₹)': overall.total_invested_amount(),
+        'Maximum amount infused (In crore ₹)': round(overall.max_amount_infused(), 2),
+        'Average ticket size (In crore ₹)': round(overall.avg_ticket_size(), 2),
+        'Funded startups': overall.total_funded_startup()
+    }
+
+
+def generate_reports(
+        output_dir=OUTPUT_DIR,
+        kinds=KINDS,
+        workers=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        limit=None,
+        backend=None,
+        progress=None):
+    """
+    Writes the report of every entity of the given kinds and the index page.
+
+    Args:
+        output_dir (str): Root directory of the reports, created if missing.
+        kinds (tuple): Kinds of entities to report on, see `KINDS`.
+        workers (int, optional): Number of worker processes. Defaults to the
+            number of CPUs.
+        batch_size (int): Number of entities per task sent to a worker.
+        limit (int, optional): Maximum number of entities per kind, for
+            partial runs.
+        backend (str, optional): `pandas` or `sqlite`. Defaults to the
+            `STARTUP_BACKEND` environment variable, then to pandas.
+        progress (callable, optional): Called after every batch with the
+            reports written so far, the total and the elapsed seconds.
+
+    Returns:
+        ReportResult: Counts, failures, timing and the index path.
+    """
+    start = time.perf_counter()
+    provider = create_provider(backend)
+    names = entity_names(provider.get())
+
+    tasks = []
+    for kind in kinds:
+        os.makedirs(os.path.join(output_dir, kind), exist_ok=True)
+        tasks += [(kind, batch) for batch in _batches(names[kind][:limit], batch_size)]
+    total = sum(len(batch) for _, batch in tasks)
+
+    entries = {kind: [] for kind in kinds}
+    failed = []
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(backend,)) as executor:
+        futures = {
+            executor.submit(write_batch, kind, batch, output_dir): kind
+            for kind, batch in tasks
+        }
+        for future in as_completed(futures):
+            kind = futures[future]
+            written, batch_failed = future.result()
+            entries[kind] += written
+            failed += [(kind, name) for name in batch_failed]
+            if progress is not None:
+                done = sum(len(links) for links in entries.values())
+                progress(done, total, time.perf_counter() - start)
+
+    for links in entries.values():
+        links.sort()
+
+    summary = overall_summary(provider)
+    index_path = os.path.join(output_dir, 'index.html')
+    _write(index_path, index_page(summary, entries))
+    _write(
+        os.path.join(output_dir, 'index.json'),
+        json.dumps({
+            'summary': {label: plain(value) for label, value in summary.items()},
+            'reports': entries
+        }, ensure_ascii=False)
+    )
+
+    written = sum(len(links) for links in entries.values())
+    return ReportResult(written, failed, time.perf_counter() - start, index_path)
@@ -0,0 +1,199 @@
+"""
+Module: Report Rendering
+
+This module turns the profiles of `analysis.Investor` and `analysis.Startup`
+into standalone report files: a JSON document with every field of the
+profile and an HTML page rendering that document as tables.
+
+Dependencies:
+- hashlib
+- html
+- json
+- math
+- re
+- pandas (pd)
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import hashlib
+import html
+import json
+import math
+import re
+
+import pandas as pd
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2rem; }}
+table {{ border-collapse: collapse; margin-bottom: 1rem; }}
+th, td {{ border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: left; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def slug(name):
+    """
+    Returns a file name safe identifier for an entity name.
+
+    A short hash of the exact name is appended, so names differing only in
+    case or punctuation get distinct files.
+
+    Args:
+        name (str): The name of the entity.
+
+    Returns:
+        str: Lower case letters, digits and dashes.
+    """
+    readable = re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-')[:60]
+    digest = hashlib.blake2b(str(name).encode(), digest_size=4).hexdigest()
+
+    return f'{readable}-{digest}' if readable else digest
+
+
+def plain(value):
+    """
+    Converts one profile field to JSON compatible values.
+
+    Args:
+        value (object): A DataFrame, Series, list, numpy or Python scalar.
+
+    Returns:
+        object: Records for DataFrames, a dict for Series, None for missing values.
+    """
+    if isinstance(value, pd.DataFrame):
+        return json.loads(value.to_json(orient='records', date_format='iso'))
+    if isinstance(value, pd.Series):
+        return json.loads(value.to_json(date_format='iso'))
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+
+    return value
+
+
+def profile_document(kind, profile):
+    """
+    Converts a profile to a JSON compatible document.
+
+    Args:
+        kind (str): `investor` or `startup`.
+        profile (typing.NamedTuple): An `InvestorProfile` or `StartupProfile`.
+
+    Returns:
+        dict: `kind` and every field of the profile.
+    """
+    document = {'kind': kind}
+    document.update({field: plain(value) for field, value in profile._asdict().items()})
+
+    return document
+
+
+def _cell(value):
+    """
+    Renders one JSON value as escaped HTML text.
+
+    Args:
+        value (object): A value of a profile document.
+
+    Returns:
+        str: The escaped text, empty for missing values.
+    """
+    return html.escape('' if value is None else str(value))
+
+
+def _section(title, value):
+    """
+    Renders one field of a profile document as HTML.
+
+    Args:
+        title (str): Name of the field.
+        value (object): Value of the field, see `plain`.
+
+    Returns:
+        str: The HTML of the section.
+    """
+    heading = f'<h2>{html.escape(title.replace("_", " ").capitalize())}</h2>'
+
+    if isinstance(value, list) and value and isinstance(value[0], dict):
+        # Records of a DataFrame
+        columns = list(value[0])
+        head = ''.join(f'<th>{html.escape(column)}</th>' for column in columns)
+        rows = ''.join(
+            '<tr>' + ''.join(f'<td>{_cell(record.get(column))}</td>' for column in columns) + '</tr>'
+            for record in value
+        )
+        return heading + f'<table><thead><tr>{head}</tr></thead><tbody>{rows}</tbody></table>'
+    if isinstance(value, list):
+        items = ''.join(f'<li>{_cell(item)}</li>' for item in value)
+        return heading + f'<ul>{items}</ul>'
+
+    return heading + f'<p>{_cell(value)}</p>'
+
+
+def profile_page(document):
+    """
+    Renders a profile document as a standalone HTML page.
+
+    Tables are written directly from the records of the document, which is
+    much cheaper than rendering the DataFrames of the profile again.
+
+    Args:
+        document (dict): A profile document, see `profile_document`.
+
+    Returns:
+        str: The HTML page.
+    """
+    fields = dict(document)
+    kind = fields.pop('kind')
+    name = _cell(fields.pop('name'))
+
+    body = f'<p><a href="../index.html">All reports</a></p><h1>{name}</h1>'
+    body += f'<p>{html.escape(kind.capitalize())} report</p>'
+    body += ''.join(_section(field, value) for field, value in fields.items())
+
+    return PAGE_TEMPLATE.format(title=name, body=body)
+
+
+def index_page(summary, entries):
+    """
+    Renders the index page linking to every report.
+
+    Args:
+        summary (dict): Overall metrics shown at the top, name to value.
+        entries (dict): Kind to a list of (name, relative path) pairs.
+
+    Returns:
+        str: The HTML page.
+    """
+    body = '<h1>Indian startup funding reports</h1><dl>'
+    body += ''.join(
+        f'<dt>{html.escape(label)}</dt><dd>{_cell(plain(value))}</dd>'
+        for label, value in summary.items()
+    )
+    body += '</dl>'
+
+    for kind, links in entries.items():
+        items = ''.join(
+            f'<li><a href="{html.escape(path)}">{html.escape(str(name))}</a></li>'
+            for name, path in links
+        )
+        body += f'<h2>{html.escape(kind.capitalize())}s ({len(links)})</h2><ul>{items}</ul>'
+
+    return PAGE_TEMPLATE.format(title='Indian startup funding reports', body=body)
@@ -0,0 +1,34 @@
+"""
+Shared fixtures of the test suite: a small cleaned dataset written to a
+temporary directory, with its canonical names table.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import pytest
+
+CLEANED_CSV = '''date,name,vertical,subvertical,city,investors,type,amount
+2019-01-05,Alpha,FinTech,Payments,Bengaluru,"Sequoia Capital,  Accel Partners",Series A,10.5
+2019-03-10,Beta,EdTech,Learning,Mumbai,Accel Partners,Seed Funding,2.25
+2020-03-01,Alpha,FinTech,Payments,Bangalore,Sequoia Capital,Series B,40.0
+2020-07-15,Gamma,FinTech,Lending,Mumbai,,Seed Funding,0.0
+2020-07-20,Delta,Health,Clinics,Pune,"Accel Partners India, Tiger Global",Series A,12.75
+'''
+
+CANONICAL_NAMES = '''kind,alias,canonical
+city,Bengaluru,Bangalore
+investor,Accel Partners India,Accel India
+round,Seed Funding,Seed Round
+'''
+
+
+@pytest.fixture
+def dataset_paths(tmp_path):
+    """Returns the CSV, snapshot and canonical names paths of a small dataset."""
+    csv_path = tmp_path / 'startup_cleaned.csv'
+    csv_path.write_text(CLEANED_CSV, encoding='utf-8')
+    canonical_path = tmp_path / 'canonical_names.csv'
+    canonical_path.write_text(CANONICAL_NAMES, encoding='utf-8')
+
+    return str(csv_path), str(tmp_path / 'startup_cleaned.parquet'), str(canonical_path)
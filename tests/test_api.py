@@ -0,0 +1,126 @@
+"""
+Tests of the JSON API server of `api.server`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import threading
+
+import pytest
+
+from api.server import ApiError, ApiServer
+from dataset import DatasetProvider
+
+
+@pytest.fixture
+def server(dataset_paths):
+    """Returns an API server over the small dataset."""
+    return ApiServer(DatasetProvider(*dataset_paths), workers=1)
+
+
+def _respond(server, target, headers=None):
+    return asyncio.run(server.respond(target, headers or {}))
+
+
+def test_index_lists_the_endpoints(server):
+    status, _, body = _respond(server, '/')
+    endpoints = {endpoint['path']: endpoint for endpoint in json.loads(body)['endpoints']}
+
+    assert status == 200
+    assert endpoints['/investor/profile']['required'] == ['investor_name']
+    assert endpoints['/startup/search_startups']['optional'] == ['limit']
+
+
+def test_responses_are_cached(server):
+    status, headers, body = _respond(server, '/startup/funding?startup_name=Alpha')
+    assert status == 200
+    assert json.loads(body) == 50.5
+
+    _, repeat_headers, repeat_body = _respond(server, '/startup/funding?startup_name=Alpha')
+    assert repeat_body == body
+    assert repeat_headers['ETag'] == headers['ETag']
+    assert server.responses.info()['hits'] == 1
+
+
+def test_matching_etag_is_not_modified(server):
+    _, headers, _ = _respond(server, '/overall/total_funded_startup')
+
+    status, _, body = _respond(
+        server, '/overall/total_funded_startup', {'if-none-match': f'"other", {headers["ETag"]}'}
+    )
+    assert status == 304
+    assert body == b''
+
+    status, _, _ = _respond(server, '/overall/total_funded_startup', {'if-none-match': '"other"'})
+    assert status == 200
+
+
+def test_etag_changes_with_the_arguments_and_the_data(server, dataset_paths):
+    _, alpha, _ = _respond(server, '/startup/funding?startup_name=Alpha')
+    _, beta, _ = _respond(server, '/startup/funding?startup_name=Beta')
+    assert alpha['ETag'] != beta['ETag']
+
+    csv_path = dataset_paths[0]
+    later = os.path.getmtime(csv_path) + 10
+    os.utime(csv_path, (later, later))
+
+    status, refreshed, _ = _respond(
+        server, '/startup/funding?startup_name=Alpha', {'if-none-match': alpha['ETag']}
+    )
+    assert status == 200
+    assert refreshed['ETag'] != alpha['ETag']
+
+
+@pytest.mark.parametrize('target, status', [
+    ('/nothing', 404),
+    ('/startup/funding', 400),
+    ('/startup/funding?startup_name=Alpha&year=2020', 400),
+    ('/startup/search_startups?query=al&limit=few', 400),
+    ('/startup/profile?startup_name=Unknown', 404)
+])
+def test_errors(server, target, status):
+    with pytest.raises(ApiError) as error:
+        _respond(server, target)
+
+    assert error.value.status == status
+
+
+def test_http_round_trip(server):
+    ready = threading.Event()
+    address = []
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(server.serve('127.0.0.1', 0, lambda name: (address.append(name), ready.set())))
+
+    def serve():
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    assert ready.wait(10)
+
+    try:
+        connection = http.client.HTTPConnection(*address[0], timeout=10)
+        connection.request('GET', '/investor/investor_list')
+        response = connection.getresponse()
+        assert response.status == 200
+        assert json.loads(response.read())[0] == 'Accel India'
+
+        # The connection is kept alive for the conditional request
+        connection.request('GET', '/investor/investor_list', headers={'If-None-Match': response.getheader('ETag')})
+        response = connection.getresponse()
+        assert response.status == 304
+        assert response.read() == b''
+        connection.close()
+    finally:
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join(10)
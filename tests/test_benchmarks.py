@@ -0,0 +1,53 @@
+"""
+Tests of the benchmark suite of `benchmarks`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+from analysis import Investor
+from benchmarks.scale import scaled_provider, write_scaled
+from benchmarks.suite import compare, measure, public_methods
+from dataset import provider
+
+
+def test_scaled_dataset_has_distinct_copies(tmp_path):
+    scaled = scaled_provider(write_scaled(3, str(tmp_path))).get()
+    original = provider.get()
+
+    assert len(scaled.frame) == 3 * len(original.frame)
+    assert len(scaled.startup_rounds) == 3 * len(original.startup_rounds)
+    assert len(scaled.investor_vocabulary) == 3 * len(original.investor_vocabulary)
+
+
+def test_measure_times_cold_and_warm_runs():
+    calls = []
+    resets = []
+
+    measurement = measure(lambda: calls.append(1), repeat=3, cold=lambda: resets.append(1))
+
+    assert len(calls) == 5
+    assert len(resets) == 4
+    assert set(measurement) == {'seconds', 'min_seconds', 'warm_seconds', 'peak_bytes'}
+    assert measurement['min_seconds'] <= measurement['seconds']
+
+
+def test_public_methods_are_the_memoized_ones():
+    names = [name for name, _ in public_methods(Investor)]
+
+    assert 'profile' in names
+    assert '_investments' not in names
+    assert 'startup' not in names
+
+
+def test_compare_orders_regressions_first():
+    def results(*seconds):
+        return {'results': [
+            {'case': case, 'scale': 1, 'seconds': value, 'peak_bytes': 0}
+            for case, value in zip(('a', 'b', 'c'), seconds)
+        ]}
+
+    comparison = compare(results(1.0, 1.0, 1.0), results(0.5, 3.0, 1.0))
+
+    assert comparison['case'].tolist() == ['b', 'c', 'a']
+    assert comparison['ratio'].tolist() == [3.0, 1.0, 0.5]
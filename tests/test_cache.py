@@ -0,0 +1,102 @@
+"""
+Tests of the analysis cache of `analysis.cache`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import os
+
+import pytest
+
+from analysis.cache import LRUCache, cache_info, clear_caches, memoize
+from dataset import DatasetProvider
+
+
+class _Counter:
+    """Counts the calls of a memoized method."""
+
+    def __init__(self, provider, engine=None):
+        self.provider = provider
+        self.engine = engine
+        self.calls = 0
+
+    @memoize(maxsize=2)
+    def rows(self, start, step=1):
+        self.calls += 1
+        return len(self.provider.get().frame.iloc[start::step])
+
+
+class _Engine:
+    """An execution engine with a name, see `analysis.engine`."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.fixture
+def provider(dataset_paths):
+    """Returns a provider of the small dataset, with empty caches."""
+    clear_caches()
+    return DatasetProvider(*dataset_paths)
+
+
+def test_lru_cache_evicts_the_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.info() == {'hits': 3, 'misses': 1, 'size': 2, 'maxsize': 2}
+
+    cache.clear()
+    assert cache.info() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2}
+
+
+def test_results_are_keyed_on_the_arguments(provider):
+    counter = _Counter(provider)
+
+    assert counter.rows(0) == 5
+    assert counter.rows(0) == 5
+    assert counter.rows(0, step=2) == 3
+    assert counter.rows(0, step=2) == 3
+    assert counter.calls == 2
+
+
+def test_results_are_evicted_beyond_maxsize(provider):
+    counter = _Counter(provider)
+    for start in (0, 1, 2, 0):
+        counter.rows(start)
+
+    assert counter.calls == 4
+    assert cache_info()[_Counter.rows.__qualname__]['size'] == 2
+
+
+def test_instances_of_other_providers_or_engines_do_not_share_results(provider, dataset_paths):
+    counters = [
+        _Counter(provider),
+        _Counter(provider, _Engine('polars')),
+        _Counter(DatasetProvider(*dataset_paths))
+    ]
+    for counter in counters:
+        counter.rows(1)
+
+    assert [counter.calls for counter in counters] == [1, 1, 1]
+
+
+def test_a_data_refresh_invalidates_the_results(provider, dataset_paths):
+    counter = _Counter(provider)
+    assert counter.rows(0) == 5
+
+    csv_path = dataset_paths[0]
+    with open(csv_path, 'a', encoding='utf-8') as file:
+        file.write('2021-01-01,Epsilon,FinTech,Payments,Pune,Tiger Global,Series A,1.0\n')
+    later = os.path.getmtime(csv_path) + 10
+    os.utime(csv_path, (later, later))
+
+    assert counter.rows(0) == 6
+    assert counter.calls == 2
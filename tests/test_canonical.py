@@ -0,0 +1,65 @@
+"""
+Tests of the entity canonicalization of `dataset.canonical`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import pandas as pd
+
+from dataset import DatasetProvider
+from dataset.canonical import canonical_investors, canonicalize, normalize_investors, read_mappings
+from dataset.snapshot import compact, read_csv
+
+
+def test_read_mappings(dataset_paths):
+    assert read_mappings(dataset_paths[2]) == {
+        'city': {'Bengaluru': 'Bangalore'},
+        'investor': {'Accel Partners India': 'Accel India'},
+        'round': {'Seed Funding': 'Seed Round'}
+    }
+    assert read_mappings('missing.csv') == {}
+
+
+def test_normalize_investors():
+    investors = normalize_investors(pd.Series([' A ,B', 'A,, B,', ',', None]))
+
+    assert investors.tolist()[:2] == ['A, B', 'A, B']
+    assert investors.isna().tolist() == [False, False, True, True]
+
+
+def test_canonical_investors_replace_whole_names_only():
+    investors = pd.Index([
+        'Accel', 'Accel, Tiger', 'Tiger, Accel', 'Accel Partners', 'XAccel', 'Tiger, Accel, Sequoia'
+    ])
+
+    assert canonical_investors(investors, {'Accel': 'Accel Partners'}).tolist() == [
+        'Accel Partners', 'Accel Partners, Tiger', 'Tiger, Accel Partners',
+        'Accel Partners', 'XAccel', 'Tiger, Accel Partners, Sequoia'
+    ]
+
+
+def test_canonical_investors_prefer_the_longest_alias():
+    mapping = {'Accel': 'Accel Partners', 'Accel India': 'Accel Partners India'}
+
+    assert canonical_investors(pd.Index(['Accel India, Accel']), mapping).tolist() == [
+        'Accel Partners India, Accel Partners'
+    ]
+
+
+def test_canonicalize_merges_categories(dataset_paths):
+    startup = canonicalize(compact(read_csv(dataset_paths[0])), read_mappings(dataset_paths[2]))
+
+    assert startup['city'].tolist() == ['Bangalore', 'Mumbai', 'Bangalore', 'Mumbai', 'Pune']
+    assert startup['city'].cat.categories.tolist() == ['Bangalore', 'Mumbai', 'Pune']
+    assert startup['type'].cat.categories.tolist() == ['Seed Round', 'Series A', 'Series B']
+    assert startup['investors'].iloc[4] == 'Accel India, Tiger Global'
+    assert pd.isna(startup['investors'].iloc[3])
+
+
+def test_analysis_sees_canonical_names(dataset_paths):
+    snapshot = DatasetProvider(*dataset_paths).get()
+
+    assert snapshot.startup_rows('Alpha')['city'].unique().tolist() == ['Bangalore']
+    assert 'Accel India' in snapshot.investor_index
+    assert 'Accel Partners India' not in snapshot.investor_index
@@ -0,0 +1,75 @@
+"""
+Tests of the shared dataset handle of `dataset.dataset`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from dataset import DatasetProvider, Snapshot
+from dataset.dataset import create_provider
+
+
+@pytest.fixture
+def provider(dataset_paths):
+    """Returns a provider of the small dataset."""
+    return DatasetProvider(*dataset_paths)
+
+
+def test_provider_loads_once(provider):
+    assert provider._snapshot is None
+
+    snapshot = provider.get()
+    assert provider.get() is snapshot
+    assert len(snapshot.frame) == 5
+
+
+def test_provider_reloads_after_the_files_change(provider, dataset_paths):
+    snapshot = provider.get()
+
+    csv_path = dataset_paths[0]
+    with open(csv_path, 'a', encoding='utf-8') as file:
+        file.write('2021-01-01,Epsilon,FinTech,Payments,Pune,Tiger Global,Series A,1.0\n')
+    later = os.path.getmtime(csv_path) + 10
+    os.utime(csv_path, (later, later))
+
+    reloaded = provider.get()
+    assert reloaded is not snapshot
+    assert reloaded.fingerprint != snapshot.fingerprint
+    assert len(reloaded.frame) == 6
+
+
+def test_snapshot_is_read_only(provider):
+    snapshot = provider.get()
+
+    with pytest.raises(AttributeError):
+        snapshot.frame = None
+
+
+def test_derived_structures_are_built_once(provider):
+    snapshot = provider.get()
+    calls = []
+
+    def builder(frame):
+        calls.append(len(frame))
+        return len(frame)
+
+    assert snapshot.derive('size', builder) == 5
+    assert snapshot.derive('size', builder) == 5
+    assert calls == [5]
+
+
+def test_snapshot_fingerprint_defaults_to_the_content():
+    frame = pd.DataFrame({'name': ['Alpha', 'Beta'], 'amount': [1.0, 2.0]})
+
+    assert Snapshot(frame).fingerprint == Snapshot(frame.copy()).fingerprint
+    assert Snapshot(frame).fingerprint != Snapshot(frame.iloc[:1]).fingerprint
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        create_provider('nosql')
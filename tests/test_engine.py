@@ -0,0 +1,58 @@
+"""
+Tests of the execution engines of `analysis.Overall`.
+
+Every public method of `analysis.Overall` must give the same results with
+the Polars engine as with the pandas engine, see `analysis.engine.equivalent`.
+The comparisons are skipped when Polars is not installed.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import pandas as pd
+import pytest
+
+from analysis import Overall
+from analysis.engine import ENGINE_VARIABLE, PandasEngine, equivalent, get_engine
+
+METHODS = sorted(
+    name for name, member in vars(Overall).items()
+    if not name.startswith('_') and hasattr(member, 'cache')
+)
+
+
+@pytest.fixture(scope='module')
+def overall():
+    """Returns an `Overall` per engine, sharing the default dataset provider."""
+    pytest.importorskip('polars')
+    return {name: Overall(engine=get_engine(name)) for name in ('pandas', 'polars')}
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_polars_matches_pandas(overall, method):
+    expected = getattr(overall['pandas'], method)()
+    actual = getattr(overall['polars'], method)()
+
+    assert equivalent(expected, actual)
+
+
+def test_get_engine(monkeypatch):
+    monkeypatch.delenv(ENGINE_VARIABLE, raising=False)
+    assert isinstance(get_engine(), PandasEngine)
+
+    monkeypatch.setenv(ENGINE_VARIABLE, 'PANDAS')
+    assert get_engine().name == 'pandas'
+
+    with pytest.raises(ValueError):
+        get_engine('spark')
+
+
+def test_equivalent_tolerates_rounding_only():
+    frame = pd.DataFrame({'name': ['a', 'b'], 'amount': [1.0, 2.0]})
+
+    assert equivalent(frame, frame.assign(amount=[1.001, 2.0]).set_index(pd.Index([5, 6])))
+    assert not equivalent(frame, frame.assign(amount=[1.5, 2.0]))
+    assert not equivalent(frame, frame.rename(columns={'amount': 'total'}))
+    assert not equivalent(frame, frame.iloc[:1])
+    assert equivalent(10, 10.001)
+    assert not equivalent(10, 11)
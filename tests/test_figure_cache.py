@@ -0,0 +1,55 @@
+"""
+Tests of the Plotly figure cache of `components.figure_cache`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import plotly.graph_objects as go
+
+from components.figure_cache import FigureCache
+
+
+def _builder(calls, title):
+    def build():
+        calls.append(title)
+        return go.Figure(layout={'title': title})
+
+    return build
+
+
+def test_figures_are_built_once_per_key():
+    cache = FigureCache()
+    calls = []
+
+    first = cache.get_or_build(('chart', (), 'v1'), _builder(calls, 'chart'))
+    second = cache.get_or_build(('chart', (), 'v1'), _builder(calls, 'chart'))
+
+    assert second is first
+    assert calls == ['chart']
+    assert cache.info()['hits'] == 1
+    assert cache.info()['misses'] == 1
+
+
+def test_a_new_fingerprint_builds_a_new_figure():
+    cache = FigureCache()
+    calls = []
+
+    cache.get_or_build(('chart', (), 'v1'), _builder(calls, 'old'))
+    figure = cache.get_or_build(('chart', (), 'v2'), _builder(calls, 'new'))
+
+    assert calls == ['old', 'new']
+    assert figure.layout.title.text == 'new'
+
+
+def test_the_least_recently_used_figure_is_evicted():
+    cache = FigureCache(maxsize=2)
+    calls = []
+    for title in ('a', 'b', 'a', 'c', 'b'):
+        cache.get_or_build((title,), _builder(calls, title))
+
+    assert calls == ['a', 'b', 'c', 'b']
+    assert cache.info()['size'] == 2
+
+    cache.clear()
+    assert cache.info()['size'] == 0
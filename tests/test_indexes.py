@@ -0,0 +1,70 @@
+"""
+Tests of the investor and startup name indexes of `dataset.indexes`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import pandas as pd
+import pytest
+
+from analysis import Investor, Startup
+from dataset import DatasetProvider
+from dataset.indexes import build_investor_index
+from dataset.tables import build_investor_deals
+
+
+@pytest.fixture
+def snapshot(dataset_paths):
+    """Returns the snapshot of the small dataset."""
+    return DatasetProvider(*dataset_paths).get()
+
+
+def test_investor_index_matches_whole_names():
+    startup = pd.DataFrame({
+        'investors': ['Accel Partners', 'Accel Partners India, Tiger Global', 'Tiger Global'],
+        'amount': [1.0, 2.0, 3.0]
+    })
+    startup = startup.reindex(columns=['date', 'name', 'vertical', 'subvertical', 'city',
+                                       'investors', 'type', 'amount', 'year', 'month'])
+    index = build_investor_index(build_investor_deals(startup))
+
+    # The substring match of the original implementation also found the
+    # deals of Accel Partners India
+    assert startup['investors'].str.contains('Accel Partners').tolist() == [True, True, False]
+    assert index['Accel Partners'].tolist() == [0]
+    assert index['Accel Partners India'].tolist() == [1]
+    assert index['Tiger Global'].tolist() == [1, 2]
+
+
+def test_investor_rows(snapshot):
+    assert snapshot.investor_rows('Accel Partners')['name'].tolist() == ['Alpha', 'Beta']
+    assert snapshot.investor_rows('Sequoia Capital')['amount'].tolist() == [10.5, 40.0]
+    assert snapshot.investor_rows('Accel').empty
+    assert snapshot.investor_rows('Unknown').empty
+
+
+def test_investor_methods_use_the_index(dataset_paths):
+    investor = Investor(DatasetProvider(*dataset_paths))
+
+    biggest = investor.biggest_investment(' Sequoia Capital ')
+    assert biggest.set_index('name')['amount'].to_dict() == {'Alpha': 50.5}
+    assert investor.invested_city('Accel Partners').set_index('city')['amount'].to_dict() == {
+        'Bangalore': 10.5, 'Mumbai': 2.25
+    }
+
+def test_name_index(snapshot):
+    assert snapshot.name_index['Alpha'].tolist() == [0, 2]
+    assert snapshot.startup_rows('Alpha')['type'].tolist() == ['Series A', 'Series B']
+    assert snapshot.startup_rows('Unknown').empty
+
+
+def test_startup_methods_use_the_name_index(dataset_paths):
+    startup = Startup(DatasetProvider(*dataset_paths))
+
+    assert startup.funding('Alpha') == 50.5
+    assert startup.stage('Alpha') == 'Series A'
+    assert startup.location('Alpha') == 'Bangalore'
+    assert startup.rounds('Unknown').empty
+    with pytest.raises(IndexError):
+        startup.first_round('Unknown')
@@ -0,0 +1,101 @@
+"""
+Tests of the raw funding ingestion of `dataset.ingest`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from dataset.ingest import (
+    CLEANED_COLUMNS, USD_TO_INR, clean, ingest, ingest_stream, parse_amount, parse_date, read_raw
+)
+from dataset.snapshot import STRING_COLUMNS, add_date_parts, read_csv
+
+RAW_CSV = '''Sr No,Date dd/mm/yyyy,Startup Name,Industry Vertical,SubVertical,City  Location,Investors Name,InvestmentnType,Amount in USD,Remarks
+1,09/01/2020,Alpha,FinTech,Payments,Bengaluru,"Sequoia Capital,Accel Partners",Series A,"10,00,000",
+2,05/072018,Beta,EdTech,Learning,Mumbai,Accel Partners,Seed Funding,undisclosed,
+3,12.05.2015,Gamma,FinTech,Lending,Mumbai, Tiger Global ,Seed Funding,"2,50,000",
+4,bad date,Delta,Health,Clinics,Pune,Tiger Global,Series A,"1,000",
+5,01/07/015,Epsilon,Health,Clinics,Pune,,Series A,"1,000",
+'''
+
+
+@pytest.fixture
+def raw_path(tmp_path):
+    """Returns the path of a small raw export."""
+    path = tmp_path / 'startup_funding.csv'
+    # The export starts with a byte order mark
+    path.write_text(RAW_CSV, encoding='utf-8-sig')
+
+    return str(path)
+
+
+def test_parse_date_repairs_known_typos():
+    dates = parse_date(pd.Series(['09/01/2020', '05/072018', '12.05.2015', '22/01//2015', '01/07/015', 'bad']))
+
+    assert dates.dt.strftime('%Y-%m-%d').tolist()[:5] == [
+        '2020-01-09', '2018-07-05', '2015-05-12', '2015-01-22', '2015-07-01'
+    ]
+    assert pd.isna(dates.iloc[5])
+
+
+def test_parse_amount_converts_to_crore_rupees():
+    amounts = parse_amount(pd.Series(['20,00,00,000', '14342000+', 'undisclosed', 'N/A', None, 'abc']))
+
+    assert amounts.iloc[0] == pytest.approx(20 * USD_TO_INR)
+    assert amounts.iloc[1] == pytest.approx(14342000 * USD_TO_INR / 10_000_000)
+    assert amounts.iloc[2:5].tolist() == [0.0, 0.0, 0.0]
+    assert pd.isna(amounts.iloc[5])
+
+
+def test_clean_drops_incomplete_rows(raw_path):
+    startup = clean(read_raw(raw_path))
+
+    assert startup.columns.tolist() == CLEANED_COLUMNS
+    assert startup['name'].tolist() == ['Alpha', 'Beta', 'Gamma']
+    assert startup['investors'].tolist() == [
+        'Sequoia Capital, Accel Partners', 'Accel Partners', 'Tiger Global'
+    ]
+    assert startup['amount'].iloc[1] == 0.0
+
+
+def test_ingest_writes_a_cleaned_csv(raw_path, tmp_path):
+    csv_path = str(tmp_path / 'startup_ingested.csv')
+
+    assert ingest(raw_path, csv_path) == 3
+
+    startup = read_csv(csv_path)
+    assert startup['date'].dt.strftime('%Y-%m-%d').tolist() == ['2020-01-09', '2018-07-05', '2015-05-12']
+    assert startup['year'].tolist() == [2020, 2018, 2015]
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 100])
+def test_ingest_stream_matches_ingest(raw_path, tmp_path, chunksize):
+    snapshot_path = str(tmp_path / 'startup_ingested.parquet')
+    progress = []
+
+    result = ingest_stream(raw_path, snapshot_path, chunksize, lambda *counts: progress.append(counts))
+
+    assert (result.rows_read, result.rows_written) == (5, 3)
+    assert len(progress) == -(-5 // chunksize)
+    assert not os.path.exists(snapshot_path + '.tmp')
+
+    expected = add_date_parts(clean(read_raw(raw_path)))
+    streamed = pd.read_parquet(snapshot_path).astype({column: object for column in STRING_COLUMNS})
+    pd.testing.assert_frame_equal(
+        streamed, expected.astype({column: object for column in STRING_COLUMNS}), check_dtype=False
+    )
+
+
+def test_ingest_stream_aggregates(raw_path, tmp_path):
+    result = ingest_stream(raw_path, str(tmp_path / 'startup_ingested.parquet'), chunksize=2)
+
+    assert result.monthly[['year', 'month', 'count']].values.tolist() == [[2015, 5, 1], [2018, 7, 1], [2020, 1, 1]]
+    assert result.investors.set_index('investor')['deals'].to_dict() == {
+        'Accel Partners': 2, 'Sequoia Capital': 1, 'Tiger Global': 1
+    }
+    assert result.investors['amount'].sum() == pytest.approx(2 * 8.284 + 2.071)
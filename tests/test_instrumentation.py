@@ -0,0 +1,85 @@
+"""
+Tests of the spans recorded by `analysis.instrumentation`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import pandas as pd
+import pytest
+
+from analysis import Startup, instrumentation
+from analysis.instrumentation import finish_run, start_run, summarize, timed
+
+
+@pytest.fixture
+def enabled():
+    """Turns instrumentation on for one test."""
+    instrumentation.enable()
+    yield
+    instrumentation.enable(False)
+
+
+@timed()
+def _frame(rows):
+    return pd.DataFrame({'value': range(rows)})
+
+
+@timed()
+def _outer():
+    return [_frame(3), _frame(4)]
+
+
+def test_off_records_nothing():
+    assert start_run('page') is None
+    assert _frame(2).shape == (2, 1)
+
+
+def test_spans_nest_and_count_result_rows(enabled):
+    run = start_run('page')
+    _outer()
+    finish_run(run)
+
+    spans = [(span.name.rsplit('.', 1)[-1], span.depth, span.rows) for span in run.spans]
+    assert spans == [('_frame', 1, 3), ('_frame', 1, 4), ('_outer', 0, 2)]
+
+
+def test_memoized_method_records_cache_and_rows_once(enabled):
+    startup = Startup()
+    name = startup.list_of_startups()[0]
+
+    run = start_run('page')
+    startup.rounds(name)
+    startup.rounds(name)
+    finish_run(run)
+
+    rounds = [span for span in run.spans if span.name.endswith('Startup.rounds')]
+    assert len(rounds) == 2
+    assert {span.rows for span in rounds} == {len(startup.rounds(name))}
+    assert rounds[1].cache == 'hit'
+
+
+def test_summarize(enabled):
+    run = start_run('page')
+    _frame(2)
+    _frame(5)
+    finish_run(run)
+
+    total, = summarize(run.spans)
+    assert total['calls'] == 2
+    assert total['rows'] == 7
+    assert total['hits'] == total['misses'] == 0
+
+
+def test_runs_are_appended_to_the_log(enabled, tmp_path, monkeypatch):
+    log_path = tmp_path / 'runs.jsonl'
+    monkeypatch.setenv(instrumentation.LOG_VARIABLE, str(log_path))
+
+    for label in ('first', 'second'):
+        run = start_run(label)
+        _frame(1)
+        finish_run(run)
+
+    runs = instrumentation.read_runs(log_path)
+    assert [run['label'] for run in runs] == ['first', 'second']
+    assert runs[0]['spans'][0]['rows'] == 1
@@ -0,0 +1,89 @@
+"""
+Tests of the startup and investor profiles of `analysis`.
+
+Every field of a profile must match the method of `analysis.Startup` or
+`analysis.Investor` that returns it on its own.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import pandas as pd
+import pytest
+
+from analysis import Investor, Startup
+from analysis.investor import _amount_by
+
+
+@pytest.fixture(scope='module')
+def startup():
+    """Returns a `Startup` on the default dataset provider."""
+    return Startup()
+
+
+@pytest.fixture(scope='module')
+def investor():
+    """Returns an `Investor` on the default dataset provider."""
+    return Investor()
+
+
+@pytest.fixture(scope='module')
+def startup_names(startup):
+    """Returns a few startups, some of them with several rounds."""
+    names = startup.list_of_startups()
+    counts = startup.startup['name'].value_counts()
+
+    return list(names[:3]) + list(counts.index[:3])
+
+
+def _same(expected, actual):
+    return expected == actual or (pd.isna(expected) and pd.isna(actual))
+
+
+def test_startup_profile_matches_methods(startup, startup_names):
+    for name in startup_names:
+        profile = startup.profile(name)
+
+        assert profile.sector == startup.sector(name)
+        assert profile.subsector == startup.subsector(name)
+        assert profile.city == startup.location(name)
+        assert profile.stage == startup.stage(name)
+        assert profile.funding == startup.funding(name)
+        assert profile.similar_startups == startup.similar_startups(name)
+
+
+def test_startup_profile_shows_first_round_investors(startup, startup_names):
+    for name in startup_names:
+        profile = startup.profile(name)
+
+        assert _same(startup.investors(name), profile.first_investors)
+        assert _same(profile.rounds.iloc[0]['investors'], profile.first_investors)
+
+
+def test_unknown_startup_raises(startup):
+    with pytest.raises(IndexError):
+        startup.profile('No such startup')
+
+
+def test_investor_profile_matches_methods(investor):
+    for name in investor.investor_list()[:5]:
+        profile = investor.profile(name)
+
+        assert profile.recent_investments.equals(investor.recent_five_investments(name))
+        assert profile.biggest_investments.equals(investor.biggest_investment(name))
+        assert profile.sectors.equals(investor.invested_sector(name))
+        assert profile.cities.equals(investor.invested_city(name))
+        assert profile.similar_investors == investor.get_similar_investors(name)
+
+
+def test_investor_breakdowns_match_one_groupby_per_column(investor):
+    vocabulary = investor.provider.get().investor_vocabulary
+    investments = investor._investments(vocabulary.loc[vocabulary['deals'].idxmax(), 'investor'])
+    columns = ['name', 'vertical', 'city', 'type', 'year']
+    amount_by = _amount_by(investments, columns)
+
+    for column in columns:
+        expected = investments.groupby(column, observed=True)['amount'].sum()
+        pd.testing.assert_series_equal(
+            amount_by[column], expected, check_names=False, check_index_type=False
+        )
@@ -0,0 +1,53 @@
+"""
+Tests of the batch report generator of `report`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+from report.batch import generate_reports
+from report.render import plain, profile_page, slug
+
+
+def test_slug_is_safe_and_distinct():
+    assert slug('Sequoia Capital').startswith('sequoia-capital-')
+    assert slug('Sequoia Capital') != slug('sequoia capital')
+    assert slug('../..').isalnum()
+
+
+def test_plain_values():
+    frame = pd.DataFrame({'date': pd.to_datetime(['2020-01-09']), 'amount': [1.5]})
+
+    assert plain(frame) == [{'date': '2020-01-09T00:00:00.000', 'amount': 1.5}]
+    assert plain(np.int64(3)) == 3
+    assert plain(math.nan) is None
+    assert plain(['a', np.float32(0.5)]) == ['a', 0.5]
+
+
+def test_profile_page_escapes_names():
+    page = profile_page({'kind': 'startup', 'name': '<script>alert(1)</script>'})
+
+    assert '<script>alert' not in page
+    assert '&lt;script&gt;' in page
+
+
+def test_generate_reports(tmp_path):
+    result = generate_reports(str(tmp_path), workers=2, batch_size=2, limit=3)
+
+    assert result.written == 6
+    assert result.failed == []
+
+    index = json.loads((tmp_path / 'index.json').read_text(encoding='utf-8'))
+    assert set(index['reports']) == {'investor', 'startup'}
+    for kind, links in index['reports'].items():
+        assert len(links) == 3
+        for name, path in links:
+            assert (tmp_path / path).exists()
+            document = json.loads((tmp_path / path).with_suffix('.json').read_text(encoding='utf-8'))
+            assert (document['kind'], document['name']) == (kind, name)
@@ -0,0 +1,81 @@
+"""
+Tests of the name search of `analysis.search`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import pytest
+
+from analysis import Investor, Startup
+from analysis.search import SearchIndex, fold, trigrams
+
+
+@pytest.fixture
+def index():
+    """Returns a small index, `Sequoia India` being the most active name."""
+    return SearchIndex(
+        ['Sequoia Capital', 'Sequoia India', 'Accel Partners', 'SAIF Partners', 'Tiger Global'],
+        [3, 9, 5, 1, 2]
+    )
+
+
+def test_fold_ignores_case_and_spaces():
+    assert fold('  Sequoia   CAPITAL ') == 'sequoia capital'
+
+
+def test_trigrams_are_padded():
+    assert trigrams('ab') == {'  a', ' ab', 'ab '}
+
+
+def test_prefix_matches_most_active_first(index):
+    assert index.prefix('seq') == ['Sequoia India', 'Sequoia Capital']
+    assert index.prefix('SEQUOIA C') == ['Sequoia Capital']
+    assert index.prefix('xyz') == []
+
+
+def test_fuzzy_tolerates_typos(index):
+    assert index.fuzzy('tiger globel')[0] == 'Tiger Global'
+    assert index.fuzzy('acel partners')[0] == 'Accel Partners'
+
+
+def test_prefix_matches_come_before_fuzzy_matches(index):
+    assert index.search('saif') == ['SAIF Partners']
+    assert index.search('sequoia i') == ['Sequoia India', 'Sequoia Capital']
+    assert index.search('sequoia capitol')[0] == 'Sequoia Capital'
+
+
+def test_empty_query_returns_most_active(index):
+    assert index.search('', limit=2) == ['Sequoia India', 'Accel Partners']
+
+
+def test_limit(index):
+    assert len(index.search('a', limit=1)) == 1
+
+
+def test_empty_index():
+    index = SearchIndex([])
+
+    assert len(index) == 0
+    assert index.search('') == []
+    assert index.search('seq') == []
+
+
+def test_postings_match_trigrams(index):
+    for position, text in enumerate(index._folded):
+        grams = trigrams(text)
+
+        assert index._trigram_counts[position] == len(grams)
+        for positions in index._postings(grams):
+            assert position in positions
+
+
+def test_search_investors_tolerates_typos():
+    assert 'Flipkart' in Investor().search_investors('flipkrat')
+
+
+def test_search_startups_by_prefix():
+    startup = Startup()
+    name = startup.list_of_startups()[0]
+
+    assert name in startup.search_startups(name[:4], limit=50)
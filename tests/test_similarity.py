@@ -0,0 +1,115 @@
+"""
+Tests of the similarity indexes of `analysis.similarity`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import numpy as np
+import pandas as pd
+
+from analysis import Startup
+from analysis.similarity import SimilarityIndex, build_startup_similarity
+from dataset import provider
+
+
+def _tokens(pairs):
+    return pd.DataFrame(pairs, columns=['entity', 'feature'])
+
+
+def test_most_similar_first():
+    index = SimilarityIndex.from_tokens(_tokens([
+        ('a', 'city=Mumbai'), ('a', 'vertical=FinTech'),
+        ('b', 'city=Mumbai'), ('b', 'vertical=FinTech'),
+        ('c', 'city=Mumbai'), ('c', 'vertical=EdTech'),
+        ('d', 'city=Pune'), ('d', 'vertical=Health')
+    ]))
+
+    assert index.similar('a') == ['b', 'c']
+
+
+def test_never_returns_itself_or_unrelated_entities():
+    index = SimilarityIndex.from_tokens(_tokens([
+        ('a', 'city=Mumbai'), ('b', 'city=Mumbai'), ('c', 'city=Pune')
+    ]))
+
+    assert index.similar('a') == ['b']
+    assert index.similar('c') == []
+    assert index.similar('unknown') == []
+
+
+def test_ties_break_by_key():
+    index = SimilarityIndex.from_tokens(_tokens([
+        ('a', 'city=Mumbai'), ('d', 'city=Mumbai'), ('c', 'city=Mumbai'), ('b', 'city=Mumbai')
+    ]))
+
+    assert index.similar('a', k=2) == ['b', 'c']
+
+
+def test_candidates_filter_neighbours():
+    index = SimilarityIndex.from_tokens(
+        _tokens([('a', 'city=Mumbai'), ('b', 'city=Mumbai'), ('Undisclosed', 'city=Mumbai')]),
+        candidates=lambda keys: keys != 'Undisclosed'
+    )
+
+    assert index.similar('a') == ['b']
+
+
+def test_missing_entities_and_features_are_ignored():
+    index = SimilarityIndex.from_tokens(_tokens([
+        ('a', 'city=Mumbai'), (np.nan, 'city=Mumbai'), ('b', 'city=Mumbai'),
+        ('b', None), (None, 'vertical=FinTech')
+    ]))
+
+    assert list(index.keys) == ['a', 'b']
+    assert index.similar('a') == ['b']
+
+
+def test_startup_similarity_skips_rounds_without_name_or_city():
+    startup = pd.DataFrame({
+        'name': ['Ola', 'Uber', np.nan, 'Zomato'],
+        'vertical': ['Transport', 'Transport', 'Transport', np.nan],
+        'subvertical': ['Cab aggregator', 'Cab aggregator', 'Cab booking', np.nan],
+        'city': ['Bangalore', np.nan, 'Mumbai', 'Gurgaon'],
+        'type': ['Series A', 'Series A', 'Seed', 'Series B'],
+        'amount': [10.0, 12.0, 1.0, np.nan]
+    })
+
+    index = build_startup_similarity(startup)
+
+    assert list(index.keys) == ['Ola', 'Uber', 'Zomato']
+    assert index.similar('Ola')[0] == 'Uber'
+
+
+def test_neighbour_table_lists_every_neighbour_in_rank_order():
+    index = SimilarityIndex.from_tokens(_tokens([
+        ('a', 'city=Mumbai'), ('a', 'vertical=FinTech'),
+        ('b', 'city=Mumbai'), ('b', 'vertical=FinTech'),
+        ('c', 'city=Mumbai')
+    ]))
+
+    table = index.neighbour_table()
+
+    for key in index.keys:
+        rows = table[table['name'] == key]
+        assert rows['rank'].tolist() == list(range(len(rows)))
+        assert rows['neighbour'].tolist() == index.similar(key)
+
+
+def test_precomputed_neighbours_match_on_demand_scores():
+    snapshot = provider.get()
+    index = build_startup_similarity(snapshot.frame)
+    assert index._neighbours is not None
+
+    for key in index.keys[::max(1, len(index.keys) // 25)]:
+        on_demand = index.similar(key, k=index.k + 1)[:index.k]
+        assert index.similar(key) == on_demand
+
+
+def test_similar_startups_never_include_the_startup():
+    startup = Startup()
+
+    for name in startup.list_of_startups()[:25]:
+        similar = startup.similar_startups(name)
+        assert name not in similar
+        assert len(similar) == len(set(similar))
@@ -0,0 +1,113 @@
+"""
+Tests of the Parquet snapshot of `dataset.snapshot`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from dataset.snapshot import (
+    STRING_COLUMNS, build_snapshot, compact, is_fresh, load, read_csv, read_snapshot, source_fingerprint
+)
+
+
+def test_read_csv_derives_dates_and_normalizes_investors(dataset_paths):
+    startup = read_csv(dataset_paths[0])
+
+    assert pd.api.types.is_datetime64_any_dtype(startup['date'])
+    assert startup['year'].tolist() == [2019, 2019, 2020, 2020, 2020]
+    assert startup['month'].tolist() == [1, 3, 3, 7, 7]
+    assert startup['investors'].iloc[0] == 'Sequoia Capital, Accel Partners'
+    assert pd.isna(startup['investors'].iloc[3])
+
+
+def test_snapshot_round_trip(dataset_paths):
+    csv_path, snapshot_path, _ = dataset_paths
+    build_snapshot(csv_path, snapshot_path)
+
+    expected = read_csv(csv_path)
+    actual = read_snapshot(snapshot_path)
+
+    for column in STRING_COLUMNS:
+        assert isinstance(actual[column].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(
+        actual.astype({column: object for column in STRING_COLUMNS}),
+        expected.astype({column: object for column in STRING_COLUMNS}),
+        check_dtype=False
+    )
+    assert not os.path.exists(snapshot_path + '.tmp')
+
+
+def test_snapshot_is_used_only_when_fresh(dataset_paths):
+    csv_path, snapshot_path, _ = dataset_paths
+    assert not is_fresh(csv_path, snapshot_path)
+
+    build_snapshot(csv_path, snapshot_path)
+    assert is_fresh(csv_path, snapshot_path)
+
+    later = os.path.getmtime(snapshot_path) + 10
+    os.utime(csv_path, (later, later))
+    assert not is_fresh(csv_path, snapshot_path)
+
+
+def test_load_gives_the_same_data_from_either_source(dataset_paths):
+    csv_path, snapshot_path, canonical_path = dataset_paths
+    from_csv = load(csv_path, snapshot_path, canonical_path)
+
+    build_snapshot(csv_path, snapshot_path)
+    from_snapshot = load(csv_path, snapshot_path, canonical_path)
+
+    pd.testing.assert_frame_equal(from_snapshot, from_csv)
+
+
+def test_fingerprint_changes_with_the_files(dataset_paths):
+    before = source_fingerprint(*dataset_paths)
+    build_snapshot(*dataset_paths[:2])
+
+    assert source_fingerprint(*dataset_paths) != before
+
+
+def test_compact_uses_categories_and_small_numbers(dataset_paths):
+    startup = compact(read_csv(dataset_paths[0]))
+
+    for column in STRING_COLUMNS:
+        categories = startup[column].cat.categories
+        assert categories.is_monotonic_increasing
+    assert startup['year'].dtype == np.int16
+    assert startup['month'].dtype == np.int8
+    assert startup['amount'].dtype == np.float32
+
+
+def test_compact_keeps_lossy_floats_and_large_integers():
+    startup = pd.DataFrame({
+        **{column: ['a', 'b'] for column in STRING_COLUMNS},
+        'year': [2015, 2020], 'month': [1, 100_000], 'amount': [0.1, 2.0]
+    })
+    startup = compact(startup)
+
+    assert startup['month'].dtype == np.int32
+    assert startup['amount'].dtype == np.float64
+    assert startup['amount'].tolist() == [0.1, 2.0]
+
+
+def test_load_reports_the_memory_saved_on_either_source(dataset_paths, caplog):
+    csv_path, snapshot_path, canonical_path = dataset_paths
+    totals = []
+    with caplog.at_level(logging.INFO, logger='dataset.snapshot'):
+        load(csv_path, snapshot_path, canonical_path)
+        build_snapshot(csv_path, snapshot_path)
+        load(csv_path, snapshot_path, canonical_path)
+
+    for record in caplog.records:
+        before, after = record.getMessage().rsplit('total ', 1)[1].split(' -> ')
+        totals.append((int(before), int(after)))
+
+    assert len(totals) == 2
+    # The snapshot is compared with the strings it was built from
+    assert totals[0][0] == totals[1][0]
+    assert all(after < before for before, after in totals)
@@ -0,0 +1,77 @@
+"""
+Tests of the SQLite storage backend of `dataset.store`.
+
+Every public method of `analysis.Overall`, `analysis.Investor` and
+`analysis.Startup` must give the same results from the SQLite file as from
+the in-memory dataset.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from analysis import Investor, Overall, Startup
+from analysis.engine import equivalent
+from analysis.similarity import neighbour_tables
+from benchmarks.suite import _arguments, public_methods, sample_arguments
+from dataset import provider as pandas_provider
+from dataset.dataset import SQLITE_PATH_VARIABLE, create_provider
+from dataset.store import SqliteProvider, build_database
+
+CASES = [
+    (cls, name)
+    for cls in (Overall, Investor, Startup)
+    for name, _ in public_methods(cls)
+]
+
+
+@pytest.fixture(scope='module')
+def sqlite_path(tmp_path_factory):
+    """Returns the path of the SQLite file of the shipped dataset."""
+    path = str(tmp_path_factory.mktemp('store') / 'startup_cleaned.sqlite')
+
+    return build_database(path, neighbours=neighbour_tables)
+
+
+def _same(left, right):
+    if hasattr(left, '_asdict'):
+        return all(_same(left[field], right[field]) for field in range(len(left)))
+    if isinstance(left, pd.Series):
+        return equivalent(left.reset_index(), right.reset_index())
+    if isinstance(left, float) and math.isnan(left):
+        return isinstance(right, float) and math.isnan(right)
+
+    return equivalent(left, right)
+
+
+@pytest.mark.parametrize('cls, name', CASES, ids=[f'{cls.__name__}.{name}' for cls, name in CASES])
+def test_sqlite_matches_pandas(sqlite_path, cls, name):
+    arguments = _arguments(getattr(cls, name), sample_arguments(pandas_provider))
+
+    expected = getattr(cls(pandas_provider), name)(*arguments)
+    actual = getattr(cls(SqliteProvider(sqlite_path)), name)(*arguments)
+
+    assert _same(expected, actual)
+
+
+def test_create_provider_reads_the_sqlite_file(sqlite_path, monkeypatch):
+    monkeypatch.setenv(SQLITE_PATH_VARIABLE, sqlite_path)
+    provider = create_provider('sqlite')
+
+    assert isinstance(provider, SqliteProvider)
+    for name in Startup(pandas_provider).list_of_startups()[:20]:
+        assert _same(Startup(pandas_provider).profile(name), Startup(provider).profile(name))
+
+
+def test_similarity_tables_are_used(sqlite_path):
+    snapshot = SqliteProvider(sqlite_path).get()
+
+    def builder(frame):
+        raise AssertionError('The index must not be rebuilt from the SQLite file')
+
+    name = Startup(pandas_provider).list_of_startups()[0]
+    assert snapshot.similar('startup', name, builder) == Startup(pandas_provider).similar_startups(name)
@@ -0,0 +1,64 @@
+"""
+Tests of the synthetic funding data generator of `dataset.synthetic`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataset import provider
+from dataset.snapshot import load
+from dataset.synthetic import SYNTHETIC_COLUMNS, FundingModel, generate
+from dataset.tables import split_investors
+
+
+@pytest.fixture(scope='module')
+def model():
+    """Learns the model from the dataset with the investors of some deals removed."""
+    startup = provider.get().frame.copy()
+    startup['investors'] = startup['investors'].astype(object)
+    startup.loc[startup.index[::5], 'investors'] = np.nan
+
+    return FundingModel.fit(startup)
+
+
+def _sample(model, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return model.sample(rows, rng, model.investor_pool(rows, rng))[0]
+
+
+def test_sample_has_the_cleaned_schema(model):
+    rounds = _sample(model, 1000)
+
+    assert list(rounds.columns) == SYNTHETIC_COLUMNS
+    assert len(rounds) == 1000
+    assert rounds.groupby('name', observed=True)['date'].apply(lambda dates: dates.is_monotonic_increasing).all()
+
+
+def test_sample_is_reproducible(model):
+    pd.testing.assert_frame_equal(_sample(model, 500, seed=3), _sample(model, 500, seed=3))
+
+
+def test_deals_without_investors_are_missing_not_empty(model):
+    investors = _sample(model, 2000)['investors']
+
+    assert investors.isna().any()
+    assert not (investors == '').any()
+
+
+@pytest.mark.parametrize('extension', ['.csv', '.parquet'])
+def test_generated_file_loads_without_empty_investors(model, tmp_path, extension):
+    path = str(tmp_path / ('synthetic' + extension))
+    generate(path, rows=1500, chunksize=500, seed=1, model=model)
+
+    if extension == '.csv':
+        startup = load(path, str(tmp_path / 'missing.parquet'))
+    else:
+        startup = load(str(tmp_path / 'missing.csv'), path)
+
+    assert len(startup) == 1500
+    assert startup['investors'].isna().any()
+    assert not (split_investors(startup['investors']) == '').any()
@@ -0,0 +1,130 @@
+"""
+Tests of the derived tables of `dataset.tables`.
+
+Author: Bibek kumar panda
+Github: https://github.com/Bibek-9078
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import Investor, Overall
+from analysis.investor import ORDER_BY_ACTIVITY
+from dataset import DatasetProvider
+from dataset import provider as default_provider
+from dataset.tables import (
+    CUBE_KEYS, CUBE_MEASURES, INVESTOR_DEAL_COLUMNS, INVESTOR_VOCABULARY_COLUMNS,
+    build_investor_deals, build_investor_vocabulary, build_monthly_cube, split_investors
+)
+
+
+@pytest.fixture
+def provider(dataset_paths):
+    """Returns a provider of the small dataset."""
+    return DatasetProvider(*dataset_paths)
+
+
+@pytest.fixture
+def startup(provider):
+    """Returns the small dataset as loaded by the provider."""
+    return provider.get().frame
+
+
+def test_split_investors_drops_empty_names():
+    investors = split_investors(pd.Series(['A, B', None, ' C ,', '']))
+
+    assert investors.tolist() == ['A', 'B', 'C']
+    assert investors.index.tolist() == [0, 0, 2]
+
+
+def test_investor_deals_has_one_row_per_investor_and_deal(startup):
+    deals = build_investor_deals(startup)
+
+    assert deals.columns.tolist() == INVESTOR_DEAL_COLUMNS
+    assert list(zip(deals['deal'], deals['investor'])) == [
+        (0, 'Sequoia Capital'), (0, 'Accel Partners'),
+        (1, 'Accel Partners'),
+        (2, 'Sequoia Capital'),
+        (4, 'Accel India'), (4, 'Tiger Global')
+    ]
+    assert deals['name'].tolist() == startup['name'].take(deals['deal']).tolist()
+    assert deals['amount'].tolist() == startup['amount'].take(deals['deal']).tolist()
+
+
+def test_top_investors_sum_every_deal_of_an_investor(provider):
+    top_investors = Overall(provider).top_investors()
+
+    assert top_investors.columns.tolist() == ['investors', 'amount']
+    assert top_investors['investors'].iloc[0] == 'Sequoia Capital'
+    assert dict(zip(top_investors['investors'], top_investors['amount'])) == {
+        'Sequoia Capital': 50.5, 'Accel Partners': 12.75,
+        'Accel India': 12.75, 'Tiger Global': 12.75
+    }
+
+
+@pytest.mark.parametrize('keys', [['year', 'month'], ['vertical'], ['city'], ['type'], ['year', 'city']])
+def test_monthly_cube_rolls_up_like_the_dataset(keys):
+    snapshot = default_provider.get()
+    cube = snapshot.monthly_cube
+    startup = snapshot.frame
+
+    rolled_up = cube.groupby(keys, observed=True)[['amount', 'count', 'rounds']].sum()
+    expected = startup.groupby(keys, observed=True)['amount'].agg(['sum', 'count', 'size'])
+
+    np.testing.assert_allclose(rolled_up['amount'], expected['sum'])
+    assert rolled_up['count'].tolist() == expected['count'].tolist()
+    assert rolled_up['rounds'].tolist() == expected['size'].tolist()
+
+
+def test_monthly_cube_keeps_every_round(startup):
+    cube = build_monthly_cube(startup)
+
+    assert cube.columns.tolist() == CUBE_KEYS + CUBE_MEASURES
+    assert cube['rounds'].sum() == len(startup)
+    assert cube['amount'].sum() == startup['amount'].sum()
+
+
+def test_overall_metrics_from_the_cube(provider):
+    overall = Overall(provider)
+
+    assert overall.total_invested_amount() == round(65.5)
+    assert overall.max_amount_infused() == 40.0
+    assert overall.total_funded_startup() == 4
+    assert overall.avg_ticket_size() == pytest.approx(65.5 / 4)
+    assert overall.total_funding_mom()['MM-YYYY'].tolist() == ['1-2019', '3-2019', '3-2020', '7-2020']
+    assert overall.most_funded_sector().set_index('vertical')['amount'].to_dict() == {
+        'FinTech': 50.5, 'Health': 12.75, 'EdTech': 2.25
+    }
+    assert overall.most_funded_cities()['city'].iloc[0] == 'Bangalore'
+
+
+def test_investor_vocabulary_counts_distinct_deals(startup):
+    deals = build_investor_deals(startup)
+    # An investor listed twice on a deal counts once
+    deals = pd.concat([deals, deals.iloc[[0]]], ignore_index=True)
+
+    vocabulary = build_investor_vocabulary(deals)
+
+    assert vocabulary.columns.tolist() == INVESTOR_VOCABULARY_COLUMNS
+    assert list(zip(vocabulary['investor'], vocabulary['deals'])) == [
+        ('Accel India', 1), ('Accel Partners', 2), ('Sequoia Capital', 2), ('Tiger Global', 1)
+    ]
+
+
+def test_investor_list_orders(provider):
+    investor = Investor(provider)
+
+    assert investor.investor_list() == ['Accel India', 'Accel Partners', 'Sequoia Capital', 'Tiger Global']
+    assert investor.investor_list(ORDER_BY_ACTIVITY) == [
+        'Sequoia Capital', 'Accel Partners', 'Accel India', 'Tiger Global'
+    ]
+    with pytest.raises(ValueError):
+        investor.investor_list('size')
+
+
+def test_investor_list_matches_the_unique_investors_of_the_dataset():
+    startup = default_provider.get().frame
+    expected = sorted(split_investors(startup['investors']).unique())
+
+    assert Investor().investor_list() == expected